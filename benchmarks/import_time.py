@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Meet de import-kosten van de render-core versus de volledige GUI (``-X importtime``).
+
+Elke meting draait in een vers subprocess, zoals een pool-worker of server-fork dat
+ook doet. Gebruik:
+
+    python benchmarks/import_time.py [-n 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CASES = [
+    ("render-core (wlk.core)", "import wlk.core"),
+    ("launcher (logo_designer)", "import logo_designer"),
+    ("GUI (wlk.gui)", "import wlk.gui"),
+    # De import-set van logo_designer.py v0.8.2, waar alles top-level geladen werd.
+    ("oud: alles top-level", "import tkinter, tkinter.ttk, tkinter.colorchooser, tkinter.filedialog, "
+                             "tkinter.messagebox, webbrowser, urllib.request, wlk.core"),
+]
+
+
+def _importtime_us(stmt):
+    """Som van de cumulatieve top-level importtijden (µs) volgens ``-X importtime``."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", stmt], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # alleen top-level imports, geneste zitten al in cumulative
+            total += int(cumulative)
+    return total
+
+
+def _wall_ms(stmt):
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", stmt], cwd=ROOT, check=True)
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--runs", type=int, default=7, help="aantal metingen per geval (mediaan)")
+    args = parser.parse_args()
+
+    base_wall = statistics.median(_wall_ms("pass") for _ in range(args.runs))
+    results = []
+    for label, stmt in CASES:
+        imp = statistics.median(_importtime_us(stmt) for _ in range(args.runs)) / 1000
+        wall = statistics.median(_wall_ms(stmt) for _ in range(args.runs)) - base_wall
+        results.append((label, imp, wall))
+
+    ref = results[-1][1] or 1.0
+    print("%-28s %12s %14s %8s" % ("geval", "import (ms)", "start +ms", "vs oud"))
+    for label, imp, wall in results:
+        print("%-28s %12.1f %14.1f %7.0f%%" % (label, imp, wall, 100 * imp / ref))
+    print("(kale interpreter-start: %.1f ms)" % base_wall)
+
+
+if __name__ == "__main__":
+    main()
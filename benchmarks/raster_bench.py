@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark van de pure-Python rasterizer: alle varianten op de preset "Groot / print".
+
+    python benchmarks/raster_bench.py [-n 3] [--budget-ms 1000] [--out map]
+
+Exit-code 1 als een variant (mediaan) boven het budget komt.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wlk.core import ALL_VARIANTS, DIMENSION_PRESETS, BrandConfig  # noqa: E402
+from wlk.raster import svg_to_png  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rasterizer-benchmark per variant")
+    parser.add_argument("-n", "--runs", type=int, default=3)
+    parser.add_argument("--preset", default="Groot / print")
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    parser.add_argument("--out", help="schrijf de PNG's naar deze map")
+    args = parser.parse_args()
+
+    _, w, h, fs = next(p for p in DIMENSION_PRESETS if p[0] == args.preset)
+    cfg = BrandConfig(out_width=w, out_height=h, fs_main=fs)
+    out = Path(args.out) if args.out else None
+    if out:
+        out.mkdir(parents=True, exist_ok=True)
+
+    print("preset %s (%dx%d), %d runs" % (args.preset, w, h, args.runs))
+    print("%-18s %10s %10s" % ("variant", "ms (med)", "PNG bytes"))
+    worst = 0.0
+    total = 0.0
+    for fn in ALL_VARIANTS:
+        _, svg = fn(cfg)
+        times = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            png = svg_to_png(svg)
+            times.append((time.perf_counter() - t0) * 1000)
+        med = statistics.median(times)
+        worst = max(worst, med)
+        total += med
+        if out:
+            (out / (fn.__name__ + ".png")).write_bytes(png)
+        print("%-18s %10.1f %10d" % (fn.__name__, med, len(png)))
+    print("totaal %.1f ms, traagste %.1f ms (budget %.0f ms)" % (total, worst, args.budget_ms))
+    return 1 if worst > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Load-test voor de render-service (``logo_designer.py serve``).
+
+    python benchmarks/server_load.py [-n 5000] [-c 8] [--configs 50] [--gzip] [--revalidate 0.3]
+    python benchmarks/server_load.py --url http://127.0.0.1:8765   # tegen een draaiende server
+
+Zonder ``--url`` start het script zelf een server in een apart proces op een vrije poort.
+Elke client-thread houdt één keep-alive verbinding open en vraagt willekeurige
+(variant, config)-combinaties op uit een vaste set van ``--configs`` merken, zodat de
+verhouding cache-hit/miss instelbaar is. Met ``--revalidate`` stuurt die fractie van de
+verzoeken een ``If-None-Match`` met een eerder ontvangen ETag (verwacht: 304).
+Rapporteert req/s, latency-percentielen en de verdeling van statuscodes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import random
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from wlk.core import ALL_VARIANTS  # noqa: E402
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def _paths(n_configs, seed=1):
+    rnd = random.Random(seed)
+    configs = [urlencode({"left": "MERK" + str(i), "right": "KONING", "out_width": rnd.choice((400, 800, 1200, 2400)),
+                          "fs_main": rnd.randint(40, 140)}) for i in range(n_configs)]
+    return ["/logo/" + fn.__name__ + ".svg?" + q for q in configs for fn in ALL_VARIANTS]
+
+
+def _start_server():
+    proc = subprocess.Popen([sys.executable, str(ROOT / "logo_designer.py"), "serve", "--port", "0"],
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    line = proc.stdout.readline()
+    if "http://" not in line:
+        proc.kill()
+        raise RuntimeError("server start mislukt: " + line)
+    return proc, line.split("http://", 1)[1].split("/", 1)[0]
+
+
+def _worker(host, port, paths, n, gzip_, revalidate, seed, out, lock):
+    rnd = random.Random(seed)
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    etags = {}
+    lat = []
+    statuses = {}
+    nbytes = 0
+    for _ in range(n):
+        path = rnd.choice(paths)
+        headers = {"Accept-Encoding": "gzip"} if gzip_ else {}
+        if path in etags and rnd.random() < revalidate:
+            headers["If-None-Match"] = etags[path]
+        t0 = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            statuses["fout"] = statuses.get("fout", 0) + 1
+            continue
+        lat.append((time.perf_counter() - t0) * 1000.0)
+        statuses[resp.status] = statuses.get(resp.status, 0) + 1
+        nbytes += len(body)
+        if resp.getheader("ETag"):
+            etags[path] = resp.getheader("ETag")
+    conn.close()
+    with lock:
+        out["lat"].extend(lat)
+        out["bytes"] += nbytes
+        for k, v in statuses.items():
+            out["status"][k] = out["status"].get(k, 0) + v
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test voor de render-service")
+    parser.add_argument("--url", help="basis-URL van een draaiende server (standaard: zelf starten)")
+    parser.add_argument("-n", "--requests", type=int, default=5000, help="totaal aantal verzoeken")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="aantal client-threads")
+    parser.add_argument("--configs", type=int, default=50, help="aantal verschillende merken")
+    parser.add_argument("--gzip", action="store_true", help="stuur Accept-Encoding: gzip")
+    parser.add_argument("--revalidate", type=float, default=0.0, help="fractie met If-None-Match (0-1)")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        netloc = urlsplit(args.url).netloc
+    else:
+        proc, netloc = _start_server()
+    host, _, port = netloc.partition(":")
+    port = int(port or 80)
+    paths = _paths(args.configs)
+    out = {"lat": [], "bytes": 0, "status": {}}
+    lock = threading.Lock()
+    per = max(1, args.requests // args.concurrency)
+    threads = [threading.Thread(target=_worker, args=(host, port, paths, per, args.gzip, args.revalidate,
+                                                      i, out, lock))
+               for i in range(args.concurrency)]
+    try:
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        seconds = time.perf_counter() - t0
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+    lat = out["lat"]
+    print("%d verzoeken, %d threads, %d verschillende URL's, gzip=%s, revalidate=%.2f"
+          % (len(lat), args.concurrency, len(paths), args.gzip, args.revalidate))
+    print("%.0f req/s  %.1f MB/s" % (len(lat) / seconds, out["bytes"] / seconds / 1e6))
+    print("latency ms: p50 %.2f  p90 %.2f  p95 %.2f  p99 %.2f  max %.2f"
+          % (percentile(lat, 50), percentile(lat, 90), percentile(lat, 95), percentile(lat, 99),
+             max(lat) if lat else 0.0))
+    print("status: " + ", ".join(str(k) + "=" + str(v) for k, v in sorted(out["status"].items(), key=str)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
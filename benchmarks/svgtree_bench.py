@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Render-tijd en piekgeheugen voor een batch van N configs x alle varianten, naast dezelfde
+batch met de oude string-code.
+
+    python benchmarks/svgtree_bench.py [-n 5000] [--baseline REV | --no-baseline]
+
+``string``: ``fn(c)`` levert de volledige SVG-tekst, die naar een bestand geschreven wordt.
+``stream``: ``fn.build(c)`` levert een elementboom die direct naar het bestand
+gestreamd wordt, zonder het document als één string op te bouwen.
+``bouwen``: alleen ``fn.build(c)``; het verschil met ``string`` is de serializer.
+
+De baseline is ``wlk/`` uit git-revisie REV (standaard de laatste revisie vóór
+``wlk/svgtree.py``, waarin de varianten de SVG nog als string aan elkaar plakten); die wordt
+met ``git archive`` in een tijdelijke map uitgepakt. Elke meting draait in een vers proces.
+Tijd en piekgeheugen (``tracemalloc``) komen uit aparte runs over dezelfde N configs; een
+eerste render vooraf houdt het eenmalig laden van fonts en modules buiten beide metingen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _configs(BrandConfig, n):
+    for i in range(n):
+        yield BrandConfig(left="MERK" + str(i), right="KONING", out_width=400 + (i * 37) % 2000,
+                          out_height=80 + i % 270, fs_main=40 + i % 180)
+
+
+def run(root, n, mode, trace=False):
+    """Eén meting met ``wlk`` uit ``root``: (seconden, piek in bytes, aantal renders)."""
+    sys.path.insert(0, str(root))
+    from wlk.core import ALL_VARIANTS, BrandConfig
+    if mode == "stream":
+        from wlk.svgtree import write
+    for fn in ALL_VARIANTS:
+        fn(BrandConfig())
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        if trace:
+            tracemalloc.start()
+        t0 = time.perf_counter()
+        for cfg in _configs(BrandConfig, n):
+            for fn in ALL_VARIANTS:
+                if mode == "stream":
+                    _, root_el = fn.build(cfg)
+                    write(root_el, sink)
+                elif mode == "bouwen":
+                    fn.build(cfg)
+                else:
+                    _, svg = fn(cfg)
+                    sink.write(svg)
+        seconds = time.perf_counter() - t0
+        peak = 0
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return seconds, peak, n * len(ALL_VARIANTS)
+
+
+def _measure(root, n, mode, trace):
+    cmd = [sys.executable, __file__, "--worker", str(root), "-n", str(n), "--mode", mode]
+    if trace:
+        cmd.append("--trace")
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def _baseline_rev():
+    """Ouder van de commit die ``wlk/svgtree.py`` toevoegde."""
+    out = subprocess.run(["git", "log", "--diff-filter=A", "--format=%H", "--", "wlk/svgtree.py"],
+                         cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+    return out[-1][:7] + "^" if out else None
+
+
+def _checkout(rev, dest):
+    data = subprocess.run(["git", "archive", "--format=tar", rev, "wlk"], cwd=ROOT,
+                          capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        tar.extractall(dest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-benchmark: elementboom tegenover de oude string-code")
+    parser.add_argument("-n", "--configs", type=int, default=5000)
+    parser.add_argument("--baseline", metavar="REV", help="git-revisie voor de oude code (standaard: vóór svgtree)")
+    parser.add_argument("--no-baseline", action="store_true", help="alleen de huidige code meten")
+    parser.add_argument("--mode", choices=["string", "stream", "bouwen"], default="string", help=argparse.SUPPRESS)
+    parser.add_argument("--worker", metavar="ROOT", help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        seconds, peak, renders = run(args.worker, args.configs, args.mode, args.trace)
+        print(json.dumps({"seconds": seconds, "peak": peak, "renders": renders}))
+        return 0
+
+    cases = [("nu", ROOT, mode) for mode in ("string", "stream", "bouwen")]
+    with tempfile.TemporaryDirectory(prefix="wlk_baseline_") as tmp:
+        if not args.no_baseline:
+            rev = args.baseline or _baseline_rev()
+            if rev is None:
+                print("geen baseline: wlk/svgtree.py niet in de git-geschiedenis", file=sys.stderr)
+            else:
+                _checkout(rev, tmp)
+                cases.insert(0, ("oud (" + rev + ")", tmp, "string"))
+        print("%d configs x alle varianten; tijd en piekgeheugen (tracemalloc) in aparte runs" % args.configs)
+        base = None
+        for label, root, mode in cases:
+            timed = _measure(root, args.configs, mode, trace=False)
+            traced = _measure(root, args.configs, mode, trace=True)
+            seconds = timed["seconds"]
+            base = base or seconds
+            print("%-16s %-7s %8.2f s  %7.2fx  %9.1f renders/s  piek %8.1f KB"
+                  % (label, mode, seconds, seconds / base, timed["renders"] / seconds, traced["peak"] / 1024))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
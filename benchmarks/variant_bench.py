@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Render-benchmark per variant over alle DIMENSION_PRESETS plus een paar stress-configs.
+
+    python benchmarks/variant_bench.py [--repeat 15] [--save nieuw.json] [--baseline basis.json]
+
+Per (case, variant): mediaan en p95 van de render-tijd van ``fn(cfg)`` (elke meting wordt
+zo vaak herhaald dat die minstens 5 ms duurt), het aantal bytes van de SVG en het aantal
+elementen in de boom. ``--save`` schrijft de resultaten als JSON; met ``--baseline`` worden
+ze vergeleken met een eerder bewaarde run. Een variant telt als regressie als de som van
+zijn medianen over alle cases meer dan ``--threshold`` (standaard 20%) steeg; losse cases
+schommelen daarvoor te veel (``-v`` toont ze toch). Bij een regressie is de exitcode 1,
+zodat het script ook in CI kan draaien.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wlk import APP_VERSION  # noqa: E402
+from wlk.core import ALL_VARIANTS, DIMENSION_PRESETS, BrandConfig  # noqa: E402
+from wlk.svgtree import El  # noqa: E402
+
+# Verschillen onder deze grens (ms) zijn meetruis en tellen nooit als regressie.
+NOISE_MS = 0.02
+# Elke meting herhaalt de render tot hij minstens zo lang duurt (zoals ``timeit``).
+MIN_SAMPLE_S = 0.005
+
+
+def cases():
+    """(naam, BrandConfig) voor elk preset en de stress-configs."""
+    out = []
+    for name, w, h, fs in DIMENSION_PRESETS:
+        out.append((name, BrandConfig(out_width=w, out_height=h, fs_main=fs)))
+    out.append(("stress: zeer breed", BrandConfig(out_width=20000, out_height=300, fs_main=120)))
+    out.append(("stress: zeer hoog", BrandConfig(out_width=600, out_height=4000, fs_main=96)))
+    out.append(("stress: lange merknaam", BrandConfig(left="LANGEMERKNAAM" * 12, right="KONINGRIJK" * 12,
+                                                       tagline="Een hele lange tagline " * 10, letter_spacing=2.5)))
+    out.append(("stress: breed + instancing", BrandConfig(out_width=20000, out_height=300, fs_main=120,
+                                                           instancing=True)))
+    return out
+
+
+def count_elements(el):
+    n = 1
+    for c in el.children:
+        if c.__class__ is El:
+            n += count_elements(c)
+    return n
+
+
+def percentile(values, p):
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def _loops(fn, cfg):
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn(cfg)
+        if time.perf_counter() - t0 >= MIN_SAMPLE_S:
+            return loops
+        loops *= 2
+
+
+def measure(fn, cfg, repeat):
+    loops = _loops(fn, cfg)  # warmt meteen fonts en template-cache op
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            _, svg = fn(cfg)
+        times.append((time.perf_counter() - t0) * 1000.0 / loops)
+    _, root = fn.build(cfg)
+    return {"median_ms": round(statistics.median(times), 4), "p95_ms": round(percentile(times, 95), 4),
+            "bytes": len(svg.encode("utf-8")), "elements": count_elements(root)}
+
+
+def run(repeat, pattern=""):
+    results = {}
+    for case, cfg in cases():
+        if pattern and pattern.lower() not in case.lower():
+            continue
+        for fn in ALL_VARIANTS:
+            results[case + " | " + fn.__name__] = measure(fn, cfg, repeat)
+    return {"meta": {"app_version": APP_VERSION, "python": platform.python_version(),
+                     "machine": platform.machine(), "repeat": repeat,
+                     "date": time.strftime("%Y-%m-%d %H:%M:%S")},
+            "results": results}
+
+
+def _by_variant(results):
+    out = {}
+    for key, r in results.items():
+        out.setdefault(key.split(" | ", 1)[1], {})[key] = r
+    return out
+
+
+def compare(current, baseline, threshold):
+    """(variant-regressies, case-regressies) als lijsten van (naam, oud ms, nieuw ms).
+
+    Alleen cases die in beide runs voorkomen tellen mee.
+    """
+    base = baseline.get("results", {})
+    variants = []
+    for name, rows in sorted(_by_variant(current["results"]).items()):
+        keys = [k for k in rows if k in base]
+        if not keys:
+            continue
+        old = sum(base[k]["median_ms"] for k in keys)
+        new = sum(rows[k]["median_ms"] for k in keys)
+        if new > old * (1.0 + threshold) and new - old > NOISE_MS:
+            variants.append((name, old, new))
+    cases_ = []
+    for key, r in current["results"].items():
+        if key in base:
+            old, new = base[key]["median_ms"], r["median_ms"]
+            if new > old * (1.0 + threshold) and new - old > NOISE_MS:
+                cases_.append((key, old, new))
+    return variants, cases_
+
+
+def report(data):
+    rows = data["results"]
+    by_variant = {name: list(rs.values()) for name, rs in _by_variant(rows).items()}
+    print("%-34s %10s %10s %10s %9s" % ("variant (over alle cases)", "mediaan ms", "p95 ms", "max bytes", "max el."))
+    for name, rs in sorted(by_variant.items(), key=lambda kv: -sum(r["median_ms"] for r in kv[1])):
+        print("%-34s %10.3f %10.3f %10d %9d"
+              % (name[:34], statistics.median(r["median_ms"] for r in rs), max(r["p95_ms"] for r in rs),
+                 max(r["bytes"] for r in rs), max(r["elements"] for r in rs)))
+    total = sum(r["median_ms"] for r in rows.values())
+    print("%d metingen, som van de medianen %.1f ms" % (len(rows), total))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render-benchmark per variant en preset")
+    parser.add_argument("--repeat", type=int, default=15, help="renders per meting (standaard: 15)")
+    parser.add_argument("--case", default="", help="alleen cases waarvan de naam dit bevat")
+    parser.add_argument("--save", metavar="JSON", help="bewaar de resultaten als JSON")
+    parser.add_argument("--baseline", metavar="JSON", help="vergelijk met een eerder bewaarde run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="toegestane vertraging (standaard: 0.2)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="toon ook trager geworden losse cases")
+    args = parser.parse_args()
+
+    data = run(max(1, args.repeat), args.case)
+    report(data)
+    if args.save:
+        Path(args.save).write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+        print("Opgeslagen: " + args.save)
+    if not args.baseline:
+        return 0
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    regressions, slow_cases = compare(data, baseline, args.threshold)
+    for name, old, new in regressions:
+        print("REGRESSIE %-34s %8.3f -> %8.3f ms (%+.0f%%, som over de cases)"
+              % (name[:34], old, new, 100.0 * (new / old - 1.0)))
+    if args.verbose:
+        for key, old, new in slow_cases:
+            print("  trager  %-60s %8.3f -> %8.3f ms" % (key[:60], old, new))
+    base = baseline.get("results", {})
+    changed = [k for k, r in data["results"].items()
+               if k in base and (r["bytes"], r["elements"]) != (base[k]["bytes"], base[k]["elements"])]
+    if changed:
+        print(str(len(changed)) + " metingen met andere uitvoer (bytes/elementen) dan de baseline")
+    print(("%d regressies" % len(regressions)) if regressions else "Geen regressies t.o.v. " + args.baseline)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Gedeelde pytest-instellingen: ``wlk`` importeerbaar vanuit de repo-root, plus de font-fixtures."""
+
+import glob
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def clean_fonts(monkeypatch, tmp_path):
+    """Geen vastgezette, gecachete of gevonden fonts: elke test kiest zijn fonts zelf."""
+    from wlk import fonts
+    monkeypatch.setattr(fonts, "_FONTS", {})
+    monkeypatch.setattr(fonts, "_PINNED", {})
+    monkeypatch.setenv("WLK_FONT_DIR", str(tmp_path / "leeg"))
+    monkeypatch.delenv("WLK_FONT_FILE", raising=False)
+    monkeypatch.delenv("WLK_TAG_FONT_FILE", raising=False)
+
+
+@pytest.fixture
+def system_ttf():
+    """Pad van een TrueType-font van het systeem om mee te testen (overslaan als er geen is)."""
+    found = sorted(glob.glob("/usr/share/fonts/**/*.ttf", recursive=True))
+    if not found:
+        pytest.skip("geen TrueType-font op dit systeem")
+    return found[0]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""RenderCache (LRU, gelezen velden, threads), cache-sleutels en DiskCache."""
+
+import threading
+from dataclasses import replace
+
+from wlk.cache import DiskCache, RenderCache, cache_key, render_tracked
+from wlk.core import BrandConfig
+
+
+def make_variant(calls):
+    def v_test(c):
+        calls.append(c.left)
+        return ("T", "<svg>" + c.left + c.tld + "</svg>")
+    return v_test
+
+
+def test_render_tracked_reports_fields_read():
+    result, read = render_tracked(make_variant([]), BrandConfig(left="A"))
+    assert result == ("T", "<svg>A.COM</svg>")
+    assert read == ("left", "tld")
+
+
+def test_hit_and_miss_counts():
+    calls = []
+    fn = make_variant(calls)
+    cache = RenderCache()
+    cfg = BrandConfig()
+    assert cache.render(fn, cfg) == cache.render(fn, replace(cfg))
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_bytes():
+    cache = RenderCache(max_bytes=10_000)
+    results = [("x", "y" * 2000) for _ in range(8)]
+    for i, result in enumerate(results):
+        cache.put(("k", i), result)
+    st = cache.stats()
+    assert st["bytes"] <= 10_000
+    assert st["evictions"] == 8 - st["entries"]
+    assert ("k", 7) in cache._entries and ("k", 0) not in cache._entries
+
+
+def test_oversized_result_is_not_cached():
+    cache = RenderCache(max_bytes=100)
+    cache.put("k", ("x", "y" * 1000))
+    assert len(cache) == 0
+
+
+def test_render_incremental_skips_when_read_fields_unchanged():
+    calls = []
+    fn = make_variant(calls)
+    cache = RenderCache()
+    cfg = BrandConfig(left="A")
+    assert cache.render_incremental(fn, cfg)[1] is False
+    assert cache.render_incremental(fn, replace(cfg, color_red="#000000"))[1] is True  # niet gelezen veld
+    result, skipped = cache.render_incremental(fn, replace(cfg, left="B"))
+    assert skipped is False and result[1] == "<svg>B.COM</svg>"
+    assert cache.fields_read(fn) == ("left", "tld")
+
+
+def test_render_incremental_from_threads():
+    calls = []
+    fn = make_variant(calls)
+    cache = RenderCache()
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(200):
+                left = "L" + str((n + i) % 3)
+                result, _ = cache.render_incremental(fn, BrandConfig(left=left))
+                assert result[1] == "<svg>" + left + ".COM</svg>"
+        except Exception as e:  # pragma: no cover - alleen bij een race
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def test_cache_key_covers_config_extra_and_plugin_stamp():
+    fn = make_variant([])
+    cfg = BrandConfig()
+    base = cache_key(fn, cfg)
+    assert cache_key(fn, replace(cfg)) == base
+    assert cache_key(fn, replace(cfg, letter_spacing=1.5)) != base
+    assert cache_key(fn, cfg, "optimize=1") != base
+    fn.stamp = "abc"
+    assert cache_key(fn, cfg) != base
+
+
+def test_disk_cache_round_trip_and_evict(tmp_path):
+    disk = DiskCache(tmp_path, max_bytes=4000)
+    disk.put("ab" + "0" * 62, "Label", "<svg/>", ("left",))
+    assert disk.get("ab" + "0" * 62) == ("Label", "<svg/>", ("left",))
+    assert disk.get("cd" + "0" * 62) is None
+    for i in range(10):
+        disk.put(format(i, "02x") + "1" * 62, "L", "x" * 1000)
+    assert disk._scan_bytes() <= 4000
+    assert disk.stats()["evictions"] > 0
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Opdrachtregel: een ongeldige invoerrij geeft een melding en exitcode 2, geen traceback."""
+
+import pytest
+
+import logo_designer
+
+
+@pytest.mark.parametrize("command", [["batch"], ["optimize"], ["season", "--year", "2025"]])
+def test_bad_row_is_reported_without_traceback(command, tmp_path, capsys):
+    bad = tmp_path / "bad.csv"
+    bad.write_text("left,right,fs_main\nA,B,notanumber\n", encoding="utf-8")
+    argv = command + [str(bad)] + (["-o", str(tmp_path / "uit")] if command[0] != "optimize" else [])
+    assert logo_designer.main(argv) == 2
+    err = capsys.readouterr().err
+    assert "bad.csv rij 1" in err and "fs_main" in err
+    assert "Traceback" not in err
+
+
+def test_bad_row_in_profile_import_saves_nothing(tmp_path, capsys):
+    bad = tmp_path / "bad.csv"
+    bad.write_text("left,right,fs_main\nGoed,Merk,80\nA,B,notanumber\n", encoding="utf-8")
+    db = str(tmp_path / "p.db")
+    assert logo_designer.main(["profiles", "import", str(bad), "--db", db]) == 2
+    assert "bad.csv rij 2" in capsys.readouterr().err
+    from wlk.profiles import ProfileDB
+    with ProfileDB(db) as profiles:
+        assert len(profiles) == 0
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""``config_from_dict``: typen komen uit de annotaties van BrandConfig."""
+
+import pytest
+
+from wlk.core import BrandConfig, config_from_dict
+from wlk.settings import apply_fields
+
+
+def test_float_field_keeps_fraction():
+    assert config_from_dict({"letter_spacing": "2.5"}).letter_spacing == 2.5
+    assert config_from_dict({"tld_scale": 0.5}).tld_scale == 0.5
+
+
+def test_int_field_accepts_float_text():
+    cfg = config_from_dict({"fs_main": "80.0", "out_width": 640})
+    assert cfg.fs_main == 80 and isinstance(cfg.fs_main, int)
+    assert cfg.out_width == 640
+
+
+@pytest.mark.parametrize("text, value", [("1", True), ("ja", True), ("Yes", True), ("0", False), ("nee", False)])
+def test_bool_strings(text, value):
+    assert config_from_dict({"instancing": text}).instancing is value
+
+
+def test_empty_and_unknown_fields_are_skipped():
+    cfg = config_from_dict({"left": "", "bogus": "x", "tld": None})
+    assert cfg == BrandConfig()
+
+
+@pytest.mark.parametrize("field, value", [("fs_main", "groot"), ("instancing", "misschien"), ("tld_scale", "x")])
+def test_invalid_value_raises(field, value):
+    with pytest.raises(ValueError, match=field):
+        config_from_dict({field: value})
+
+
+def test_settings_apply_fields_keeps_float():
+    cfg = BrandConfig()
+    assert apply_fields(cfg, {"letter_spacing": 1.5, "tagline": ""}) == []
+    assert cfg.letter_spacing == 1.5
+    assert cfg.tagline == ""
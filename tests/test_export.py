@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Incrementele export: overslaan, herschrijven, opruimen, afbreken en deterministische zips."""
+
+import hashlib
+import os
+import zipfile
+
+import pytest
+
+from wlk import export
+from wlk.export import MANIFEST_NAME, export_files, load_manifest, zip_dir
+
+ITEMS = [("a.svg", "<svg>a</svg>"), ("sub/b.svg", "<svg>b</svg>"), ("c.png", b"\x89PNG-c")]
+
+
+def tmp_files(root):
+    return [p for p in root.rglob("*") if p.name.endswith(".tmp")]
+
+
+def assert_manifest_matches_disk(out):
+    for rel, (digest, size, mtime_ns) in load_manifest(out).items():
+        data = (out / rel).read_bytes()
+        assert hashlib.sha256(data).hexdigest() == digest, rel
+        assert os.stat(out / rel).st_size == size
+
+
+def test_unchanged_files_are_skipped(tmp_path):
+    first = export_files(tmp_path, ITEMS, workers=2)
+    assert (first.written, first.skipped) == (3, 0)
+    stamps = {p: os.stat(p).st_mtime_ns for p in tmp_path.rglob("*.*") if p.name != MANIFEST_NAME}
+    second = export_files(tmp_path, ITEMS, workers=2)
+    assert (second.written, second.skipped) == (0, 3)
+    assert {p: os.stat(p).st_mtime_ns for p in stamps} == stamps
+    changed = export_files(tmp_path, [("a.svg", "<svg>A!</svg>")] + ITEMS[1:])
+    assert (changed.written, changed.skipped) == (1, 2)
+    assert (tmp_path / "a.svg").read_text(encoding="utf-8") == "<svg>A!</svg>"
+
+
+def test_hand_edited_file_is_rewritten(tmp_path):
+    export_files(tmp_path, ITEMS)
+    path = tmp_path / "sub" / "b.svg"
+    mtime = os.stat(path).st_mtime_ns
+    path.write_text("<svg>X</svg>", encoding="utf-8")  # zelfde grootte
+    os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))  # een editor zet een nieuwe mtime
+    stats = export_files(tmp_path, ITEMS)
+    assert (stats.written, stats.skipped) == (1, 2)
+    assert path.read_text(encoding="utf-8") == "<svg>b</svg>"
+    assert_manifest_matches_disk(tmp_path)
+
+
+def test_deleted_file_is_rewritten(tmp_path):
+    export_files(tmp_path, ITEMS)
+    (tmp_path / "a.svg").unlink()
+    assert export_files(tmp_path, ITEMS).written == 1
+    assert (tmp_path / "a.svg").exists()
+
+
+def test_prune_removes_stale_files(tmp_path):
+    export_files(tmp_path, ITEMS)
+    kept = export_files(tmp_path, ITEMS[:1])
+    assert kept.removed == 0 and (tmp_path / "c.png").exists()
+    assert set(load_manifest(tmp_path)) == {"a.svg", "sub/b.svg", "c.png"}
+    pruned = export_files(tmp_path, ITEMS[:1], prune=True)
+    assert pruned.removed == 2
+    assert not (tmp_path / "c.png").exists() and not (tmp_path / "sub" / "b.svg").exists()
+    assert set(load_manifest(tmp_path)) == {"a.svg"}
+
+
+def test_failure_part_way_leaves_consistent_manifest(tmp_path):
+    export_files(tmp_path, ITEMS)
+
+    def items():
+        yield "a.svg", "<svg>nieuw a</svg>"
+        yield "d.svg", "<svg>d</svg>"
+        raise RuntimeError("render mislukt")
+
+    with pytest.raises(RuntimeError):
+        export_files(tmp_path, items(), workers=2, zip_path=tmp_path / "alles.zip")
+    assert tmp_files(tmp_path) == []
+    assert not (tmp_path / "alles.zip").exists()
+    assert set(load_manifest(tmp_path)) == {"a.svg", "sub/b.svg", "c.png", "d.svg"}
+    assert_manifest_matches_disk(tmp_path)
+    stats = export_files(tmp_path, [("a.svg", "<svg>nieuw a</svg>"), ("d.svg", "<svg>d</svg>")] + ITEMS[1:])
+    assert (stats.written, stats.skipped) == (0, 4)
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if str(dst).endswith("b.svg"):
+            raise OSError("schijf vol")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(export.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        export_files(tmp_path, ITEMS, workers=1)
+    monkeypatch.undo()
+    assert tmp_files(tmp_path) == []
+    assert "sub/b.svg" not in load_manifest(tmp_path)
+    assert_manifest_matches_disk(tmp_path)
+
+
+def test_zip_is_deterministic(tmp_path):
+    export_files(tmp_path / "uit", ITEMS, zip_path=tmp_path / "een.zip")
+    os.utime(tmp_path / "uit" / "a.svg", (0, 0))  # mtimes op schijf tellen niet mee
+    export_files(tmp_path / "uit", ITEMS, zip_path=tmp_path / "twee.zip")
+    assert (tmp_path / "een.zip").read_bytes() == (tmp_path / "twee.zip").read_bytes()
+    assert zip_dir(tmp_path / "uit", tmp_path / "drie.zip") == 3
+    assert zip_dir(tmp_path / "uit", tmp_path / "vier.zip") == 3
+    assert (tmp_path / "drie.zip").read_bytes() == (tmp_path / "vier.zip").read_bytes()
+    with zipfile.ZipFile(tmp_path / "drie.zip") as zf:
+        assert zf.namelist() == ["a.svg", "c.png", "sub/b.svg"]
+        assert zf.read("c.png") == b"\x89PNG-c"
+        assert all(info.date_time == (1980, 1, 1, 0, 0, 0) for info in zf.infolist())
+
+
+def test_zip_dir_skips_manifest_temp_files_and_itself(tmp_path):
+    export_files(tmp_path, ITEMS)
+    (tmp_path / ".a.svg.123.tmp").write_bytes(b"half")
+    assert zip_dir(tmp_path, tmp_path / "uit.zip") == 3
+    with zipfile.ZipFile(tmp_path / "uit.zip") as zf:
+        assert MANIFEST_NAME not in zf.namelist() and "uit.zip" not in zf.namelist()
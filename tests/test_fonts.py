@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Fontkeuze: alleen vastgezette of meegeleverde fonts, nooit systeemfonts."""
+
+import shutil
+
+import pytest
+
+from wlk import fonts
+
+pytestmark = pytest.mark.usefixtures("clean_fonts")
+
+
+def test_system_font_dirs_are_not_searched():
+    dirs = [str(d) for d in fonts.font_dirs()]
+    assert not any(d.startswith(("/usr", "/Library", "/System")) for d in dirs)
+
+
+def test_without_font_file_metrics_are_approximate(monkeypatch):
+    monkeypatch.setattr(fonts, "font_dirs", lambda: [])
+    assert isinstance(fonts.main_font(), fonts.ApproxFont)
+    assert fonts.font_paths() == ("", "")
+
+
+def test_font_dir_is_used(monkeypatch, tmp_path, system_ttf):
+    shutil.copy(system_ttf, tmp_path / "BlackOpsOne-Regular.ttf")
+    monkeypatch.setenv("WLK_FONT_DIR", str(tmp_path))
+    assert fonts.main_font().path == str(tmp_path / "BlackOpsOne-Regular.ttf")
+
+
+def test_pin_overrides_font_dirs(monkeypatch, tmp_path, system_ttf):
+    shutil.copy(system_ttf, tmp_path / "BlackOpsOne-Regular.ttf")
+    monkeypatch.setenv("WLK_FONT_DIR", str(tmp_path))
+    pinned = shutil.copy(system_ttf, tmp_path / "eigen.ttf")
+    fonts.pin_fonts(str(pinned), "")
+    assert fonts.main_font().path == str(pinned)
+    assert isinstance(fonts.tag_font(), fonts.ApproxFont)
+
+
+def test_env_pin(monkeypatch, tmp_path, system_ttf):
+    pinned = shutil.copy(system_ttf, tmp_path / "x.ttf")
+    monkeypatch.setenv("WLK_TAG_FONT_FILE", str(pinned))
+    assert fonts.tag_font().path == str(pinned)
+
+
+def test_signature_follows_content_not_path(tmp_path, system_ttf):
+    a = shutil.copy(system_ttf, tmp_path / "a.ttf")
+    b = shutil.copy(system_ttf, tmp_path / "b.ttf")
+    fonts.pin_fonts(str(a), "")
+    sig_a = fonts.font_signature()
+    fonts.pin_fonts(str(b), "")
+    assert fonts.font_signature() == sig_a
+    fonts.pin_fonts("", "")
+    assert fonts.font_signature() != sig_a
+
+
+def test_batch_workers_use_fonts_chosen_by_parent(tmp_path, system_ttf):
+    from wlk.batch import run_batch
+    from wlk.core import BrandConfig
+    pinned = shutil.copy(system_ttf, tmp_path / "eigen.ttf")
+    fonts.pin_fonts(str(pinned), str(pinned))
+    configs = [BrandConfig(left="Sint", right="Klaas")]
+    run_batch(configs, tmp_path / "een", workers=1, log=lambda m: None, variants={"v12_sinterklaas"})
+    run_batch(configs, tmp_path / "twee", workers=2, log=lambda m: None, variants={"v12_sinterklaas"})
+    one = sorted((tmp_path / "een").rglob("*.svg"))
+    two = sorted((tmp_path / "twee").rglob("*.svg"))
+    assert one and [p.read_bytes() for p in one] == [p.read_bytes() for p in two]
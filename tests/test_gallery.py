@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Galerij: pagina's, de index in gallery.json en het opruimen van oude pagina's."""
+
+import json
+
+from wlk.core import _svg_filename
+from wlk.gallery import build_gallery, variant_labels
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="800" height="200"></svg>'
+
+
+def make_batch(out, brands, variants):
+    labels = variant_labels()
+    for n, brand in enumerate(brands):
+        d = out / (str(n + 1).zfill(4) + "_" + brand)
+        d.mkdir(parents=True)
+        for k in variants:
+            (d / _svg_filename(k, labels[k])).write_text(SVG, encoding="utf-8")
+    (out / "0099_leeg").mkdir()  # map zonder logo's telt niet mee
+    (out / "los.svg").write_text(SVG, encoding="utf-8")  # en een los bestand ook niet
+
+
+def test_pages_and_cards(tmp_path):
+    make_batch(tmp_path, ["lagerkoning", "bierbaron", "wurstwelt"], [0, 2, 5])
+    assert build_gallery(tmp_path, per_page=4) == (9, 3)
+    pages = [(tmp_path / name).read_text(encoding="utf-8") for name in ("index.html", "pagina-2.html", "pagina-3.html")]
+    assert [p.count("<figure>") for p in pages] == [4, 4, 1]
+    assert 'src="0001_lagerkoning/01_01_-_Basis.svg" width="800" height="200"' in pages[0]
+    assert 'loading="lazy"' in pages[0]
+    assert "<b>2</b>" in pages[1] and 'href="index.html"' in pages[1] and 'href="pagina-3.html"' in pages[1]
+    assert "wurstwelt" in pages[2]
+
+
+def test_single_page_has_no_pager(tmp_path):
+    make_batch(tmp_path, ["lagerkoning"], [0])
+    assert build_gallery(tmp_path) == (1, 1)
+    assert "<nav>" not in (tmp_path / "index.html").read_text(encoding="utf-8")
+
+
+def test_gallery_json_indexes_brands_and_variants(tmp_path):
+    make_batch(tmp_path, ["lagerkoning", "bier&baron"], [1, 3])
+    build_gallery(tmp_path, per_page=3)
+    index = json.loads((tmp_path / "gallery.json").read_text(encoding="utf-8"))
+    labels = variant_labels()
+    assert (index["per_page"], index["pages"]) == (3, 2)
+    assert index["variants"] == labels
+    assert index["files"] == [_svg_filename(i, label) for i, label in enumerate(labels)]
+    assert index["brands"] == [{"dir": "0001_lagerkoning", "name": "lagerkoning", "v": [1, 3]},
+                               {"dir": "0002_bier&baron", "name": "bier&baron", "v": [1, 3]}]
+    script = (tmp_path / "gallery.js").read_text(encoding="utf-8")
+    assert script.startswith("window.WLK_GALLERY = " + json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    assert "bier&amp;baron" in (tmp_path / "pagina-2.html").read_text(encoding="utf-8")
+
+
+def test_stale_pages_are_removed(tmp_path):
+    make_batch(tmp_path, ["a", "b", "c", "d"], [0, 1])
+    assert build_gallery(tmp_path, per_page=2) == (8, 4)
+    (tmp_path / "pagina-notes.html").write_text("eigen", encoding="utf-8")
+    assert build_gallery(tmp_path, per_page=5) == (8, 2)
+    assert sorted(p.name for p in tmp_path.glob("*.html")) == ["index.html", "pagina-2.html", "pagina-notes.html"]
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""GUI-logica zonder display: de app wordt via ``__new__`` met nep-variabelen opgebouwd."""
+
+import pytest
+
+pytest.importorskip("tkinter")
+from wlk.core import BrandConfig  # noqa: E402
+from wlk.gui import LogoDesignerApp  # noqa: E402
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+        self.cancelled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+        return "after#" + str(len(self.scheduled))
+
+    def after_cancel(self, ident):
+        self.cancelled.append(ident)
+
+
+class FakeVar:
+    """Roept de trace meteen aan bij ``set``, zoals Tk."""
+
+    def __init__(self, value, trace=None):
+        self.value = value
+        self.trace = trace
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        if self.trace:
+            self.trace()
+
+
+@pytest.fixture
+def app():
+    app = LogoDesignerApp.__new__(LogoDesignerApp)
+    app.root = FakeRoot()
+    app.var_live = FakeVar(True)
+    app._live_after = None
+    app._applying_config = False
+    app._color_buttons = {}
+    app.generated = 0
+    app._generate = lambda: setattr(app, "generated", app.generated + 1)
+    names = ["left", "right", "tld", "fs_main"]
+    variables = [(name, FakeVar("", app._on_config_var_changed)) for name in names]
+    app._config_vars = lambda: variables
+    return app
+
+
+def test_apply_config_renders_once(app):
+    app._apply_config(BrandConfig(left="A", right="B", fs_main=80))
+    assert app.generated == 1
+    assert app.root.scheduled == []  # geen live-render per veld
+    assert dict((n, v.get()) for n, v in app._config_vars())["fs_main"] == "80"
+
+
+def test_apply_config_cancels_pending_live_render(app):
+    app._on_config_var_changed()
+    assert len(app.root.scheduled) == 1
+    app._apply_config(BrandConfig())
+    assert app.root.cancelled == ["after#1"]
+    assert app._live_after is None and app.generated == 1
+
+
+def test_var_change_still_schedules_live_render(app):
+    app._apply_config(BrandConfig())
+    app._config_vars()[0][1].set("X")
+    assert len(app.root.scheduled) == 1
+
+
+def test_png_export_without_text_fonts_asks_first(app, monkeypatch, tmp_path):
+    import wlk.gui
+    import wlk.raster
+    monkeypatch.setattr(wlk.raster, "can_render_text", lambda: False)
+    asked = []
+    monkeypatch.setattr(wlk.gui.messagebox, "askyesno", lambda *a: asked.append(a) or False)
+    dialogs = []
+    monkeypatch.setattr(wlk.gui.filedialog, "asksaveasfilename", lambda **kw: dialogs.append(kw) or "")
+    app.svgs = [("01 - Test", '<svg xmlns="http://www.w3.org/2000/svg"><text>A</text></svg>')]
+    app.selected_idx = 0
+    app._export_selected_png()
+    assert len(asked) == 1 and dialogs == []  # geweigerd: geen bestand gekozen of geschreven
+
+
+class FakeTree:
+    def __init__(self, labels):
+        self.rows = {"I" + str(i): (label,) for i, label in enumerate(labels)}
+
+    def get_children(self):
+        return list(self.rows)
+
+    def item(self, iid, values):
+        self.rows[iid] = values
+
+
+class FakeLog:
+    def log(self, msg, level="INFO"):
+        pass
+
+
+def test_first_render_keeps_metadata_rows_and_selection(app):
+    from wlk.cache import RenderCache
+    app.debug = FakeLog()
+    app.var_profiling = FakeVar(False)
+    app.var_status = FakeVar("")
+    app.render_cache = RenderCache()
+    app.variant_listbox = FakeTree(["01 - Basis", "02 - Vlag"])  # uit de registry-metadata
+    app.svgs = []
+    app.selected_idx = 1
+    details = []
+    app._update_detail = lambda: details.append(app.selected_idx)
+    app._show_svgs([("01 - Basis", "<svg/>"), ("02 - Vlag!", "<svg/>")], 0, keep_selection=True)
+    assert app.variant_listbox.rows == {"I0": ("01 - Basis",), "I1": ("02 - Vlag!",)}
+    assert app.selected_idx == 1 and details == [1]
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Instancing: ``<use>`` voor oude en nieuwe viewers, en de v18-tegel tekent dezelfde ruiten."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from wlk import core
+from wlk.core import BrandConfig
+from wlk.raster import rasterize
+from wlk.svgtree import XLINK_NS
+
+
+def max_difference(a, b):
+    assert (a.width, a.height) == (b.width, b.height)
+    return max(max(abs(p - q) for p, q in zip(ra, rb)) for ra, rb in zip(a.rows, b.rows))
+
+
+def test_use_has_href_and_xlink_href():
+    _, svg = core.v11_christmas(BrandConfig(instancing=True))
+    root = ET.fromstring(svg.encode("utf-8"))
+    uses = root.findall(".//{http://www.w3.org/2000/svg}use")
+    assert uses
+    for use in uses:
+        assert use.get("href") == use.get("{" + XLINK_NS + "}href")
+
+
+def test_xlink_only_where_use_is_drawn():
+    _, plain = core.v11_christmas(BrandConfig())
+    _, pattern = core.v18_oktoberfest(BrandConfig(instancing=True))
+    assert "xlink" not in plain and "xlink" not in pattern
+
+
+def test_use_rasterizes_from_xlink_href_alone():
+    _, svg = core.v11_christmas(BrandConfig(instancing=True))
+    old_viewer = svg.replace(' href="#', ' data-href="#')
+    assert max_difference(rasterize(svg), rasterize(old_viewer)) == 0
+
+
+@pytest.mark.parametrize("width, scale", [(400, 1.0), (413, 1.5), (400, 0.37)])
+def test_oktoberfest_pattern_matches_loose_diamonds(width, scale):
+    _, loose = core.v18_oktoberfest(BrandConfig(out_width=width))
+    _, tiled = core.v18_oktoberfest(BrandConfig(out_width=width, instancing=True))
+    assert "<pattern" in tiled and "<polygon" in loose
+    assert max_difference(rasterize(loose, scale), rasterize(tiled, scale)) <= 2
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Optimizer: afgeronde path-data moet hetzelfde pad beschrijven als het origineel."""
+
+import re
+
+import pytest
+
+from wlk import core, fonts, outline
+from wlk.core import BrandConfig
+from wlk.optimize import _round_numbers, render_optimized, round_path
+from wlk.raster import parse_path, svg_to_png
+
+_D_RE = re.compile(r' d="([^"]*)"')
+
+
+@pytest.fixture
+def real_font(monkeypatch, clean_fonts, system_ttf):
+    monkeypatch.setattr(outline, "_path_cache", {})
+    fonts.pin_fonts(system_ttf, system_ttf)
+
+
+def assert_same_path(original, rounded, tol=0.05 + 1e-9):
+    # dev_scale 0: vast aantal stappen per boog/curve, zodat de punten één op één te vergelijken zijn
+    a, b = parse_path(original, 0), parse_path(rounded, 0)
+    assert [(len(p), closed) for p, closed in a] == [(len(p), closed) for p, closed in b]
+    for (pa, _), (pb, _) in zip(a, b):
+        for (x1, y1), (x2, y2) in zip(pa, pb):
+            assert abs(x1 - x2) <= tol and abs(y1 - y2) <= tol, (original, rounded)
+
+
+def test_negative_number_rounding_to_zero_keeps_separator():
+    assert _round_numbers(".98-.02 2.45", 1) == "1 0 2.5"
+    assert _round_numbers("-.02-.04", 1) == "0 0"
+
+
+def test_relative_path_does_not_accumulate_rounding_error():
+    d = "m0 0" + "l.04.04" * 20 + "z"
+    rounded = round_path(d, 1)
+    assert_same_path(d, rounded)
+    assert parse_path(rounded)[0][0][-1] == pytest.approx((0.8, 0.8))
+
+
+def test_relative_commands_round_trip():
+    d = "m10.04 5.06h2.26v-1.04c1.15.05 2.35 1.26 3.45 2.04s1.06-.94 1.06-1.96q.45.55.96 1.04t-.06.96" \
+        "a2.5 2.5 0 0 1 3.35 3.04l-.04-.04-.03.03z"
+    # bij s/t telt het gespiegelde controlepunt twee afrondingen op
+    assert_same_path(d, round_path(d, 1), tol=0.15 + 1e-9)
+
+
+def test_absolute_path_is_rounded_number_by_number():
+    d = "M1.26 2.24L3 4 5.06 6.44Z"
+    assert round_path(d, 1) == _round_numbers(d, 1) == "M1.3 2.2L3 4 5.1 6.4Z"
+
+
+def test_unreadable_path_data_is_left_alone():
+    for d in ("M0 0a5 5 0 011 1", "M0 0l1.26", "1.26 2.24"):
+        assert round_path(d, 1) == d
+
+
+@pytest.mark.parametrize("outlines", [False, True])
+def test_optimized_variants_describe_the_same_paths(outlines, request):
+    if outlines:
+        request.getfixturevalue("real_font")
+    cfg = BrandConfig(text_outlines=outlines)
+    for fn in (core.v01_basic, core.v10_diagonal, core.v17_einheit, core.v21_halloween):
+        _, plain = fn(cfg)
+        _, small = render_optimized(fn, cfg)
+        before, after = _D_RE.findall(plain), _D_RE.findall(small)
+        assert len(before) == len(after)
+        for d, rounded in zip(before, after):
+            assert_same_path(d, rounded)
+
+
+def test_outlined_and_optimized_text_rasterizes(real_font):
+    _, svg = render_optimized(core.v17_einheit, BrandConfig(text_outlines=True))
+    assert "<text" not in svg
+    assert svg_to_png(svg).startswith(b"\x89PNG")
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Contouren: het glyph-pad leest terug als de punten uit het font, en de cache hergebruikt het."""
+
+import glob
+
+import pytest
+
+from wlk import fonts, outline
+from wlk.outline import glyph_path, text_to_paths
+from wlk.raster import parse_path
+from wlk.svgtree import El
+
+
+@pytest.fixture(scope="module")
+def font():
+    for path in sorted(glob.glob("/usr/share/fonts/**/*.ttf", recursive=True)):
+        f = fonts.Font(path)
+        if f.has_outlines:
+            return f
+    pytest.skip("geen TrueType-font met outlines op dit systeem")
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(outline, "_path_cache", {})
+
+
+def glyph_d(g):
+    return "M" + outline._num(g[0]) + " " + outline._num(g[1]) + g[2]
+
+
+@pytest.mark.parametrize("ch", "WLKag&8")
+def test_glyph_path_round_trips_to_the_font_points(font, ch):
+    gid = font.glyph_id(ch)
+    size = 96
+    s = size / font.units_per_em
+    contours = [c for c in font.glyph_contours(gid) if c]
+    subpaths = parse_path(glyph_d(glyph_path(font, gid, size)), 0)
+    assert len(subpaths) == len(contours)
+    assert all(closed for _, closed in subpaths)
+    for contour, (pts, _) in zip(contours, subpaths):
+        for x, y, on in contour:
+            if on:
+                # Afgerond op PRECISION decimalen; relatief geschreven, maar zonder opgestapelde fout.
+                assert min(abs(px - x * s) + abs(py + y * s) for px, py in pts) <= 0.011
+
+
+def test_glyph_paths_are_cached(font, monkeypatch):
+    gid = font.glyph_id("W")
+    assert glyph_path(font, gid, 40) is glyph_path(font, gid, 40)
+    assert glyph_path(font, gid, 41) is not glyph_path(font, gid, 40)
+    monkeypatch.setattr(outline, "_PATH_CACHE_LIMIT", 1)
+    glyph_path(font, font.glyph_id("L"), 40)
+    assert len(outline._path_cache) <= 2
+
+
+def test_repeated_letters_reuse_the_glyph_path(font):
+    el = El("text", {"x": 10, "y": 50, "font-size": 40, "fill": "#000"}, ["WW"])
+    path = text_to_paths(el, font)
+    rest = glyph_path(font, font.glyph_id("W"), 40.0)[2]
+    assert path.tag == "path" and path.attrs["d"].count(rest) == 2
+    subpaths = parse_path(path.attrs["d"], 0)
+    advance = font.advance(font.glyph_id("W")) * 40 / font.units_per_em
+    assert min(x for x, _ in subpaths[-1][0]) == pytest.approx(min(x for x, _ in subpaths[0][0]) + advance, abs=0.02)
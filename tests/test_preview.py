@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Canvas-preview: items als vergelijkbare tuples, gaten via bruggen en mengen zonder alpha."""
+
+import pytest
+
+from wlk import core
+from wlk.core import BrandConfig
+from wlk.preview import _bridged, blend, canvas_items
+
+SQUARES = ('<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+           '<path fill="#000000" fill-rule="{rule}" d="M10 10 H90 V90 H10 Z {inner}"/></svg>')
+HOLE_CW = "M30 30 H70 V70 H30 Z"  # zelfde draairichting als het buitenvierkant
+HOLE_CCW = "M30 30 V70 H70 V30 Z"
+
+
+def inside_evenodd(coords, x, y):
+    """Even-odd test zoals Tk een polygoon vult."""
+    pts = list(zip(coords[::2], coords[1::2]))
+    hits = 0
+    for (x1, y1), (x2, y2) in zip(pts, pts[1:] + pts[:1]):
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            hits += 1
+    return hits % 2 == 1
+
+
+def polys(items):
+    return [item for item in items if item[0] == "poly"]
+
+
+def test_blend_over_background():
+    assert blend((0, 0, 0), 1.0) == "#000000"
+    assert blend((0, 0, 0), 0.5) == "#808080"
+    assert blend((255, 0, 0), 0.25, (0, 0, 255)) == "#4000bf"
+    assert blend((10, 20, 30), 2.0) == "#0a141e"
+
+
+def test_fit_and_center():
+    w, h, items = canvas_items(SQUARES.format(rule="nonzero", inner=""), 300, 200)
+    assert (w, h) == (200, 200)
+    (kind, coords, fill), = items
+    assert (kind, fill) == ("poly", "#000000")
+    assert (min(coords[::2]), min(coords[1::2]), max(coords[::2]), max(coords[1::2])) == (70, 20, 230, 180)
+
+
+def test_moved_icon_only_changes_the_icon_items():
+    _, _, before = canvas_items(core.v04_crown(BrandConfig())[1], 800, 300)
+    _, _, after = canvas_items(core.v04_crown(BrandConfig(icon_offset_x=30))[1], 800, 300)
+    gone = [item for item in before if item not in after]
+    new = [item for item in after if item not in before]
+    kept = [item for item in before if item in after]
+    assert [item[0] for item in kept] == ["text"]
+    assert len(gone) == len(new) == 4 and all(item[0] == "poly" for item in gone + new)
+    s = 800 / 1200.0  # v04 is 1200 breed
+    for old, moved in zip(gone, new):
+        assert old[2] == moved[2]
+        assert moved[1][1::2] == old[1][1::2]
+        assert all(b - a == pytest.approx(30 * s, abs=0.11) for a, b in zip(old[1][::2], moved[1][::2]))
+
+
+@pytest.mark.parametrize("rule, inner", [("evenodd", HOLE_CW), ("evenodd", HOLE_CCW), ("nonzero", HOLE_CCW)])
+def test_shape_with_hole_is_one_bridged_polygon(rule, inner):
+    _, _, items = canvas_items(SQUARES.format(rule=rule, inner=inner), 100, 100)
+    (_, coords, _), = polys(items)
+    assert not inside_evenodd(coords, 50, 50)  # het gat blijft leeg
+    assert inside_evenodd(coords, 20, 50) and inside_evenodd(coords, 80, 20)
+    assert not inside_evenodd(coords, 5, 5)
+
+
+def test_separate_shapes_stay_separate_polygons():
+    svg = SQUARES.format(rule="nonzero", inner="M95 0 H99 V4 H95 Z")
+    assert len(polys(canvas_items(svg, 100, 100)[2])) == 2
+
+
+def test_bridged_returns_through_the_first_point():
+    outer = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    inner = [(3, 3), (6, 3), (6, 6)]
+    coords = _bridged([outer, inner], 2.0, 1.0, 0.0)
+    assert coords == (1.0, 0.0, 21.0, 0.0, 21.0, 20.0, 1.0, 20.0, 1.0, 0.0, 1.0, 0.0,
+                      7.0, 6.0, 13.0, 6.0, 13.0, 12.0, 7.0, 6.0, 1.0, 0.0)
+
+
+def test_invisible_and_broken_input():
+    svg = SQUARES.format(rule="nonzero", inner="").replace('fill="#000000"', 'fill="#000000" fill-opacity="0"')
+    assert canvas_items(svg, 100, 100)[2] == []
+    assert canvas_items('<svg xmlns="http://www.w3.org/2000/svg" width="0" height="0"/>', 100, 100) == (0, 0, [])
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.next_id = 0
+        self.deleted = []
+
+    def winfo_width(self):
+        return 800
+
+    def winfo_height(self):
+        return 300
+
+    def create_polygon(self, coords, **kw):
+        self.next_id += 1
+        return self.next_id
+
+    def delete(self, *ids):
+        self.deleted.extend(ids)
+
+    def tag_raise(self, i):
+        pass
+
+
+def test_canvas_preview_redraws_only_the_moved_icon():
+    pytest.importorskip("tkinter")
+    from wlk.gui import CanvasPreview
+
+    preview = CanvasPreview.__new__(CanvasPreview)
+    preview.canvas = FakeCanvas()
+    preview._items, preview._positions, preview._svg = {}, {}, None
+    preview._draw = lambda item: (preview.canvas.create_polygon(item[1]),)
+    preview.show(core.v04_crown(BrandConfig())[1])
+    assert preview.stats == (0, 5, 0)
+    preview.show(core.v04_crown(BrandConfig(icon_offset_x=30))[1])
+    assert preview.stats == (1, 4, 4)
+    assert preview.canvas.deleted == [1, 2, 3, 4]
+    preview.show(core.v04_crown(BrandConfig(icon_offset_x=30))[1])
+    assert preview.stats == (5, 0, 0)
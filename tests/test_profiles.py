@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Merkprofielen: opslaan en zoeken op merk/domein, preset-overrides en streamend lezen."""
+
+import sqlite3
+
+import pytest
+
+from wlk import profiles
+from wlk.core import BrandConfig
+from wlk.profiles import ProfileDB
+
+PRESET = "Website header (lagerkoning.nl)"
+
+
+@pytest.fixture
+def db(tmp_path):
+    with ProfileDB(tmp_path / "profielen.db") as db:
+        yield db
+
+
+def test_save_derives_brand_and_domain(db):
+    db.save("lk", BrandConfig(left="Lager", right="Koning", tld=".nl"))
+    assert db.find(brand="lagerkoning") == [("lk", "lagerkoning", "lagerkoning.nl")]
+    assert db.find(domain="LagerKoning.nl") == [("lk", "lagerkoning", "lagerkoning.nl")]
+
+
+def test_explicit_brand_is_found_regardless_of_case(db):
+    db.save("x", BrandConfig(), brand="LagerKoning", domain="LagerKoning.DE")
+    assert db.find(brand="LagerKoning") == [("x", "lagerkoning", "lagerkoning.de")]
+    assert db.find(brand="lagerkoning", domain="lagerkoning.de") == [("x", "lagerkoning", "lagerkoning.de")]
+    assert [name for name, _ in db.iter_configs(brand="LAGERKONING")] == ["x"]
+
+
+def test_old_mixed_case_rows_are_lowercased_on_open(tmp_path):
+    path = tmp_path / "oud.db"
+    with ProfileDB(path) as db:
+        db.save("x", BrandConfig())
+    conn = sqlite3.connect(str(path))
+    with conn:
+        conn.execute("UPDATE profiles SET brand = 'LagerKönig', domain = 'LagerKönig.DE'")
+    conn.close()
+    with ProfileDB(path) as db:
+        assert db.find(brand="lagerkönig", domain="LAGERKÖNIG.de") == [("x", "lagerkönig", "lagerkönig.de")]
+
+
+def test_save_updates_by_name(db):
+    db.save("lk", BrandConfig(left="Oud"))
+    db.save("lk", BrandConfig(left="Nieuw"))
+    assert len(db) == 1 and db.get("lk").left == "Nieuw"
+
+
+def test_get_with_preset_and_overrides(db):
+    db.save("lk", BrandConfig(left="Lager", word_gap=12))
+    db.set_override("lk", PRESET, {"word_gap": 4})
+    plain = db.get("lk")
+    sized = db.get("lk", PRESET)
+    bare = db.get("lk", PRESET, overrides=False)
+    assert (plain.out_width, plain.word_gap) == (BrandConfig().out_width, 12)
+    assert (sized.out_width, sized.out_height, sized.fs_main, sized.word_gap) == (400, 80, 62, 4)
+    assert (bare.out_width, bare.word_gap) == (400, 12)
+    assert db.get("lk", "Visitekaartje").word_gap == 12  # override geldt alleen voor zijn preset
+    assert db.overrides("lk") == {PRESET: {"word_gap": 4}}
+    db.set_override("lk", PRESET, {})
+    assert db.overrides("lk") == {}
+
+
+def test_unknown_profile_or_preset(db):
+    with pytest.raises(KeyError):
+        db.get("nergens")
+    db.save("lk", BrandConfig())
+    with pytest.raises(KeyError):
+        db.set_override("lk", "geen preset", {"word_gap": 1})
+
+
+def test_delete_cascades_to_overrides(db):
+    db.save("lk", BrandConfig())
+    db.set_override("lk", PRESET, {"word_gap": 4})
+    assert db.delete("lk") and not db.delete("lk")
+    assert db.conn.execute("SELECT COUNT(*) FROM preset_overrides").fetchone()[0] == 0
+
+
+def test_iter_configs_streams_in_blocks(db, monkeypatch):
+    monkeypatch.setattr(profiles, "FETCH_SIZE", 3)
+    db.import_configs(BrandConfig(left="Merk" + format(i, "02d"), right="", tld=".nl") for i in range(10))
+    db.set_override("merk04.nl", PRESET, {"word_gap": 1})
+    it = db.iter_configs(PRESET)
+    first = next(it)
+    assert first[0] == "merk00.nl" and first[1].out_width == 400
+    rest = list(it)
+    assert [name for name, _ in rest] == ["merk" + format(i, "02d") + ".nl" for i in range(1, 10)]
+    assert dict(rest)["merk04.nl"].word_gap == 1
+
+
+def test_iter_configs_closes_its_cursor_when_abandoned(db):
+    db.import_configs(BrandConfig(left="M" + str(i)) for i in range(5))
+    it = db.iter_configs()
+    next(it)
+    it.close()
+    db.save("na", BrandConfig())  # een openstaande cursor zou hier niet in de weg mogen zitten
+    assert len(db) == 6
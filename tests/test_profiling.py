@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Profilering: percentielen over een rollend venster, foutentelling en het pstats-bestand."""
+
+import pstats
+
+import pytest
+
+from wlk.profiling import RenderProfiler, count_shapes, percentile, run_profiled
+
+SVG = '<svg><rect/><circle/><text>x</text><use href="#a"/><g><path d=""/></g></svg>'
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) == 0.0
+    assert percentile([5], 95) == 5
+    assert percentile([4, 1, 3, 2], 50) == 2.5
+    assert percentile(range(101), 95) == 95
+
+
+def test_count_shapes():
+    assert count_shapes(SVG) == 5
+    assert count_shapes("<svg><g><defs/></g></svg>") == 0
+
+
+def test_percentiles_only_cover_the_window():
+    prof = RenderProfiler(window=10)
+    for ms in [1000] * 5 + list(range(1, 11)):
+        prof.record("v01_basic", ms / 1000.0, SVG)
+    row, = prof.rows()
+    assert row["renders"] == 15  # het totaal telt wel alles
+    assert row["last_ms"] == pytest.approx(10)
+    assert row["max_ms"] == pytest.approx(10)  # de trage renders zijn uit het venster
+    assert row["p50_ms"] == pytest.approx(5.5)
+    assert row["p95_ms"] == pytest.approx(9.55)
+    assert (row["bytes"], row["shapes"], row["errors"]) == (len(SVG), 5, 0)
+
+
+def test_measure_counts_errors_and_reraises():
+    prof = RenderProfiler()
+
+    def v02_flag(cfg):
+        if cfg is None:
+            raise ValueError("geen config")
+        return "label", SVG
+
+    assert prof.measure(v02_flag, object()) == ("label", SVG)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            prof.measure(v02_flag, None)
+    row, = prof.rows()
+    assert (row["variant"], row["renders"], row["errors"]) == ("v02_flag", 1, 2)
+    assert row["last_error"] == "ValueError('geen config')"
+
+
+def test_error_only_variant_still_has_a_row():
+    prof = RenderProfiler()
+    prof.record_error("v09_broken", "boom")
+    row, = prof.rows()
+    assert (row["renders"], row["p95_ms"], row["max_ms"], row["errors"]) == (0, 0.0, 0.0, 1)
+
+
+def test_slowest_and_clear():
+    prof = RenderProfiler()
+    for name, ms in (("snel", 1), ("traag", 50), ("middel", 10)):
+        prof.record(name, ms / 1000.0, SVG)
+    assert [r["variant"] for r in prof.slowest(2)] == ["traag", "middel"]
+    prof.clear()
+    assert prof.rows() == []
+
+
+def test_run_profiled_writes_pstats(tmp_path):
+    def work():
+        return sum(count_shapes(SVG) for _ in range(50))
+
+    path = tmp_path / "render.pstats"
+    result, summary = run_profiled(work, path, top=5)
+    assert result == 250
+    assert "count_shapes" in summary and "cumulative" in summary
+    stats = pstats.Stats(str(path))
+    assert any(func[2] == "count_shapes" for func in stats.stats)
+
+
+def test_run_profiled_keeps_the_file_when_func_fails(tmp_path):
+    def work():
+        raise RuntimeError("stuk")
+
+    path = tmp_path / "fout.pstats"
+    with pytest.raises(RuntimeError):
+        run_profiled(work, path)
+    assert path.exists()
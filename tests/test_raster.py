@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Rasterizer: bogen, groeps-opacity, gemaskeerde patronen en tekst via outlines."""
+
+import pytest
+
+from wlk import outline
+from wlk.raster import Layer, Shape, TextRun, display_list, parse_path, rasterize
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">{body}</svg>'
+
+
+def svg(body, w=40, h=40):
+    return SVG.format(w=w, h=h, body=body)
+
+
+def pixel(raster, x, y):
+    return tuple(raster.rows[y][4 * x:4 * x + 4])
+
+
+def test_arc_is_flattened_to_a_curve():
+    polys = parse_path("M0 0 A10 10 0 0 1 20 0 Z")
+    (pts, closed), = polys
+    assert closed and len(pts) > 8
+    assert min(y for _, y in pts) == pytest.approx(-10, abs=0.05)
+    assert pts[-1] == pytest.approx((20, 0))
+
+
+def test_arc_compact_flags():
+    assert parse_path("M0 0a10 10 0 0120 0z") == parse_path("M0 0 a10 10 0 0 1 20 0 z")
+
+
+def test_group_opacity_is_applied_once():
+    body = ('<g opacity=".5"><rect x="0" y="0" width="30" height="40" fill="#000"/>'
+            '<rect x="10" y="0" width="30" height="40" fill="#000"/></g>')
+    raster = rasterize(svg(body))
+    assert pixel(raster, 5, 20)[3] == pixel(raster, 20, 20)[3] == pixel(raster, 35, 20)[3]
+    assert pixel(raster, 20, 20)[3] == pytest.approx(128, abs=1)
+
+
+def test_single_shape_opacity_needs_no_layer():
+    _, _, items = display_list(svg('<g opacity=".5"><rect width="10" height="10" fill="#000"/></g>'))
+    assert [it.__class__ for it in items] == [Shape]
+    assert items[0].alpha == pytest.approx(0.5)
+
+
+def test_pattern_is_masked_by_concave_shape():
+    body = ('<defs><pattern id="p" width="4" height="4" patternUnits="userSpaceOnUse">'
+            '<rect width="4" height="4" fill="#f00"/></pattern></defs>'
+            '<path d="M0 0H40V40H30V10H10V40H0Z" fill="url(#p)"/>')
+    _, _, items = display_list(svg(body))
+    assert any(it.__class__ is Layer and it.mask is not None for it in items)
+    raster = rasterize(svg(body))
+    assert pixel(raster, 5, 30)[3] == 255  # linkerpoot
+    assert pixel(raster, 35, 30)[3] == 255  # rechterpoot
+    assert pixel(raster, 20, 30)[3] == 0  # de inham van de U blijft leeg
+
+
+def test_text_counted_when_no_outline_fonts(monkeypatch):
+    monkeypatch.setattr(outline, "class_fonts", lambda: None)
+    raster = rasterize(svg('<text x="2" y="30" class="w" font-size="20">A</text>'))
+    assert raster.skipped_text == 1
+
+
+def test_text_rasterized_with_outline_fonts():
+    fonts = outline.class_fonts()
+    if fonts is None:
+        pytest.skip("geen TrueType-fonts met outlines beschikbaar")
+    src = svg('<text x="2" y="30" class="w" font-size="30" fill="#000">H</text>')
+    _, _, items = display_list(src, fonts=fonts)
+    assert not any(it.__class__ is TextRun for it in items)
+    raster = rasterize(src)
+    assert raster.skipped_text == 0
+    assert any(row[3::4].count(0) < len(row) // 4 for row in raster.rows)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Register: plugins uit een map en via entry points, metadata zonder import, lui laden."""
+
+import os
+import subprocess
+import sys
+from datetime import date
+from importlib import metadata
+
+import pytest
+
+from wlk import registry
+from wlk.core import BrandConfig
+from wlk.svgtree import El
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PLUGIN = '''from wlk.core import _baseline, _main_text, _wrap, variant
+
+
+@variant(season=(6, 21, 8, 31), elements=4)
+def {name}(c):
+    body = [_main_text(c, 24, _baseline(c))]
+    return ("{label}", _wrap(c, c.out_width, c.out_height, body))
+'''
+
+
+@pytest.fixture
+def fresh(monkeypatch, tmp_path):
+    """Leeg register met alleen ``tmp_path/plugins`` en de entry points uit ``eps``."""
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    eps = []
+    monkeypatch.setenv("WLK_PLUGIN_DIR", str(plugins))
+    monkeypatch.setattr(registry, "plugin_dirs", lambda: [plugins])
+    monkeypatch.setattr(metadata, "entry_points", lambda group=None: [ep for ep in eps if ep.group == group])
+    monkeypatch.syspath_prepend(str(tmp_path))
+    before = set(sys.modules)
+    yield plugins, eps
+    for name in set(sys.modules) - before:
+        if name.startswith(("wlk_plugins.", "mypkg")):
+            del sys.modules[name]
+    monkeypatch.undo()
+    registry.reload()
+
+
+def entry_point(name, value):
+    return metadata.EntryPoint(name, value, registry.ENTRY_POINT_GROUP)
+
+
+def count_elements(el):
+    return 1 + sum(count_elements(c) for c in el.children if isinstance(c, El))
+
+
+def test_builtin_metadata():
+    variants = registry.variants()
+    assert variants[0].id == "v01_basic" and variants[0].label == "01 - Basis"
+    assert all(v.source == "builtin" for v in variants)
+    crown = registry.get("v04_crown")
+    assert {"icon_offset_x", "icon_scale", "left", "fs_main"} <= set(crown.fields)
+    assert registry.get("v11_christmas").window(2025)
+    assert registry.get("v01_basic").window(2025) == []
+    with pytest.raises(KeyError):
+        registry.get("v99_geen")
+
+
+def test_elements_are_counted_at_the_reference_width():
+    assert registry.ELEMENTS_WIDTH == BrandConfig().out_width
+    for v in registry.variants():
+        _, root = v.build(BrandConfig(out_width=registry.ELEMENTS_WIDTH))
+        assert count_elements(root) == v.elements, v.id
+
+
+def test_plugin_dir_is_discovered_without_import(fresh):
+    plugins, _ = fresh
+    (plugins / "zomer.py").write_text(PLUGIN.format(name="v30_zomer", label="30 - Zomer"), encoding="utf-8")
+    (plugins / "_hulp.py").write_text(PLUGIN.format(name="v31_hulp", label="31 - Hulp"), encoding="utf-8")
+    (plugins / "dubbel.py").write_text(PLUGIN.format(name="v01_basic", label="01 - Dubbel"), encoding="utf-8")
+    (plugins / "kapot.py").write_text("def (:\n", encoding="utf-8")
+    variants = registry.reload()
+    zomer = variants[-1]
+    assert [v.id for v in variants if v.source == "plugin"] == ["v30_zomer"]
+    assert (zomer.label, zomer.elements, zomer.__module__) == ("30 - Zomer", 4, "wlk_plugins.zomer")
+    assert {"left", "right", "tld", "out_width", "out_height", "fs_main"} <= set(zomer.fields)
+    assert zomer.window(2025) == [(date(2025, 6, 21), date(2025, 8, 31))]
+    assert len(zomer.stamp) == 16
+    assert not zomer.loaded and "wlk_plugins.zomer" not in sys.modules
+    assert any("dubbel.py" in p and "bestaat al" in p for p in registry.problems)
+    assert any("kapot.py" in p for p in registry.problems)
+    label, svg = zomer(BrandConfig(left="Zon"))
+    assert zomer.loaded and label == "30 - Zomer" and ">Zon<" in svg
+
+
+def test_entry_points_with_and_without_attribute(fresh):
+    _, eps = fresh
+    pkg = fresh[0].parent / "mypkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "een.py").write_text(PLUGIN.format(name="v40_een", label="40 - Een")
+                                + PLUGIN.format(name="v41_niet", label="41 - Niet"), encoding="utf-8")
+    (pkg / "alles.py").write_text(PLUGIN.format(name="v42_a", label="42 - A")
+                                  + PLUGIN.format(name="v43_b", label="43 - B"), encoding="utf-8")
+    eps.extend([entry_point("een", "mypkg.een:v40_een"), entry_point("alles", "mypkg.alles"),
+                entry_point("weg", "mypkg.bestaat_niet:v1")])
+    variants = registry.reload()
+    found = [(v.id, v.source) for v in variants if v.source == "entrypoint"]
+    assert found == [("v42_a", "entrypoint"), ("v43_b", "entrypoint"), ("v40_een", "entrypoint")]
+    assert any(p.startswith("entry point weg") for p in registry.problems)
+    een = registry.get("v40_een")
+    assert not een.loaded and "mypkg.een" not in sys.modules
+    assert een(BrandConfig())[0] == "40 - Een"
+    assert "mypkg.een" in sys.modules and not registry.get("v42_a").loaded
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def test_metadata_does_not_import_the_render_core():
+    out = run_python("import sys\n"
+                     "from wlk import registry\n"
+                     "from wlk.config import BrandConfig\n"
+                     "v = registry.get('v04_crown')\n"
+                     "print(len(registry.variants()), v.loaded, 'wlk.core' in sys.modules)\n"
+                     "v(BrandConfig())\n"
+                     "print(v.loaded, 'wlk.core' in sys.modules)\n")
+    assert out.split() == [str(len(registry.variants())), "False", "False", "True", "True"]
+
+
+def test_gui_and_launcher_defer_the_render_core():
+    pytest.importorskip("tkinter")
+    out = run_python("import sys, logo_designer, wlk.gui, wlk.batch, wlk.server\n"
+                     "print('wlk.core' in sys.modules)\n")
+    assert out.strip() == "False"
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Strooi-layout: deterministisch, buiten het tekstvak en onafhankelijk van systeemfonts."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from wlk import fonts
+from wlk.core import BrandConfig, _text_box, v15_valentine, v20_carnival
+from wlk.scatter import scaled_count, scatter
+
+pytestmark = pytest.mark.usefixtures("clean_fonts")
+
+
+def test_scatter_is_deterministic_and_avoids_boxes():
+    box = (100, 20, 500, 80)
+    points = scatter(7, (0, 0, 600, 100), 40, 10, (box,))
+    scatter.cache_clear()
+    assert scatter(7, (0, 0, 600, 100), 40, 10, (box,)) == points
+    assert len(points) == 40
+    assert not any(box[0] < x < box[2] and box[1] < y < box[3] for x, y in points)
+
+
+def test_scaled_count():
+    assert scaled_count(15, 800) == 15
+    assert scaled_count(15, 2400) == 30
+
+
+def test_text_box_uses_pinned_font_metrics(system_ttf):
+    cfg = BrandConfig()
+    approx = _text_box(cfg, 24, 100)
+    fonts.pin_fonts(system_ttf, "")
+    font = fonts.main_font()
+    x0, y0, x1, y1 = _text_box(cfg, 24, 100)
+    assert x1 == int(24 + fonts.main_text_width(cfg, font))
+    assert (x0, y0, x1, y1) != approx
+
+
+def test_layout_ignores_system_fonts(monkeypatch, tmp_path, system_ttf):
+    cfg = BrandConfig()
+    before = [v15_valentine(cfg), v20_carnival(cfg)]
+    # Een font in de gebruikersmappen die vroeger doorzocht werden mag niets veranderen.
+    home = tmp_path / "home"
+    for sub in (".fonts", ".local/share/fonts"):
+        (home / sub).mkdir(parents=True)
+        shutil.copy(system_ttf, home / sub / "BlackOpsOne-Regular.ttf")
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: home))
+    monkeypatch.setattr(fonts, "_FONTS", {})
+    scatter.cache_clear()
+    assert [v15_valentine(cfg), v20_carnival(cfg)] == before
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Seizoenskalender: datumregels, voorrang bij overlap en het manifest."""
+
+from datetime import date
+
+import pytest
+
+from wlk import seasons
+from wlk.seasons import build_manifest, easter, lookup, runs, variant_for, year_schedule
+
+
+@pytest.mark.parametrize("year, expected", [
+    (2000, date(2000, 4, 23)), (2019, date(2019, 4, 21)), (2024, date(2024, 3, 31)),
+    (2025, date(2025, 4, 20)), (2038, date(2038, 4, 25)), (2285, date(2285, 3, 22)),
+])
+def test_easter(year, expected):
+    assert easter(year) == expected
+
+
+def window(rule, year):
+    (start, end), = rule(year)
+    return start, end
+
+
+def test_koningsdag_moves_to_saturday_when_27_april_is_sunday():
+    assert window(seasons._koningsdag, 2025)[1] == date(2025, 4, 26)
+    assert window(seasons._koningsdag, 2024)[1] == date(2024, 4, 27)
+
+
+def test_carnival_follows_easter():
+    assert window(seasons._carnival, 2025) == (date(2025, 2, 27), date(2025, 3, 4))  # do t/m di
+    assert window(seasons._carnival, 2024) == (date(2024, 2, 8), date(2024, 2, 13))
+
+
+@pytest.mark.parametrize("year, expected", [
+    (2023, (date(2023, 9, 16), date(2023, 10, 3))),  # eerste zondag 1 okt: door t/m 3 oktober
+    (2024, (date(2024, 9, 21), date(2024, 10, 6))),
+    (2025, (date(2025, 9, 20), date(2025, 10, 5))),
+])
+def test_oktoberfest(year, expected):
+    assert window(seasons._oktoberfest, year) == expected
+
+
+def test_black_friday_through_cyber_monday():
+    assert window(seasons._black_friday, 2025) == (date(2025, 11, 28), date(2025, 12, 1))
+    assert window(seasons._black_friday, 2024) == (date(2024, 11, 29), date(2024, 12, 2))
+
+
+def test_new_year_runs_over_the_year_boundary():
+    assert variant_for(date(2025, 12, 31)) == "v16_newyear"
+    assert variant_for(date(2026, 1, 1)) == "v16_newyear"
+    assert variant_for(date(2026, 1, 2)) == "v16_newyear"
+    assert variant_for(date(2026, 1, 3)) == "v01_basic"
+
+
+@pytest.mark.parametrize("day, expected", [
+    (date(2025, 4, 21), "v13_koningsdag"),  # tweede paasdag valt in de koningsweek
+    (date(2025, 4, 19), "v14_easter"),
+    (date(2025, 10, 2), "v17_einheit"),  # vóór Oktoberfest
+    (date(2025, 10, 4), "v18_oktoberfest"),
+    (date(2025, 12, 1), "v22_blackfriday"),  # vóór Sinterklaas
+    (date(2025, 12, 2), "v12_sinterklaas"),
+    (date(2025, 12, 26), "v11_christmas"),
+    (date(2025, 12, 27), "v16_newyear"),
+    (date(2025, 7, 1), "v01_basic"),
+])
+def test_priority_on_overlap(day, expected):
+    assert variant_for(day) == expected
+
+
+def test_schedule_covers_every_day_once():
+    for year, days in ((2024, 366), (2025, 365)):
+        schedule = year_schedule(year)
+        assert len(schedule) == days
+        spans = runs(schedule)
+        assert sum((b - a).days + 1 for a, b, _ in spans) == days
+        assert all(x[2] != y[2] for x, y in zip(spans, spans[1:]))
+
+
+def test_manifest_lookup():
+    manifest = build_manifest(2025, ["0001_demo"])
+    assert manifest["periods"][0] == {"from": "2025-01-01", "to": "2025-01-02", "variant": "v16_newyear"}
+    assert set(manifest["files"]) == set(manifest["days"].values())
+    assert lookup(manifest, "0001_demo", date(2025, 12, 24)) == "0001_demo/" + manifest["files"]["v11_christmas"]
+    assert lookup(manifest, "0001_demo", "2025-07-01") == "0001_demo/" + manifest["files"]["v01_basic"]
+    assert lookup(manifest, "0001_demo", "2031-07-01") == "0001_demo/" + manifest["files"]["v01_basic"]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Render-service: ETag, 304 zonder render en gzip naast de gewone SVG."""
+
+import gzip
+import http.client
+import threading
+
+import pytest
+
+from wlk.server import RenderService, _accepts_gzip, _etag_matches, make_server
+
+PATH = "/logo/v01.svg?left=Demo"
+
+
+@pytest.fixture(scope="module")
+def server():
+    srv = make_server(port=0, service=RenderService())
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def request(server, path=PATH, method="GET", **headers):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+    try:
+        conn.request(method, path, headers={k.replace("_", "-"): v for k, v in headers.items()})
+        resp = conn.getresponse()
+        return resp.status, dict(resp.getheaders()), resp.read()
+    finally:
+        conn.close()
+
+
+def service(server):
+    return server.RequestHandlerClass.service
+
+
+def test_svg_with_etag(server):
+    status, headers, body = request(server)
+    assert status == 200
+    assert headers["Content-Type"].startswith("image/svg+xml")
+    assert body.startswith(b"<?xml") and b"Demo" in body
+    assert int(headers["Content-Length"]) == len(body)
+    assert headers["ETag"].startswith('"') and "max-age" in headers["Cache-Control"]
+    assert request(server)[1]["ETag"] == headers["ETag"]
+    assert request(server, "/logo/v01.svg?left=Ander")[1]["ETag"] != headers["ETag"]
+
+
+def test_if_none_match_gives_304_without_rendering(server):
+    etag = request(server)[1]["ETag"]
+    before = service(server).cache.stats()
+    for tag in (etag, "W/" + etag, '"iets-anders", ' + etag):
+        status, headers, body = request(server, If_None_Match=tag)
+        assert status == 304 and body == b""
+        assert headers["ETag"] == etag
+    assert service(server).cache.stats() == before  # geen lookup, geen render
+
+
+def test_stale_etag_renders_again(server):
+    status, _, body = request(server, If_None_Match='"verouderd"')
+    assert status == 200 and body
+
+
+def test_gzip_when_accepted(server):
+    _, plain_headers, plain = request(server)
+    status, headers, body = request(server, Accept_Encoding="gzip, deflate")
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip" and headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == plain
+    assert headers["ETag"] != plain_headers["ETag"]
+    status, headers, _ = request(server, Accept_Encoding="gzip", If_None_Match=headers["ETag"])
+    assert status == 304 and headers["ETag"].endswith('-gz"')
+
+
+def test_gzip_refused_with_q0(server):
+    _, headers, body = request(server, Accept_Encoding="gzip;q=0")
+    assert "Content-Encoding" not in headers and body.startswith(b"<?xml")
+
+
+def test_head_has_no_body(server):
+    _, _, body = request(server)
+    status, headers, head_body = request(server, method="HEAD")
+    assert status == 200 and head_body == b""
+    assert int(headers["Content-Length"]) == len(body)
+
+
+def test_errors(server):
+    assert request(server, "/logo/v99.svg")[0] == 404
+    assert request(server, "/logo/v01.svg?optimize=veel")[0] == 400
+    assert request(server, "/elders")[0] == 404
+
+
+def test_optimize_is_part_of_the_etag(server):
+    _, plain_headers, plain = request(server)
+    _, headers, body = request(server, PATH + "&optimize=1")
+    assert headers["ETag"] != plain_headers["ETag"] and len(body) < len(plain)
+
+
+def test_header_parsing():
+    assert _accepts_gzip("br, gzip;q=0.5")
+    assert _accepts_gzip("*")
+    assert not _accepts_gzip("gzip;q=0")
+    assert not _accepts_gzip(None)
+    assert _etag_matches("*", ('"a"',))
+    assert not _etag_matches('"b"', ('"a"',))
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Instellingen: samengevoegde writes en herstel uit het journal na een crash."""
+
+import json
+
+from wlk import settings
+from wlk.core import BrandConfig
+from wlk.settings import JOURNAL_MAX_LINES, SettingsStore
+
+
+def store(tmp_path, **kw):
+    return SettingsStore(tmp_path / "wlk_config.json", delay=60, **kw)
+
+
+def test_saves_are_coalesced(tmp_path):
+    s = store(tmp_path)
+    for name in ("A", "B", "C"):
+        s.save({"left": name})
+    assert s.flush() and s.writes == 1
+    assert not s.flush()
+    data = json.loads(s.path.read_text(encoding="utf-8"))
+    assert data["left"] == "C" and data["_seq"] == 1
+
+
+def test_unchanged_data_is_not_written(tmp_path):
+    s = store(tmp_path)
+    s.save({"left": "A"})
+    s.flush()
+    again = store(tmp_path)
+    again.load()
+    again.save({"left": "A"})
+    assert not again.flush() and again.writes == 0
+
+
+def test_crash_before_main_file_is_recovered_from_journal(tmp_path, monkeypatch):
+    s = store(tmp_path)
+    s.save({"left": "Oud"})
+    s.flush()
+
+    def crash(path, data):
+        raise OSError("stroom weg")
+
+    errors = []
+    s.on_error = errors.append
+    monkeypatch.setattr(settings, "atomic_write", crash)
+    s.save({"left": "Nieuw"})
+    assert not s.flush() and errors
+    monkeypatch.undo()
+
+    cfg, problems = store(tmp_path).load()
+    assert cfg.left == "Nieuw"
+    assert any("journal" in p for p in problems)
+
+
+def test_damaged_main_file_is_recovered_from_journal(tmp_path):
+    s = store(tmp_path)
+    s.save({"left": "Heel"})
+    s.flush()
+    s.path.write_text('{"left": "He', encoding="utf-8")
+    cfg, problems = store(tmp_path).load()
+    assert cfg.left == "Heel"
+    assert any("beschadigd" in p for p in problems)
+
+
+def test_torn_and_corrupt_journal_lines_are_skipped(tmp_path):
+    s = store(tmp_path)
+    s.save({"left": "Goed"})
+    s.flush()
+    with open(s.journal, "ab") as f:
+        f.write(json.dumps({"seq": 5, "crc": 1, "data": {"left": "Fout"}}).encode("utf-8") + b"\n")
+        f.write(b'{"seq": 6, "crc": 12, "da')
+    cfg, problems = store(tmp_path).load()
+    assert cfg.left == "Goed" and problems == []
+
+
+def test_journal_is_trimmed(tmp_path):
+    s = store(tmp_path)
+    for i in range(JOURNAL_MAX_LINES + 2):
+        s.save({"left": str(i)})
+        s.flush()
+    assert len(s.journal.read_bytes().splitlines()) <= JOURNAL_MAX_LINES
+    cfg, _ = store(tmp_path).load()
+    assert cfg.left == str(JOURNAL_MAX_LINES + 1)
+
+
+def test_sequence_continues_after_load(tmp_path):
+    s = store(tmp_path)
+    s.save({"left": "A"})
+    s.flush()
+    again = store(tmp_path)
+    again.load()
+    again.save({"left": "B"})
+    again.flush()
+    assert json.loads(again.path.read_text(encoding="utf-8"))["_seq"] == 2
+
+
+def test_invalid_and_unknown_fields_fall_back(tmp_path):
+    path = tmp_path / "wlk_config.json"
+    path.write_text(json.dumps({"left": "Oud", "fs_main": "groot", "kleur": 1}), encoding="utf-8")
+    cfg, problems = SettingsStore(path).load()
+    assert cfg.left == "Oud"
+    assert cfg.fs_main == BrandConfig().fs_main
+    assert len(problems) == 2
+
+
+def test_missing_file_gives_defaults(tmp_path):
+    cfg, problems = store(tmp_path).load()
+    assert cfg == BrandConfig() and problems == []
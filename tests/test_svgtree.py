@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Serializer: ``to_string`` en ``write`` geven dezelfde, correct ge-escapete uitvoer."""
+
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from wlk.core import ALL_VARIANTS, BrandConfig
+from wlk.svgtree import El, Raw, to_string, write
+
+
+def test_escaping_in_attributes_and_text():
+    root = El("svg", {"data-x": 'a"b&c<d'}, [
+        El("text", {"x": 1}, ["R&D <b>"]),
+        El("style", None, [Raw("a{b:c}&amp;")]),
+        El("rect", {"fill": "50%"}),
+    ])
+    svg = to_string(root, declaration=False)
+    assert 'data-x="a&quot;b&amp;c&lt;d"' in svg
+    assert ">R&amp;D &lt;b&gt;</text>" in svg
+    assert "a{b:c}&amp;</style>" in svg
+    parsed = ET.fromstring(svg)
+    assert parsed.get("data-x") == 'a"b&c<d'
+    assert parsed.find("text").text == "R&D <b>"
+
+
+@pytest.mark.parametrize("indent", ["  ", None])
+def test_write_matches_to_string(indent):
+    cfg = BrandConfig(left="A&B", right='"Q"', instancing=True)
+    for fn in ALL_VARIANTS:
+        _, root = fn.build(cfg)
+        out = io.StringIO()
+        write(root, out, indent)
+        assert out.getvalue() == to_string(root, indent)
+        ET.fromstring(to_string(root, indent, declaration=False))
+
+
+def test_empty_root_and_leaf_children():
+    assert to_string(El("svg"), declaration=False) == "<svg/>\n"
+    assert to_string(El("g", None, [El("rect"), El("circle", {"r": 2})]), None, False) == '<g><rect/><circle r="2"/></g>'
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Updater: versievergelijking en veilig installeren van het GitHub-archief."""
+
+import io
+import zipfile
+
+import pytest
+
+pytest.importorskip("tkinter")
+from wlk.gui import _install_update_archive, _version_tuple  # noqa: E402
+
+PREFIX = "wlk-logo-designer-main/"
+
+
+def _archive(files):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, text in files.items():
+            zf.writestr(PREFIX + name, text)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def app_dir(tmp_path):
+    (tmp_path / "wlk").mkdir()
+    (tmp_path / "wlk" / "__init__.py").write_text("oud")
+    (tmp_path / "wlk" / "core.py").write_text("oud")
+    (tmp_path / "logo_designer.py").write_text("oud")
+    return tmp_path
+
+
+def _state(root):
+    return {str(p.relative_to(root)): p.read_text() for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def test_version_compare_is_numeric():
+    assert _version_tuple("1.10") > _version_tuple("1.9")
+    assert _version_tuple("0.8.10") > _version_tuple("0.8.2")
+    assert _version_tuple("1.0") == (1, 0)
+
+
+def test_install_replaces_launcher_and_package(app_dir):
+    _install_update_archive(_archive({"logo_designer.py": "nieuw", "wlk/__init__.py": "nieuw",
+                                      "wlk/server.py": "nieuw", "README.md": "genegeerd"}), app_dir)
+    assert _state(app_dir) == {"logo_designer.py": "nieuw", "wlk/__init__.py": "nieuw", "wlk/server.py": "nieuw"}
+
+
+@pytest.mark.parametrize("bad", ["wlk/../evil.py", "wlk/../../evil.py"])
+def test_path_outside_app_dir_is_rejected(app_dir, bad):
+    before = _state(app_dir)
+    data = _archive({"logo_designer.py": "nieuw", "wlk/__init__.py": "nieuw", bad: "kwaad"})
+    with pytest.raises(ValueError, match="onveilig"):
+        _install_update_archive(data, app_dir)
+    assert _state(app_dir) == before
+    assert not (app_dir.parent / "evil.py").exists()
+
+
+def test_incomplete_archive_is_rejected(app_dir):
+    before = _state(app_dir)
+    with pytest.raises(ValueError, match="wlk/__init__.py"):
+        _install_update_archive(_archive({"logo_designer.py": "nieuw", "wlk/core.py": "nieuw"}), app_dir)
+    assert _state(app_dir) == before
+
+
+def test_failed_swap_restores_old_version(app_dir, monkeypatch):
+    import os
+    real_replace = os.replace
+
+    def flaky(src, dst):
+        if str(dst).endswith("logo_designer.py") and "nieuw" in str(src):
+            raise OSError("schijf vol")
+        return real_replace(src, dst)
+
+    before = _state(app_dir)
+    monkeypatch.setattr("wlk.gui.os.replace", flaky)
+    with pytest.raises(OSError):
+        _install_update_archive(_archive({"logo_designer.py": "nieuw", "wlk/__init__.py": "nieuw"}), app_dir)
+    assert _state(app_dir) == before
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+sm0kez Logo Designer - pakket.
+
+Importeer de render-core via ``wlk.core``; de GUI (``wlk.gui``) laadt tkinter en
+wordt alleen geïmporteerd als de app daadwerkelijk gestart wordt.
+"""
+
+APP_VERSION = "0.8.2"
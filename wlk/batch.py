@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Headless batch render: alle varianten voor een CSV/JSONL bestand met BrandConfig-rijen."""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from wlk import fonts, registry
+from wlk.config import _svg_filename, config_from_dict
+from wlk.export import export_files
+from wlk.optimize import optimize_tree
+from wlk.svgtree import to_string
+
+
+def load_brand_rows(path):
+    """Leest BrandConfig-rijen uit een .csv of .jsonl bestand (lazy, rij voor rij)."""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            for n, row in enumerate(csv.DictReader(f), 1):
+                try: yield config_from_dict(row)
+                except ValueError as e: raise ValueError(path.name + " rij " + str(n) + ": " + str(e)) from None
+        else:
+            for n, line in enumerate(f, 1):
+                if not line.strip(): continue
+                try: yield config_from_dict(json.loads(line))
+                except ValueError as e: raise ValueError(path.name + " regel " + str(n) + ": " + str(e)) from None
+
+
+def fit_configs(configs):
+    """Verkleint per config ``fs_main`` zodat de hoofdtekst binnen ``out_width`` past."""
+    from wlk.fonts import fit_font_size, main_font
+    font = main_font()
+    for cfg in configs:
+        cfg.fs_main = fit_font_size(cfg, font=font)
+        yield cfg
+
+
+def _brand_dirname(row_no, cfg):
+    slug = re.sub(r"[^a-zA-Z0-9_-]", "_", cfg.left + cfg.right + cfg.tld).strip("_")
+    return str(row_no).zfill(4) + "_" + slug
+
+
+def _render_chunk(out_dir, chunk, png=False, optimize=None, incremental=False, cache_dir=None, variants=None):
+    """Worker: rendert alle varianten voor een chunk (rijnummer, cfg) en schrijft de SVG's weg
+    (met ``png=True`` ook een gerasterde PNG ernaast; ``optimize`` is de precisie voor
+    de optimalisatiestap, ``None`` = uit). Met ``incremental`` gaat het schrijven per merkmap
+    via het manifest van ``wlk.export``: ongewijzigde bestanden worden niet aangeraakt.
+    Met ``cache_dir`` worden SVG's eerst in de gedeelde ``DiskCache`` opgezocht; ``variants``
+    (functienamen) beperkt de render tot die varianten."""
+    if png:
+        from wlk.raster import svg_to_png
+    disk = None
+    if cache_dir is not None:
+        from wlk.cache import DiskCache, cache_key
+        disk = DiskCache(cache_dir or None)
+        extra = "" if optimize is None else "optimize=" + str(optimize)
+    indent = "  " if optimize is None else None
+    n_variants = 0
+    n_skipped = 0
+    errors = []
+    for row_no, cfg in chunk:
+        target = Path(out_dir) / _brand_dirname(row_no, cfg)
+        target.mkdir(parents=True, exist_ok=True)
+        files = []
+        for i, fn in enumerate(registry.variants()):
+            if variants is not None and fn.__name__ not in variants:
+                continue
+            try:
+                svg = None
+                if disk is not None:
+                    key = cache_key(fn, cfg, extra)
+                    hit = disk.get(key)
+                    if hit is not None:
+                        label, svg = hit[0], hit[1]
+                if svg is None:
+                    label, root = fn.build(cfg)
+                    if optimize is not None:
+                        optimize_tree(root, optimize)
+                    svg = to_string(root, indent)
+                    if disk is not None:
+                        disk.put(key, label, svg)
+                path = target / _svg_filename(i, label)
+                if incremental:
+                    files.append((path.name, svg))
+                    if png:
+                        files.append((path.with_suffix(".png").name, svg_to_png(svg)))
+                else:
+                    # Ook zonder PNG of cache als één string: streamen met ``svgtree.write`` is
+                    # bij deze documentgroottes trager en scheelt nauwelijks geheugen.
+                    path.write_text(svg, encoding="utf-8")
+                    if png:
+                        path.with_suffix(".png").write_bytes(svg_to_png(svg))
+            except Exception as e:
+                errors.append((row_no, fn.__name__, repr(e)))
+                continue
+            n_variants += 1
+        if files:
+            try:
+                n_skipped += export_files(target, files, workers=1).skipped
+            except OSError as e:
+                errors.append((row_no, "export", repr(e)))
+    return len(chunk), n_variants, n_skipped, errors
+
+
+def _chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@dataclass
+class BatchStats:
+    configs: int = 0
+    variants: int = 0
+    errors: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def configs_per_sec(self):
+        return self.configs / self.seconds if self.seconds else 0.0
+
+    @property
+    def variants_per_sec(self):
+        return self.variants / self.seconds if self.seconds else 0.0
+
+
+def run_batch(configs, out_dir, workers=None, chunk_size=16, log=print, png=False, optimize=None,
+              incremental=False, cache_dir=None, variants=None):
+    """Rendert alle varianten voor elke config, verdeeld over een ProcessPoolExecutor.
+
+    ``configs`` mag een iterator zijn: er staan maximaal ``2 * workers`` chunks tegelijk
+    uit, zodat grote invoerbestanden niet volledig in het geheugen geladen worden.
+    Met ``incremental`` worden alleen gewijzigde bestanden (atomisch) herschreven; met
+    ``cache_dir`` (``""`` = standaardmap) delen de workers een ``DiskCache``. ``variants`` is
+    een optionele verzameling functienamen; bestandsnamen blijven die van de volledige lijst.
+    De fonts worden één keer in dit proces gekozen en aan de workers doorgegeven, zodat elke
+    worker dezelfde metrics gebruikt en niet zelf hoeft te zoeken.
+    """
+    workers = workers or os.cpu_count() or 1
+    if variants is not None:
+        variants = frozenset(variants)
+    stats = BatchStats()
+    out_dir = str(out_dir)
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    if png:
+        from wlk.raster import can_render_text
+        if not can_render_text():
+            log("LET OP: geen TrueType-font met contouren gevonden; tekst ontbreekt in de PNG's")
+
+    def collect(result):
+        n_cfg, n_var, n_skip, errors = result
+        stats.configs += n_cfg
+        stats.variants += n_var
+        stats.skipped += n_skip
+        stats.errors += len(errors)
+        for row_no, name, msg in errors:
+            log("FOUT rij " + str(row_no) + " " + name + ": " + msg)
+
+    start = time.perf_counter()
+    chunks = _chunked(enumerate(configs, 1), chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            collect(_render_chunk(out_dir, chunk, png, optimize, incremental, cache_dir, variants))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=fonts.pin_fonts,
+                                 initargs=fonts.font_paths()) as pool:
+            pending = set()
+            for chunk in chunks:
+                pending.add(pool.submit(_render_chunk, out_dir, chunk, png, optimize, incremental,
+                                          cache_dir, variants))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done: collect(fut.result())
+            for fut in pending: collect(fut.result())
+    stats.seconds = time.perf_counter() - start
+    return stats
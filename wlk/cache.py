@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory LRU-cache voor gerenderde varianten, gesleuteld op (variant, BrandConfig-snapshot).
+
+Daarnaast wordt per variant bijgehouden welke BrandConfig-velden hij leest, zodat een
+regeneratie varianten kan overslaan waarvan geen enkel gelezen veld veranderd is.
+
+``DiskCache`` is de persistente laag eronder: content-addressed bestanden in een
+gedeelde map, zodat GUI, batch en server tussen sessies (en processen) resultaten delen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import fields
+from pathlib import Path
+
+from wlk import APP_VERSION
+from wlk.config import BrandConfig
+from wlk.export import atomic_write
+
+_FIELD_NAMES = [f.name for f in fields(BrandConfig)]
+
+
+class _FieldRecorder:
+    """Proxy rond een BrandConfig die registreert welke velden gelezen worden."""
+
+    __slots__ = ("_cfg", "reads")
+
+    def __init__(self, cfg):
+        self._cfg = cfg
+        self.reads = set()
+
+    def __getattr__(self, name):
+        self.reads.add(name)
+        return getattr(self._cfg, name)
+
+
+def render_tracked(fn, cfg):
+    """Rendert ``fn(cfg)`` en geeft ``(resultaat, gelezen velden)`` terug.
+
+    De velden gelden voor precies deze render: een veld dat niet gelezen werd kan de
+    uitvoer niet beïnvloeden zolang de gelezen velden dezelfde waarde houden.
+    """
+    rec = _FieldRecorder(cfg)
+    result = fn(rec)
+    return result, tuple(sorted(rec.reads))
+
+
+class _Measured:
+    """Laat ``render_tracked`` via ``RenderProfiler.measure`` renderen."""
+
+    __slots__ = ("fn", "profiler")
+
+    def __init__(self, fn, profiler):
+        self.fn = fn
+        self.profiler = profiler
+
+    def __call__(self, cfg):
+        return self.profiler.measure(self.fn, cfg)
+
+
+class RenderCache:
+    """Begrensde LRU-cache voor ``(label, svg)`` resultaten van variantfuncties.
+
+    De grootte wordt bewaakt in bytes (``sys.getsizeof`` van label en SVG); bij
+    overschrijding van ``max_bytes`` worden de minst recent gebruikte items verwijderd.
+    Thread-safe: het renderen zelf gebeurt buiten de lock. Met een ``profiler``
+    (``wlk.profiling.RenderProfiler``) wordt elke echte render gemeten.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk=None, profiler=None):
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self.profiler = profiler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries = OrderedDict()
+        self._fields = {}
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def render(self, fn, cfg):
+        return self._render(fn, cfg)[0]
+
+    def _render(self, fn, cfg):
+        key = (fn, cfg.snapshot())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[2]
+            self.misses += 1
+        hit = None
+        if self.disk is not None:
+            disk_key = cache_key(fn, cfg)
+            hit = self.disk.get(disk_key)
+        if hit is not None:
+            result, read = (hit[0], hit[1]), hit[2]
+        else:
+            profiler = self.profiler
+            result, read = render_tracked(fn if profiler is None else _Measured(fn, profiler), cfg)
+            if self.disk is not None:
+                self.disk.put(disk_key, result[0], result[1], read)
+        with self._lock:
+            self._fields[fn] = read
+        self.put(key, result, read)
+        return result, read
+
+    def render_incremental(self, fn, cfg):
+        """Als ``render``, maar hergebruikt het vorige resultaat van ``fn`` zonder cache-lookup
+        wanneer geen van de velden die het las veranderd is. Geeft ``(resultaat, overgeslagen)``.
+        GUI en server roepen dit vanuit meerdere threads aan; ``_last`` staat onder de lock.
+        """
+        with self._lock:
+            last = self._last.get(fn)
+        if last is not None:
+            read, values, result = last
+            if tuple(getattr(cfg, name) for name in read) == values:
+                return result, True
+        result, read = self._render(fn, cfg)
+        values = tuple(getattr(cfg, name) for name in read)
+        with self._lock:
+            self._last[fn] = (read, values, result)
+        return result, False
+
+    def fields_read(self, fn):
+        """Velden die ``fn`` bij zijn laatste echte render las (leeg als nog niet gerenderd)."""
+        with self._lock:
+            return self._fields.get(fn, ())
+
+    def put(self, key, result, read=None):
+        size = sys.getsizeof(result[0]) + sys.getsizeof(result[1])
+        if size > self.max_bytes:
+            return
+        if read is None:
+            read = tuple(_FIELD_NAMES)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (result, size, read)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[1]
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "entries": len(self._entries), "bytes": self._bytes}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# ─── PERSISTENTE CACHE ───
+_code_stamp = None
+
+
+def default_cache_dir():
+    """``$WLK_CACHE_DIR``, anders de gebruikerscache van het platform."""
+    env = os.environ.get("WLK_CACHE_DIR")
+    if env:
+        return Path(env)
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") \
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "wlk-logo-designer"
+
+
+def _stamp():
+    """APP_VERSION plus de hash van de render-code, zodat een lokaal aangepaste
+    ``core.py`` zonder versiebump geen oude resultaten teruggeeft. De gebruikte fontbestanden
+    tellen ook mee: strooi-layouts en contouren hangen van de metrics af."""
+    global _code_stamp
+    if _code_stamp is None:
+        h = hashlib.sha256(APP_VERSION.encode("utf-8"))
+        here = Path(__file__).resolve().parent
+        for name in ("core.py", "config.py", "svgtree.py", "outline.py", "scatter.py", "fonts.py"):
+            try:
+                h.update((here / name).read_bytes())
+            except OSError:
+                pass
+        from wlk.fonts import font_signature
+        h.update(font_signature().encode("utf-8"))
+        _code_stamp = h.digest()
+    return _code_stamp
+
+
+def cache_key(fn, cfg, extra=""):
+    """Hex-sleutel voor (app-versie, variantfunctie, alle BrandConfig-velden, ``extra``).
+    Plugin-varianten uit ``wlk.registry`` dragen de hash van hun bron mee in ``stamp``."""
+    h = hashlib.sha256(_stamp())
+    h.update(("\0" + fn.__module__ + "." + fn.__qualname__ + getattr(fn, "stamp", "") + "\0" + repr(cfg.snapshot())
+              + "\0" + extra).encode("utf-8"))
+    return h.hexdigest()
+
+
+class DiskCache:
+    """Content-addressed cache op schijf: ``<map>/ab/abcdef....svg`` per sleutel.
+
+    Elk bestand begint met een JSON-kopregel (label, gelezen velden), daarna volgt de SVG.
+    Schrijven gaat atomisch (tijdelijk bestand + rename), dus meerdere processen kunnen
+    dezelfde map tegelijk gebruiken: in het ergste geval rendert er een dubbel. Een hit
+    zet de mtime op nu; boven ``max_bytes`` verwijdert ``evict`` de oudste bestanden tot
+    80% van de grens. Slechts één proces tegelijk evict (lockbestand); fouten bij lezen of
+    schrijven maken van een hit een miss en worden verder genegeerd.
+    """
+
+    SUFFIX = ".svg"
+    LOCK_NAME = ".evict.lock"
+    LOCK_STALE = 60.0
+
+    def __init__(self, path=None, max_bytes=256 * 1024 * 1024):
+        self.path = Path(path) if path else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = None  # schatting; wordt bij de eerste put en bij elke evict geteld
+        self._lock = threading.Lock()
+
+    def _file(self, key):
+        return self.path / key[:2] / (key[2:] + self.SUFFIX)
+
+    def get(self, key):
+        """(label, svg, gelezen velden) of None."""
+        path = self._file(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                head = json.loads(f.readline())
+                svg = f.read()
+            label, read = head["label"], tuple(head.get("read") or _FIELD_NAMES)
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return label, svg, read
+
+    def put(self, key, label, svg, read=None):
+        head = json.dumps({"label": label, "read": list(read) if read else None}, ensure_ascii=False)
+        data = (head + "\n" + svg).encode("utf-8")
+        path = self._file(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, data)
+        except OSError:
+            return
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._scan_bytes()
+            else:
+                self._bytes += len(data)
+            over = self._bytes > self.max_bytes
+        if over:
+            self.evict()
+
+    def _entries(self):
+        try:
+            subdirs = [e.path for e in os.scandir(self.path) if e.is_dir()]
+        except OSError:
+            return
+        for sub in subdirs:
+            try:
+                with os.scandir(sub) as it:
+                    for e in it:
+                        if e.name.endswith(self.SUFFIX):
+                            try:
+                                st = e.stat()
+                            except OSError:
+                                continue
+                            yield e.path, st.st_size, st.st_mtime
+            except OSError:
+                continue
+
+    def _scan_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Verwijdert de minst recent gebruikte bestanden tot 80% van ``max_bytes``."""
+        lock = self.path / self.LOCK_NAME
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(lock).st_mtime > self.LOCK_STALE:
+                    os.unlink(lock)  # achtergelaten door een gecrasht proces
+            except OSError:
+                pass
+            return 0
+        except OSError:
+            return 0
+        removed = 0
+        try:
+            os.close(fd)
+            entries = sorted(self._entries(), key=lambda e: e[2])
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes * 0.8
+            for path, size, _ in entries:
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            with self._lock:
+                self._bytes = total
+                self.evictions += removed
+        finally:
+            try:
+                os.unlink(lock)
+            except OSError:
+                pass
+        return removed
+
+    def clear(self):
+        for path, _, _ in list(self._entries()):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "bytes": self._bytes, "path": str(self.path)}
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+BrandConfig, het inlezen ervan uit CSV/JSON, de formaat-presets en de bestandsnaam per
+variant: alles wat instellingen, profielen, cache en GUI nodig hebben zonder render-code.
+
+``wlk.core`` importeert dit module en exporteert dezelfde namen.
+"""
+
+from __future__ import annotations
+
+import re
+import typing
+from dataclasses import dataclass, fields
+
+FONT_STACK = '"Black Ops One", Impact, "Arial Black", Arial, sans-serif'
+
+
+@dataclass
+class BrandConfig:
+    left: str = "LEFT"
+    right: str = "RIGHT"
+    tld: str = ".COM"
+    tagline: str = "YOUR TAGLINE APPEARS HERE"
+    color_dark: str = "#1b1b1b"
+    color_red: str = "#e30613"
+    color_gold: str = "#ffce00"
+    color_white: str = "#ffffff"
+    color_grey: str = "#666666"
+    bg_dark: str = "#111111"
+    font_stack: str = FONT_STACK
+    tld_scale: float = 0.44
+    word_gap: int = 0
+    tld_gap: int = 0
+    letter_spacing: float = 0
+    icon_offset_x: int = 0
+    icon_offset_y: int = 0
+    icon_scale: float = 1.0
+    out_width: int = 1200
+    out_height: int = 140
+    fs_main: int = 96
+    instancing: bool = False  # herhaalde decoraties als <symbol>/<pattern> + <use>
+    text_outlines: bool = False  # tekst als <path>-contouren uit een lokaal font, zonder webfont
+
+    def snapshot(self):
+        """Hashbare, bevroren momentopname van alle velden (cache-sleutel)."""
+        return tuple(getattr(self, name) for name in _FIELD_TYPES)
+
+
+# Typen uit de annotaties, niet uit de standaardwaarde: ``letter_spacing: float = 0`` blijft float.
+_HINTS = typing.get_type_hints(BrandConfig)
+_FIELD_TYPES = {f.name: _HINTS[f.name] for f in fields(BrandConfig)}
+_BOOL_STRINGS = {"1": True, "true": True, "ja": True, "yes": True,
+                 "0": False, "false": False, "nee": False, "no": False}
+
+
+def config_from_dict(d):
+    """Bouwt een BrandConfig uit een dict (CSV/JSON); lege en onbekende velden worden overgeslagen."""
+    cfg = BrandConfig()
+    for k, v in d.items():
+        ftype = _FIELD_TYPES.get(k)
+        if ftype is None or v is None or v == "":
+            continue
+        try:
+            if ftype is int:
+                v = int(float(v))
+            elif ftype is bool:
+                v = _BOOL_STRINGS[str(v).strip().lower()]
+            else:
+                v = ftype(v)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("ongeldige waarde voor '" + k + "': " + repr(v)) from None
+        setattr(cfg, k, v)
+    return cfg
+
+
+DIMENSION_PRESETS = [
+    ("Website header (lagerkoning.nl)", 400, 80, 62),
+    ("Website header groot", 800, 120, 96),
+    ("Walzlagerkoenig.de (breed)", 1200, 140, 96),
+    ("Social media banner", 1500, 200, 140),
+    ("Favicon / icoon", 200, 200, 60),
+    ("Visitekaartje", 600, 100, 78),
+    ("Groot / print", 2400, 350, 220),
+]
+
+
+def _svg_filename(i, label):
+    return str(i + 1).zfill(2) + "_" + re.sub(r"[^a-zA-Z0-9_-]", "_", label) + ".svg"
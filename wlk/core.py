@@ -0,0 +1,720 @@
+# -*- coding: utf-8 -*-
+"""
+Render-core van de sm0kez Logo Designer: SVG helpers, varianten en HTML builders.
+
+Deze module importeert bewust geen tkinter, webbrowser of urllib, zodat batch-workers
+en server-processen snel en zonder display kunnen starten. ``BrandConfig`` en de presets
+staan in ``wlk.config``, zodat de GUI pas bij de eerste render deze module hoeft te laden.
+"""
+
+from __future__ import annotations
+
+import functools
+import html as html_mod
+import math
+import random
+
+from .config import (  # noqa: F401 - ook als ``wlk.core.BrandConfig`` enz.
+    DIMENSION_PRESETS, FONT_STACK, BrandConfig, _svg_filename, config_from_dict,
+)
+from .fonts import main_font, main_text_width
+from .scatter import scaled_count, scatter
+from .svgtree import SVG_NS, XLINK_NS, El, Raw, to_string
+
+GOOGLE_FONT_NAME = "Black Ops One"
+GOOGLE_FONT_IMPORT = '@import url("https://fonts.googleapis.com/css2?family=Black+Ops+One&amp;display=swap");'
+
+
+def _variant(build=None, **meta):
+    """Maakt van een boom-bouwer een variant: ``fn(c)`` geeft (label, svg-tekst), ``fn.build(c)`` (label, El).
+
+    Ook als ``@_variant(elements=..., season=..., label=...)``: ``wlk.registry`` leest die
+    metadata (als letterlijke waarden) uit de broncode, zonder de module te importeren.
+    """
+    if build is None:
+        return lambda b: _variant(b, **meta)
+
+    @functools.wraps(build)
+    def render(c):
+        label, root = build(c)
+        return (label, to_string(root))
+    render.build = build
+    render.meta = meta
+    return render
+
+
+variant = _variant  # publieke naam voor plugins
+
+
+def _wrap(cfg, w, h, body, extra_defs=()):
+    ls = cfg.letter_spacing
+    defs = El("defs", None, list(extra_defs))
+    outlined = False
+    if cfg.text_outlines:
+        from .outline import outline_text
+        outlined = outline_text(body, ls)  # zonder font met outlines blijven tekst en @import staan
+    if not outlined:
+        css = '.w{font-family:' + cfg.font_stack + ';font-weight:400'
+        if ls != 0:
+            css += ';letter-spacing:' + str(ls) + 'px'
+        css += '}.tag{font-family:Arial, Helvetica, sans-serif;font-weight:600}'
+        defs.children.insert(0, El("style", None, [Raw(GOOGLE_FONT_IMPORT), css]))
+    attrs = {"xmlns": SVG_NS}
+    if any(d.tag == "symbol" for d in extra_defs):
+        attrs["xmlns:xlink"] = XLINK_NS  # voor ``xlink:href`` op de <use>-elementen
+    attrs.update({"viewBox": "0 0 " + str(w) + " " + str(h), "width": w, "height": h})
+    return El("svg", attrs, ([defs] if defs.children else []) + body)
+
+
+def _main_text(cfg, x, baseline_y, extra_attrs=None):
+    return _main_text_colors(cfg, x, baseline_y, cfg.color_dark, cfg.color_red, cfg.color_dark, extra_attrs)
+
+
+def _main_text_colors(cfg, x, baseline_y, left_color, right_color, tld_color, extra_attrs=None):
+    fs = cfg.fs_main
+    ft = int(fs * cfg.tld_scale)
+    wg = cfg.word_gap
+    tg = cfg.tld_gap
+    attrs = {"x": x, "y": baseline_y, "class": "w", "font-size": fs}
+    if extra_attrs:
+        attrs.update(extra_attrs)
+    right = {"fill": right_color}
+    if wg != 0:
+        right["dx"] = wg
+    tld = {"fill": tld_color, "font-size": ft}
+    if tg != 0:
+        tld["dx"] = tg
+    # De losse spaties tussen de tspans zijn de witruimte die de browser rendert.
+    return El("text", attrs, [
+        El("tspan", {"fill": left_color}, [cfg.left]), " ",
+        El("tspan", right, [cfg.right]), " ",
+        El("tspan", tld, [cfg.tld]),
+    ])
+
+
+def _baseline(cfg):
+    return int(cfg.out_height * 0.5 + cfg.fs_main * 0.35)
+
+
+def _text_box(cfg, x, baseline_y, pad=0):
+    """Omhullende rechthoek (x0, y0, x1, y1) van ``_main_text`` volgens de glyph-metrics.
+
+    Het font komt uit ``wlk.fonts`` (vastgezet of meegeleverd, nooit een systeemfont), dus de
+    strooi-layouts die dit vak vermijden zijn op elke machine gelijk."""
+    font = main_font()
+    return (int(x - pad), int(baseline_y - font.ascent(cfg.fs_main) - pad),
+            int(x + main_text_width(cfg, font) + pad), int(baseline_y + font.descent(cfg.fs_main) + pad))
+
+
+def _icon(x, y, scale, child):
+    return El("g", {"transform": "translate(" + str(x) + " " + str(y) + ") scale(" + str(scale) + ")"}, [child])
+
+
+def _rect(x, y, w, h, fill, **extra):
+    attrs = {"x": x, "y": y, "width": w, "height": h, "fill": fill}
+    attrs.update(extra)
+    return El("rect", attrs)
+
+
+def _bg(w, h, fill):
+    return El("rect", {"width": w, "height": h, "fill": fill})
+
+
+def _symbol(sym_id, children):
+    # Iconen zijn rond (0, 0) getekend; zonder overflow zou de symbol-viewport ze afknippen.
+    return El("symbol", {"id": sym_id, "overflow": "visible"}, children)
+
+
+def _use(sym_id, x, y, scale=None, attrs=None):
+    transform = "translate(" + str(x) + " " + str(y) + ")"
+    if scale is not None:
+        transform += " scale(" + str(scale) + ")"
+    # SVG 2 leest ``href``, oudere viewers (Inkscape 0.92, librsvg < 2.52) alleen ``xlink:href``.
+    el = El("use", {"href": "#" + sym_id, "xlink:href": "#" + sym_id, "transform": transform})
+    if attrs:
+        el.attrs.update(attrs)
+    return el
+
+
+# ─── SVG ICON HELPERS ───────────────────────────────────
+
+def _crown_svg(fill, size=108):
+    s = size / 108.0
+    points = (str(int(0*s)) + ',' + str(int(70*s)) + ' ' +
+              str(int(18*s)) + ',' + str(int(30*s)) + ' ' +
+              str(int(36*s)) + ',' + str(int(70*s)) + ' ' +
+              str(int(54*s)) + ',' + str(int(20*s)) + ' ' +
+              str(int(72*s)) + ',' + str(int(70*s)) + ' ' +
+              str(int(90*s)) + ',' + str(int(30*s)) + ' ' +
+              str(int(108*s)) + ',' + str(int(70*s)) + ' ' +
+              str(int(108*s)) + ',' + str(int(92*s)) + ' ' +
+              str(int(0*s)) + ',' + str(int(92*s)))
+    g = El("g", {"fill": fill}, [El("polygon", {"points": points})])
+    for cx, cy in [(18, 30), (54, 20), (90, 30)]:
+        g.add(El("circle", {"cx": int(cx*s), "cy": int(cy*s), "r": int(6*s)}))
+    return g
+
+
+def _bearing_svg(stroke, accent):
+    balls = El("g", {"fill": accent})
+    for cx, cy in [(36,0),(25.5,25.5),(0,36),(-25.5,25.5),(-36,0),(-25.5,-25.5),(0,-36),(25.5,-25.5)]:
+        balls.add(El("circle", {"cx": cx, "cy": cy, "r": 6}))
+    return El("g", None, [
+        El("circle", {"r": 52, "fill": "none", "stroke": stroke, "stroke-width": 10}),
+        El("circle", {"r": 24, "fill": "none", "stroke": stroke, "stroke-width": 10}),
+        balls,
+    ])
+
+
+def _star_svg(cx, cy, r_out, r_in, points_n, fill, opacity="1"):
+    pts = []
+    for i in range(points_n * 2):
+        angle = math.pi * i / points_n - math.pi / 2
+        r = r_out if i % 2 == 0 else r_in
+        px = cx + r * math.cos(angle)
+        py = cy + r * math.sin(angle)
+        pts.append(str(round(px, 1)) + "," + str(round(py, 1)))
+    return El("polygon", {"points": " ".join(pts), "fill": fill, "opacity": opacity})
+
+
+def _snowflake_parts(s):
+    parts = [El("rect", {"x": -s//16, "y": -s//2, "width": max(1, s//8), "height": s,
+                         "rx": 1, "transform": "rotate(" + str(angle) + ")"}) for angle in [0, 60, 120]]
+    parts.append(El("circle", {"r": max(1, s//6)}))
+    return parts
+
+
+def _snowflake_svg(cx, cy, size, fill="#ffffff", opacity="0.8"):
+    return El("g", {"transform": "translate(" + str(cx) + " " + str(cy) + ")", "fill": fill, "opacity": opacity},
+              _snowflake_parts(size))
+
+
+def _heart_svg(cx, cy, size, fill="#e30613", opacity="1"):
+    s = size / 30.0
+    d = ('M' + str(cx) + ' ' + str(cy + int(8*s)) +
+         ' C' + str(cx) + ' ' + str(cy + int(3*s)) +
+         ' ' + str(cx - int(15*s)) + ' ' + str(cy - int(8*s)) +
+         ' ' + str(cx) + ' ' + str(cy - int(15*s)) +
+         ' C' + str(cx + int(15*s)) + ' ' + str(cy - int(8*s)) +
+         ' ' + str(cx) + ' ' + str(cy + int(3*s)) +
+         ' ' + str(cx) + ' ' + str(cy + int(8*s)) + 'Z')
+    return El("path", {"d": d, "fill": fill, "opacity": opacity})
+
+
+def _firework_svg(cx, cy, r, fill, n=12):
+    rays = El("g", {"stroke": fill, "stroke-width": 2, "opacity": "0.9"})
+    for i in range(n):
+        angle = 2 * math.pi * i / n
+        rays.add(El("line", {"x1": cx + int(r * 0.3 * math.cos(angle)), "y1": cy + int(r * 0.3 * math.sin(angle)),
+                             "x2": cx + int(r * math.cos(angle)), "y2": cy + int(r * math.sin(angle))}))
+    return [rays, El("circle", {"cx": cx, "cy": cy, "r": 3, "fill": fill})]
+
+
+def _mijter_svg(size=60):
+    s = size
+    w = int(s * 0.8)
+    h = s
+    bh = max(4, int(h * 0.18))
+    cx = w // 2
+    return El("g", None, [
+        El("path", {"d": "M0," + str(h) + " L" + str(w//2) + ",0 L" + str(w) + "," + str(h) + " Z", "fill": "#e30613"}),
+        _rect(0, h - bh, w, bh, "#ffce00"),
+        El("line", {"x1": cx, "y1": int(h*0.15), "x2": cx, "y2": h - bh, "stroke": "#ffce00", "stroke-width": 3}),
+        El("line", {"x1": int(cx - w*0.2), "y1": int(h*0.45), "x2": int(cx + w*0.2), "y2": int(h*0.45),
+                    "stroke": "#ffce00", "stroke-width": 3}),
+    ])
+
+
+def _pumpkin_svg(size=50):
+    r = size // 2
+    ey = int(-r * 0.2)
+    my = int(r * 0.2)
+    return El("g", None, [
+        El("ellipse", {"cx": 0, "cy": 0, "rx": r, "ry": int(r*0.8), "fill": "#FF6600"}),
+        El("ellipse", {"cx": 0, "cy": 0, "rx": int(r*0.6), "ry": int(r*0.8), "fill": "none",
+                       "stroke": "#E55500", "stroke-width": 2}),
+        _rect(-3, int(-r*0.8 - 10), 6, 12, "#2d8a4e", rx=2),
+        El("polygon", {"points": str(-r//3) + ',' + str(ey) + ' ' + str(-r//3 + 5) + ',' + str(ey - 10) + ' ' +
+                                 str(-r//3 + 10) + ',' + str(ey), "fill": "#1a0a2e"}),
+        El("polygon", {"points": str(r//3 - 10) + ',' + str(ey) + ' ' + str(r//3 - 5) + ',' + str(ey - 10) + ' ' +
+                                 str(r//3) + ',' + str(ey), "fill": "#1a0a2e"}),
+        El("path", {"d": "M" + str(-r//3) + " " + str(my) + " Q0 " + str(my + 12) + " " + str(r//3) + " " + str(my),
+                    "fill": "#1a0a2e"}),
+    ])
+
+
+def _christmas_tree_svg(size=80):
+    s = size
+    g = El("g")
+    for yw, yh, xw in [(0.0, 0.35, 0.3), (0.2, 0.55, 0.45), (0.4, 0.75, 0.6)]:
+        y_top = int(-s * (1.0 - yw))
+        y_bot = int(-s * (1.0 - yh))
+        half_w = int(s * xw * 0.5)
+        g.add(El("polygon", {"points": "0," + str(y_top) + " " + str(-half_w) + "," + str(y_bot) + " " +
+                                       str(half_w) + "," + str(y_bot), "fill": "#2d8a4e"}))
+    tw = max(4, int(s * 0.12))
+    th = max(6, int(s * 0.15))
+    g.add(_rect(-tw//2, int(-s*0.25), tw, th, "#8B4513"))
+    g.add(_star_svg(0, int(-s), max(4, int(s*0.12)), max(2, int(s*0.05)), 5, "#ffce00"))
+    for bx, by in [(-8, int(-s*0.5)), (10, int(-s*0.35)), (-5, int(-s*0.65))]:
+        g.add(El("circle", {"cx": bx, "cy": by, "r": 3, "fill": "#e30613"}))
+    return g
+
+
+def _egg_svg(w_r, h_r, fill, stripe_color="#ffffff"):
+    """Paasei; met ``fill=None`` erft de eivorm de kleur (voor een gedeeld ``<symbol>``)."""
+    body = {"cx": 0, "cy": 0, "rx": w_r, "ry": h_r}
+    if fill is not None:
+        body["fill"] = fill
+    return El("g", None, [
+        El("ellipse", body),
+        El("line", {"x1": -w_r+2, "y1": 0, "x2": w_r-2, "y2": 0, "stroke": stripe_color, "stroke-width": 2}),
+        El("line", {"x1": -w_r+4, "y1": -h_r//3, "x2": w_r-4, "y2": -h_r//3, "stroke": stripe_color,
+                    "stroke-width": 1.5, "opacity": "0.6"}),
+    ])
+
+
+def _diamond(px, py, ds):
+    points = (str(px) + ',' + str(py) + ' ' +
+              str(px + ds) + ',' + str(py + ds) + ' ' +
+              str(px) + ',' + str(py + ds * 2) + ' ' +
+              str(px - ds) + ',' + str(py + ds))
+    return El("polygon", {"points": points, "fill": "#ffffff", "opacity": "0.2"})
+
+
+def _diamonds_path(tops, ds):
+    """Dezelfde ruiten als ``_diamond`` (bovenste hoekpunten ``tops``) in één path."""
+    d = ""
+    for px, py in tops:
+        d += ("M" + str(px) + " " + str(py) + "L" + str(px + ds) + " " + str(py + ds) + " " +
+              str(px) + " " + str(py + ds * 2) + " " + str(px - ds) + " " + str(py + ds) + "Z")
+    return El("path", {"d": d, "fill": "#ffffff", "opacity": "0.2"})
+
+
+# ─── VARIANTS 01-19 ─────────────────────────────────────
+
+@_variant(elements=7)
+def v01_basic(c):
+    m = 24
+    by = _baseline(c)
+    body = [_main_text(c, m, by)]
+    return ("01 - Basis", _wrap(c, c.out_width, c.out_height, body))
+
+
+@_variant(elements=10)
+def v02_flag(c):
+    m = 24
+    h = c.out_height + 30
+    by = _baseline(c)
+    uw = c.out_width - 2 * m
+    y0 = by + 20
+    body = [
+        _main_text(c, m, by),
+        _rect(m, y0, uw, 5, "#000"),
+        _rect(m, y0 + 6, uw, 5, "#dd0000"),
+        _rect(m, y0 + 12, uw, 5, c.color_gold),
+    ]
+    return ("02 - Duitse vlag-underline", _wrap(c, c.out_width, h, body))
+
+
+@_variant(elements=13)
+def v04_crown(c):
+    m = 24
+    icon_h = int(70 * c.icon_scale)
+    gap = 10
+    extra_top = icon_h + gap
+    h = c.out_height + extra_top
+    by = extra_top + _baseline(c)
+    crown_w = int(108 * c.icon_scale)
+    cx = c.out_width // 2 - crown_w // 2 + c.icon_offset_x
+    cy = 5 + c.icon_offset_y
+    body = [
+        _icon(cx, cy, c.icon_scale, _crown_svg(c.color_red)),
+        _main_text(c, m, by),
+    ]
+    return ("03 - Met kroon", _wrap(c, c.out_width, h, body))
+
+
+@_variant(elements=20)
+def v05_bearing(c):
+    m = 24
+    icon_r = int(55 * c.icon_scale)
+    icon_cx = m + icon_r + 10 + c.icon_offset_x
+    icon_cy = c.out_height // 2 + c.icon_offset_y
+    shift = icon_r * 2 + 30
+    by = _baseline(c)
+    w = c.out_width + shift
+    body = [
+        _icon(icon_cx, icon_cy, c.icon_scale, _bearing_svg(c.color_dark, c.color_red)),
+        _main_text(c, m + shift, by),
+    ]
+    return ("04 - Met lager-icoon", _wrap(c, w, c.out_height, body))
+
+
+@_variant(elements=10)
+def v08_mono(c):
+    m = 24
+    by = _baseline(c)
+    bw = int(c.out_height * 0.85)
+    bh = bw
+    mono = (c.left[:1] + c.right[:1]).upper()
+    shift = bw + 20
+    box_y = (c.out_height - bh) // 2
+    w = c.out_width + shift
+    box = El("g", {"transform": "translate(" + str(m) + " " + str(box_y) + ")"}, [
+        El("rect", {"width": bw, "height": bh, "rx": 12, "fill": c.color_red}),
+        El("text", {"x": bw//2, "y": int(bh*0.72), "text-anchor": "middle", "class": "w",
+                    "font-size": int(bh*0.55), "fill": c.color_white}, [mono]),
+    ])
+    body = [box, _main_text(c, m + shift, by)]
+    return ("05 - Monogram", _wrap(c, w, c.out_height, body))
+
+
+@_variant(elements=8)
+def v09_invert(c):
+    m = 24
+    by = _baseline(c)
+    body = [
+        _bg(c.out_width, c.out_height, c.bg_dark),
+        _main_text_colors(c, m, by, c.color_white, c.color_red, c.color_white),
+    ]
+    return ("06 - Inverted (donker)", _wrap(c, c.out_width, c.out_height, body))
+
+
+@_variant(elements=8)
+def v10_diagonal(c):
+    m = 24
+    by = _baseline(c)
+    sk = 35
+    ps = int(c.out_width * 0.50)
+    pe = c.out_width
+    h = c.out_height
+    points = str(ps) + ",0 " + str(pe) + ",0 " + str(pe) + "," + str(h) + " " + str(ps-sk) + "," + str(h)
+    body = [
+        El("polygon", {"points": points, "fill": c.color_red}),
+        _main_text_colors(c, m, by, c.color_dark, c.color_white, c.color_white),
+    ]
+    return ("07 - Diagonaal paneel", _wrap(c, c.out_width, c.out_height, body))
+
+
+@_variant(elements=52)
+def v11_christmas(c):
+    m = 24
+    icon_zone = int(90 * c.icon_scale)
+    h = c.out_height + icon_zone
+    by = icon_zone + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    body = [_bg(w, h, "#1a3a1a")]
+    defs = []
+    if c.instancing:
+        defs.append(_symbol("v11-sneeuw", _snowflake_parts(20)))
+    for sx, sy, ss in [(80,20,18),(250,40,12),(450,15,20),(650,35,14),(850,10,16),(1050,25,10)]:
+        if sx < w:
+            if c.instancing:
+                body.append(_use("v11-sneeuw", sx, sy, ss / 20.0, {"fill": "#ffffff", "opacity": "0.4"}))
+            else:
+                body.append(_snowflake_svg(sx, sy, ss, "#ffffff", "0.4"))
+    tree_x = w // 2 + c.icon_offset_x
+    tree_y = icon_zone - 5 + c.icon_offset_y
+    body.append(_icon(tree_x, tree_y, c.icon_scale, _christmas_tree_svg(70)))
+    body.append(_star_svg(w - 80, 25, 14, 6, 5, "#ffce00", "0.9"))
+    body.append(_star_svg(w - 40, 50, 8, 3, 5, "#ffce00", "0.6"))
+    body.append(_star_svg(100, 35, 10, 4, 5, "#ffce00", "0.7"))
+    body.append(_main_text_colors(c, m, by, "#ffffff", "#e30613", "#ffce00"))
+    body.append(_rect(m, h - 6, w - 2*m, 4, "#ffce00", rx=2))
+    return ("08 - \U0001f384 Kerst / Weihnachten", _wrap(c, w, h, body, defs))
+
+
+@_variant(elements=23)
+def v12_sinterklaas(c):
+    m = 24
+    icon_zone = int(80 * c.icon_scale)
+    h = c.out_height + icon_zone + 20
+    by = icon_zone + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    body = [_bg(w, h, "#8B0000")]
+    mijter_x = w // 2 - int(24 * c.icon_scale) + c.icon_offset_x
+    mijter_y = 8 + c.icon_offset_y
+    body.append(_icon(mijter_x, mijter_y, c.icon_scale, _mijter_svg(60)))
+    mijter_box = (mijter_x - 8, mijter_y - 8, mijter_x + int(48 * c.icon_scale) + 8,
+                  mijter_y + int(60 * c.icon_scale) + 8)
+    for px, py in scatter(55, (m, 5, w - m, icon_zone - 5), scaled_count(8, w), 14, (mijter_box,)):
+        body.append(El("circle", {"cx": px, "cy": py, "r": 6, "fill": "#D2691E", "opacity": "0.6"}))
+    body.append(_main_text_colors(c, m, by, "#ffffff", "#ffce00", "#ffffff"))
+    body.append(_rect(0, h - 6, w, 6, "#ffce00"))
+    return ("09 - \U0001f385 Sinterklaas (NL)", _wrap(c, w, h, body))
+
+
+@_variant(elements=17)
+def v13_koningsdag(c):
+    m = 24
+    icon_zone = int(75 * c.icon_scale)
+    h = c.out_height + icon_zone
+    by = icon_zone + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    crown_w = int(108 * c.icon_scale)
+    cx = w // 2 - crown_w // 2 + c.icon_offset_x
+    cy = 5 + c.icon_offset_y
+    body = [
+        _bg(w, h, "#FF6600"),
+        _icon(cx, cy, c.icon_scale * 0.7, _crown_svg("#ffffff")),
+        _main_text_colors(c, m, by, "#ffffff", c.color_dark, "#ffffff"),
+        _rect(0, h - 9, w, 3, "#AE1C28"),
+        _rect(0, h - 6, w, 3, "#FFFFFF"),
+        _rect(0, h - 3, w, 3, "#21468B"),
+    ]
+    return ("10 - \U0001f451 Koningsdag (NL)", _wrap(c, w, h, body))
+
+
+@_variant(elements=47)
+def v14_easter(c):
+    m = 24
+    icon_zone = int(60 * c.icon_scale)
+    h = c.out_height + icon_zone
+    by = icon_zone + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    body = [_bg(w, h, "#f0f8e8")]
+    defs = [_symbol("v14-ei", [_egg_svg(12, 16, None)])] if c.instancing else []
+    egg_colors = ["#e30613", "#ffce00", "#4CAF50", "#2196F3", "#FF9800", "#9C27B0"]
+    egg_spacing = w // 8
+    for i in range(6):
+        ex = egg_spacing + i * egg_spacing + c.icon_offset_x
+        ey = icon_zone // 2 + ((-1)**i * 8) + c.icon_offset_y
+        if c.instancing:
+            body.append(_use("v14-ei", ex, ey, c.icon_scale * 0.8, {"fill": egg_colors[i]}))
+        else:
+            body.append(_icon(ex, ey, c.icon_scale * 0.8, _egg_svg(12, 16, egg_colors[i])))
+    for fx, fy in [(100, icon_zone - 10), (400, icon_zone - 8), (700, icon_zone - 12), (1000, icon_zone - 9)]:
+        if fx < w:
+            body.append(El("circle", {"cx": fx, "cy": fy, "r": 5, "fill": "#FFD700"}))
+            body.append(El("circle", {"cx": fx, "cy": fy, "r": 2.5, "fill": "#FF6347"}))
+    body.append(_rect(0, icon_zone - 4, w, 4, "#4CAF50", opacity="0.5", rx=2))
+    body.append(_main_text(c, m, by))
+    return ("11 - \U0001f423 Pasen / Ostern", _wrap(c, w, h, body, defs))
+
+
+@_variant(elements=23)
+def v15_valentine(c):
+    m = 24
+    h = c.out_height + 10
+    by = _baseline(c) + 5
+    w = c.out_width
+    body = [_bg(w, h, "#fff0f3")]
+    rng = random.Random(14)
+    text = _text_box(c, m, by, 11)
+    for hx, hy in scatter(14, (10, 5, w - 10, h - 5), scaled_count(15, w), 24, (text,)):
+        hs = rng.randint(10, 22)
+        op = str(round(rng.uniform(0.15, 0.4), 2))
+        body.append(_heart_svg(hx, hy, hs, "#e30613", op))
+    body.append(_main_text_colors(c, m, by, c.color_dark, "#e30613", c.color_dark))
+    return ("12 - \u2764\ufe0f Valentijnsdag", _wrap(c, w, h, body))
+
+
+@_variant(elements=85)
+def v16_newyear(c):
+    m = 24
+    icon_zone = int(60 * c.icon_scale)
+    h = c.out_height + icon_zone
+    by = icon_zone + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    body = [_bg(w, h, "#0a0a2e")]
+    fw_data = [(120, 25, 30, "#ffce00"), (350, 35, 35, "#e30613"),
+               (600, 20, 28, "#4fc3f7"), (850, 30, 32, "#ff9800"),
+               (1050, 25, 25, "#ab47bc")]
+    for fx, fy, fr, fc in fw_data:
+        if fx < w:
+            body.extend(_firework_svg(fx + c.icon_offset_x, fy + c.icon_offset_y, int(fr * c.icon_scale), fc))
+    defs = [_symbol("v16-ster", [_star_svg(0, 0, 3, 1.5, 4, "#ffffff")])] if c.instancing else []
+    for sx, sy in [(50,15),(250,8),(450,18),(700,5),(900,12),(1100,20)]:
+        if sx < w:
+            if c.instancing:
+                body.append(_use("v16-ster", sx, sy, None, {"opacity": "0.6"}))
+            else:
+                body.append(_star_svg(sx, sy, 3, 1.5, 4, "#ffffff", "0.6"))
+    body.append(_main_text_colors(c, m, by, "#ffffff", "#ffce00", "#ffffff"))
+    body.append(_rect(m, h - 4, w - 2*m, 3, "#ffce00", rx=1))
+    return ("13 - \U0001f386 Oud & Nieuw / Silvester", _wrap(c, w, h, body, defs))
+
+
+@_variant(elements=11)
+def v17_einheit(c):
+    m = 24
+    flag_h = 24
+    flag_total = flag_h * 3
+    gap = 10
+    h = c.out_height + flag_total + gap + 40
+    by = flag_total + gap + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    body = [
+        _rect(0, 0, w, flag_h, "#000000"),
+        _rect(0, flag_h, w, flag_h, "#DD0000"),
+        _rect(0, flag_h * 2, w, flag_h, "#FFCE00"),
+        _main_text(c, m, by),
+        El("text", {"x": m, "y": by + 35, "class": "tag", "font-size": 22, "fill": c.color_grey},
+           ["Tag der Deutschen Einheit - 3. Oktober"]),
+    ]
+    return ("14 - \U0001f1e9\U0001f1ea Tag der Deutschen Einheit", _wrap(c, w, h, body))
+
+
+@_variant(elements=122)
+def v18_oktoberfest(c):
+    m = 24
+    h = c.out_height + 20
+    by = _baseline(c) + 10
+    w = c.out_width
+    body = [_bg(w, h, "#0066B3")]
+    ds = 16
+    defs = []
+    if c.instancing:
+        # Eén tegel (2*ds breed) die een rect over de hele breedte herhaalt: het aantal
+        # elementen groeit niet meer met out_width. De ruiten op de tegelrand vallen in twee
+        # helften uiteen; elk helftenpaar is één path, zodat ze samen gevuld worden en de
+        # tegelrand geen naad geeft. Onder de drie rijen is de tegel leeg en daar loopt de
+        # rect af, zodat de anti-aliasing van de rect-rand geen ruitpunten raakt; rechts
+        # loopt hij net als de losse ruiten (``px < w + ds``) tot voorbij de rand.
+        tile = [_diamonds_path([(0, 0), (ds * 2, 0)], ds), _diamond(ds, ds, ds),
+                _diamonds_path([(0, ds * 2), (ds * 2, ds * 2)], ds)]
+        defs.append(El("pattern", {"id": "v18-ruit", "patternUnits": "userSpaceOnUse",
+                                   "width": ds * 2, "height": ds * 5}, tile))
+        body.append(_rect(0, 0, w + ds, ds * 4 + ds // 2, "url(#v18-ruit)"))
+    else:
+        for dx in range(0, w + ds, ds * 2):
+            for row in range(3):
+                offset = ds if row % 2 == 1 else 0
+                px = dx + offset
+                if px < w + ds:
+                    body.append(_diamond(px, row * ds, ds))
+    body.append(_main_text_colors(c, m, by, "#ffffff", "#ffce00", "#ffffff"))
+    return ("15 - \U0001f37a Oktoberfest (DE)", _wrap(c, w, h, body, defs))
+
+
+@_variant(elements=11)
+def v19_bevrijding(c):
+    m = 24
+    flag_h = 20
+    flag_total = flag_h * 3
+    gap = 10
+    h = c.out_height + flag_total + gap + 40
+    by = flag_total + gap + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    body = [
+        _rect(0, 0, w, flag_h, "#AE1C28"),
+        _rect(0, flag_h, w, flag_h, "#FFFFFF"),
+        _rect(0, flag_h * 2, w, flag_h, "#21468B"),
+        _main_text(c, m, by),
+        El("text", {"x": m, "y": by + 35, "class": "tag", "font-size": 22, "fill": "#21468B"},
+           ["Bevrijdingsdag - 5 mei"]),
+    ]
+    return ("16 - \U0001f54a\ufe0f Bevrijdingsdag (NL) 5 mei", _wrap(c, w, h, body))
+
+
+@_variant(elements=39)
+def v20_carnival(c):
+    m = 24
+    h = c.out_height + 10
+    by = _baseline(c) + 5
+    w = c.out_width
+    body = [_bg(w, h, "#ffffff")]
+    stripe_colors = ["#e30613", "#ffce00", "#2d8a4e", "#2196F3", "#FF9800", "#9C27B0"]
+    sw = w // len(stripe_colors) + 1
+    for i, col in enumerate(stripe_colors):
+        body.append(_rect(i * sw, 0, sw, h, col, opacity="0.12"))
+    rng = random.Random(42)
+    text = _text_box(c, m, by, 7)
+    for cx_c, cy_c in scatter(42, (10, 5, w - 10, h - 5), scaled_count(25, w), 16, (text,)):
+        cr = rng.randint(3, 7)
+        col = rng.choice(stripe_colors)
+        body.append(El("circle", {"cx": cx_c, "cy": cy_c, "r": cr, "fill": col, "opacity": "0.35"}))
+    body.append(_main_text(c, m, by))
+    return ("17 - \U0001f3ad Karneval / Carnaval", _wrap(c, w, h, body))
+
+
+@_variant(elements=39)
+def v21_halloween(c):
+    m = 24
+    icon_zone = int(70 * c.icon_scale)
+    h = c.out_height + icon_zone
+    by = icon_zone + int(c.out_height * 0.5 + c.fs_main * 0.35)
+    w = c.out_width
+    body = [
+        _bg(w, h, "#1a0a2e"),
+        El("circle", {"cx": w - 60, "cy": 35, "r": 25, "fill": "#ffce00", "opacity": "0.9"}),
+        El("circle", {"cx": w - 48, "cy": 30, "r": 23, "fill": "#1a0a2e"}),
+    ]
+    pk_x = w // 2 + c.icon_offset_x
+    pk_y = icon_zone // 2 + 5 + c.icon_offset_y
+    body.append(_icon(pk_x, pk_y, c.icon_scale, _pumpkin_svg(50)))
+    defs = []
+    if c.instancing:
+        defs.append(_symbol("v21-pompoen", [_pumpkin_svg(40)]))
+        defs.append(_symbol("v21-ster", [_star_svg(0, 0, 3, 1.5, 4, "#ffffff")]))
+    for spx in [int(w * 0.15), int(w * 0.85)]:
+        if c.instancing:
+            body.append(_use("v21-pompoen", spx, icon_zone // 2, 0.5))
+        else:
+            body.append(_icon(spx, icon_zone // 2, 0.5, _pumpkin_svg(40)))
+    for sx, sy in [(50,12),(200,8),(400,18),(700,5),(900,15)]:
+        if sx < w:
+            if c.instancing:
+                body.append(_use("v21-ster", sx, sy, None, {"opacity": "0.5"}))
+            else:
+                body.append(_star_svg(sx, sy, 3, 1.5, 4, "#ffffff", "0.5"))
+    body.append(_main_text_colors(c, m, by, "#FF6600", "#e30613", "#ffce00"))
+    return ("18 - \U0001f383 Halloween", _wrap(c, w, h, body, defs))
+
+
+@_variant(elements=11)
+def v22_blackfriday(c):
+    m = 24
+    h = c.out_height + 40
+    by = _baseline(c) + 5
+    w = c.out_width
+    body = [
+        _bg(w, h, "#000000"),
+        _rect(0, 0, w, 3, "#ffce00"),
+        _rect(0, h - 3, w, 3, "#ffce00"),
+        _main_text_colors(c, m, by, "#ffffff", "#ffce00", "#ffffff"),
+        El("text", {"x": m, "y": by + 35, "class": "w", "font-size": 28, "fill": "#ffce00"},
+           ["BLACK FRIDAY DEALS"]),
+    ]
+    return ("19 - \U0001f3f7\ufe0f Black Friday", _wrap(c, w, h, body))
+
+
+ALL_VARIANTS = [
+    v01_basic, v02_flag, v04_crown, v05_bearing, 
+    v08_mono, v09_invert, v10_diagonal,
+    v11_christmas, v12_sinterklaas, v13_koningsdag, v14_easter,
+    v15_valentine, v16_newyear, v17_einheit, v18_oktoberfest,
+    v19_bevrijding, v20_carnival, v21_halloween, v22_blackfriday,
+]
+
+
+# ─── HTML BUILDERS ──────────────────────────────────────
+
+def _build_all_preview_html(svgs, selected=None):
+    cards = []
+    for i, (label, svg_code) in enumerate(svgs):
+        border = "3px solid #e30613" if i == selected else "1px solid #ddd"
+        card = '<div style="background:#fff;border:' + border + ';border-radius:12px;padding:16px;margin-bottom:12px;">\n'
+        card += '<div style="font:bold 14px Arial;color:#444;margin-bottom:8px;">' + html_mod.escape(label) + '</div>\n'
+        card += svg_code + '\n</div>'
+        cards.append(card)
+    html_out = '<!doctype html><html><head><meta charset="utf-8">\n'
+    html_out += '<link rel="preconnect" href="https://fonts.googleapis.com">\n'
+    html_out += '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+    html_out += '<link href="https://fonts.googleapis.com/css2?family=Black+Ops+One&display=swap" rel="stylesheet">\n'
+    html_out += '<style>body{font-family:Arial,sans-serif;margin:16px;background:#f4f4f4}svg{width:100%;height:auto;display:block}</style></head><body>\n'
+    html_out += '<h2 style="margin:0 0 16px">Logo Preview v3.7 (' + str(len(svgs)) + ' varianten)</h2>\n'
+    html_out += '\n'.join(cards) + '\n</body></html>'
+    return html_out
+
+
+def _build_single_preview_html(label, svg_code):
+    html_out = '<!doctype html><html><head><meta charset="utf-8">\n'
+    html_out += '<link rel="preconnect" href="https://fonts.googleapis.com">\n'
+    html_out += '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n'
+    html_out += '<link href="https://fonts.googleapis.com/css2?family=Black+Ops+One&display=swap" rel="stylesheet">\n'
+    html_out += '<style>body{font-family:Arial,sans-serif;margin:24px;background:#f4f4f4}svg{width:100%;max-width:1400px;height:auto;display:block}.box{background:#fff;border:1px solid #ddd;border-radius:12px;padding:20px}</style></head><body>\n'
+    html_out += '<h2>' + html_mod.escape(label) + '</h2>\n'
+    html_out += '<div class="box">' + svg_code + '</div>\n</body></html>'
+    return html_out
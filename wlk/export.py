@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Incrementele export: alleen bestanden waarvan de inhoud veranderd is worden geschreven.
+
+Per uitvoermap houdt ``.wlk-manifest.json`` de SHA-256, grootte en mtime van elk
+geschreven bestand bij. Een bestand wordt overgeslagen als de hash gelijk is én het
+bestand op schijf nog precies zo groot en oud is als bij de vorige export (handmatig
+aangepaste bestanden worden dus wel opnieuw geschreven). Schrijven gebeurt via een
+tijdelijk bestand + ``os.replace``, zodat een webserver nooit een half bestand ziet.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+MANIFEST_NAME = ".wlk-manifest.json"
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)  # vaste datum: dezelfde inhoud geeft dezelfde zip
+
+
+@dataclass
+class ExportStats:
+    written: int = 0
+    skipped: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _as_bytes(data):
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def atomic_write(path, data):
+    """Schrijft ``data`` naar een tijdelijk bestand naast ``path`` en hernoemt het daarna."""
+    path = Path(path)
+    tmp = path.with_name("." + path.name + "." + str(os.getpid()) + "-" + str(threading.get_ident()) + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_manifest(out_dir):
+    """{relatief pad: [sha256, grootte, mtime_ns]}; leeg bij een ontbrekend of kapot manifest."""
+    try:
+        with open(Path(out_dir) / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            files = json.load(f).get("files", {})
+        return files if isinstance(files, dict) else {}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_manifest(out_dir, files):
+    data = json.dumps({"version": 1, "files": files}, sort_keys=True, separators=(",", ":"))
+    atomic_write(Path(out_dir) / MANIFEST_NAME, data.encode("utf-8"))
+
+
+def _unchanged(path, digest, entry):
+    if not entry or entry[0] != digest:
+        return False
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_size == entry[1] and st.st_mtime_ns == entry[2]
+
+
+def _write_one(path, data, digest):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, data)
+    st = os.stat(path)
+    return [digest, st.st_size, st.st_mtime_ns]
+
+
+def _zip_info(name):
+    info = zipfile.ZipInfo(name, date_time=_ZIP_DATE)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+class ZipStream:
+    """Schrijft een zip entry voor entry naar een tijdelijk bestand; ``close`` hernoemt het."""
+
+    def __init__(self, zip_path):
+        self.path = Path(zip_path)
+        self.tmp = self.path.with_name("." + self.path.name + "." + str(os.getpid()) + ".tmp")
+        self.zf = zipfile.ZipFile(self.tmp, "w", zipfile.ZIP_DEFLATED)
+
+    def add(self, name, data):
+        self.zf.writestr(_zip_info(name), _as_bytes(data))
+
+    def add_file(self, name, path):
+        with open(path, "rb") as src, self.zf.open(_zip_info(name), "w") as dst:
+            while True:
+                block = src.read(1 << 16)
+                if not block:
+                    break
+                dst.write(block)
+
+    def close(self):
+        self.zf.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self):
+        self.zf.close()
+        try:
+            os.unlink(self.tmp)
+        except OSError:
+            pass
+
+
+def export_files(out_dir, items, workers=4, zip_path=None, prune=False):
+    """Schrijft ``items`` ((relatief pad, str|bytes), ...) incrementeel naar ``out_dir``.
+
+    Gewijzigde bestanden gaan via een thread pool (maximaal ``2 * workers`` tegelijk
+    onderweg). Met ``zip_path`` komt ook elk bestand in een zip; met ``prune`` worden
+    bestanden uit het vorige manifest die niet meer geëxporteerd worden verwijderd.
+    """
+    start = time.perf_counter()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    old = load_manifest(out_dir)
+    new = {}
+    stats = ExportStats()
+    archive = ZipStream(zip_path) if zip_path else None
+    pending = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for rel, data in items:
+                data = _as_bytes(data)
+                if archive:
+                    archive.add(rel, data)
+                digest = content_hash(data)
+                if _unchanged(out_dir / rel, digest, old.get(rel)):
+                    new[rel] = old[rel]
+                    stats.skipped += 1
+                    continue
+                pending[pool.submit(_write_one, out_dir / rel, data, digest)] = rel
+                if len(pending) >= max(1, workers) * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        new[pending.pop(fut)] = fut.result()
+                        stats.written += 1
+            for fut in list(pending):
+                new[pending.pop(fut)] = fut.result()
+                stats.written += 1
+    except BaseException:
+        if archive:
+            archive.abort()
+        # Wat al geschreven is blijft in het manifest staan; de pool heeft bij het verlaten van
+        # het with-blok op de lopende writes gewacht, dus die zijn klaar of mislukt.
+        for fut, rel in pending.items():
+            if not fut.cancelled() and fut.exception() is None:
+                new[rel] = fut.result()
+        save_manifest(out_dir, {**old, **new})
+        raise
+    if archive:
+        archive.close()
+    if prune:
+        for rel in old.keys() - new.keys():
+            try:
+                os.unlink(out_dir / rel)
+                stats.removed += 1
+            except OSError:
+                pass
+    else:
+        for rel in old.keys() - new.keys():
+            new[rel] = old[rel]
+    save_manifest(out_dir, new)
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def zip_dir(out_dir, zip_path):
+    """Streamt alle bestanden onder ``out_dir`` (zonder manifest en tijdelijke bestanden) naar een zip."""
+    out_dir = Path(out_dir)
+    archive = ZipStream(zip_path)
+    n = 0
+    try:
+        for dirpath, dirnames, filenames in os.walk(out_dir):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name == MANIFEST_NAME or name.endswith(".tmp"):
+                    continue
+                path = Path(dirpath) / name
+                if path.resolve() == archive.path.resolve():
+                    continue
+                archive.add_file(path.relative_to(out_dir).as_posix(), path)
+                n += 1
+    except BaseException:
+        archive.abort()
+        raise
+    archive.close()
+    return n
@@ -0,0 +1,609 @@
+# -*- coding: utf-8 -*-
+"""
+Glyph-metrics engine: advance-breedtes en kerning uit een lokaal TTF/OTF bestand.
+
+Alleen standaardbibliotheek (``struct``). Gelezen tabellen: ``head``, ``hhea``, ``hmtx``,
+``maxp``, ``cmap`` (formaat 4 en 12), ``kern`` (formaat 0) en GPOS pair-kerning
+(lookup type 2, formaat 1 en 2, ook via extension-lookups). Outlines komen uit
+``glyf``/``loca`` (TrueType-contouren, ook samengestelde glyphs); CFF-fonts hebben geen
+outlines.
+
+Breedtes worden per (font, string) in font-units gememoized; de schaal naar een
+fontgrootte is daarna één vermenigvuldiging, dus duizenden layout-queries per seconde
+zijn geen probleem.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import os
+import struct
+from pathlib import Path
+
+# Bestandsnamen in volgorde van voorkeur; de eerste komt overeen met FONT_STACK.
+MAIN_FONT_FILES = [
+    "BlackOpsOne-Regular.ttf", "impact.ttf", "Impact.ttf", "ariblk.ttf", "Arial Black.ttf",
+    "LiberationSans-Bold.ttf", "DejaVuSans-Bold.ttf",
+]
+TAG_FONT_FILES = [
+    "arialbd.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf", "DejaVuSans-Bold.ttf", "Helvetica-Bold.ttf",
+]
+
+# Gemiddelde advance (em) als er helemaal geen font gevonden wordt.
+FALLBACK_ADVANCE_EM = 0.62
+_CACHE_LIMIT = 100_000
+_MAX_COMPONENT_DEPTH = 8
+
+# Vlaggen van glyf-punten en -componenten.
+_ON_CURVE = 0x01
+_X_SHORT = 0x02
+_Y_SHORT = 0x04
+_REPEAT = 0x08
+_X_SAME = 0x10
+_Y_SAME = 0x20
+_ARG_WORDS = 0x0001
+_ARGS_XY = 0x0002
+_HAVE_SCALE = 0x0008
+_MORE_COMPONENTS = 0x0020
+_HAVE_XY_SCALE = 0x0040
+_HAVE_2X2 = 0x0080
+
+
+def font_dirs():
+    """Mappen waarin naar fonts gezocht wordt: ``WLK_FONT_DIR`` en ``fonts/`` naast de app.
+
+    Systeemmappen tellen bewust niet mee: dan zou de layout afhangen van welk font toevallig
+    op de machine staat, en zouden SVG's per computer verschillen.
+    """
+    dirs = [Path(__file__).resolve().parent.parent / "fonts"]
+    if os.environ.get("WLK_FONT_DIR"):
+        dirs.insert(0, Path(os.environ["WLK_FONT_DIR"]))
+    return dirs
+
+
+def find_font_file(candidates):
+    """Eerste bestaande fontbestand uit ``candidates`` (bestandsnamen of volledige paden)."""
+    for name in candidates:
+        if os.path.isabs(name) and os.path.isfile(name):
+            return name
+    wanted = {name.lower(): i for i, name in enumerate(candidates)}
+    best = None
+    for d in font_dirs():
+        try:
+            names = os.listdir(d)
+        except OSError:
+            continue
+        for fn in names:
+            rank = wanted.get(fn.lower())
+            if rank is not None and (best is None or rank < best[0]):
+                best = (rank, os.path.join(d, fn))
+        if best is not None:
+            break  # eerdere mappen gaan voor
+    return best[1] if best else None
+
+
+class Font:
+    """Metrics (en later outlines) van één TrueType/OpenType font."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self.data = f.read()
+        self.tables = self._read_directory()
+        head = self._table("head")
+        self.units_per_em = struct.unpack_from(">H", self.data, head + 18)[0]
+        hhea = self._table("hhea")
+        self.ascender, self.descender = struct.unpack_from(">hh", self.data, hhea + 4)
+        self._num_hmetrics = struct.unpack_from(">H", self.data, hhea + 34)[0]
+        self.num_glyphs = struct.unpack_from(">H", self.data, self._table("maxp") + 4)[0]
+        self._hmtx = self._table("hmtx")
+        self._cmap = self._read_cmap()
+        self._kern = self._read_kern_table()
+        self._gpos_pairs = self._read_gpos_pairs()
+        self._pair_cache = {}
+        self._units_cache = {}
+        self.has_outlines = "glyf" in self.tables and "loca" in self.tables
+        self._long_loca = struct.unpack_from(">h", self.data, head + 50)[0] == 1
+        self._contour_cache = {}
+        self.name = Path(self.path).stem
+
+    def __repr__(self):
+        return "Font(" + repr(self.name) + ")"
+
+    # ─── tabellen ───
+
+    def _read_directory(self):
+        tag = self.data[:4]
+        if tag == b"ttcf":
+            offset = struct.unpack_from(">I", self.data, 12)[0]  # eerste font uit een collectie
+        else:
+            offset = 0
+        num = struct.unpack_from(">H", self.data, offset + 4)[0]
+        tables = {}
+        for i in range(num):
+            rec = offset + 12 + 16 * i
+            tag, _, off, length = struct.unpack_from(">4sIII", self.data, rec)
+            tables[tag.decode("latin-1")] = (off, length)
+        return tables
+
+    def _table(self, tag):
+        if tag not in self.tables:
+            raise ValueError(self.path + ": tabel '" + tag + "' ontbreekt")
+        return self.tables[tag][0]
+
+    def _read_cmap(self):
+        base = self._table("cmap")
+        data = self.data
+        n = struct.unpack_from(">H", data, base + 2)[0]
+        subtables = {}
+        for i in range(n):
+            pid, eid, off = struct.unpack_from(">HHI", data, base + 4 + 8 * i)
+            subtables[(pid, eid)] = base + off
+        for key in ((3, 10), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0), (3, 0)):
+            off = subtables.get(key)
+            if off is None:
+                continue
+            fmt = struct.unpack_from(">H", data, off)[0]
+            if fmt == 4:
+                return self._cmap4(off)
+            if fmt == 12:
+                return self._cmap12(off)
+        return ([], [], [])
+
+    def _cmap4(self, off):
+        data = self.data
+        seg2 = struct.unpack_from(">H", data, off + 6)[0]
+        segs = seg2 // 2
+        ends = struct.unpack_from(">" + "H" * segs, data, off + 14)
+        starts = struct.unpack_from(">" + "H" * segs, data, off + 16 + seg2)
+        deltas = struct.unpack_from(">" + "h" * segs, data, off + 16 + 2 * seg2)
+        ro_pos = off + 16 + 3 * seg2
+        range_offsets = struct.unpack_from(">" + "H" * segs, data, ro_pos)
+        segments = []
+        for i in range(segs):
+            segments.append((starts[i], ends[i], deltas[i], range_offsets[i], ro_pos + 2 * i))
+        return ("4", list(ends), segments)
+
+    def _cmap12(self, off):
+        data = self.data
+        n = struct.unpack_from(">I", data, off + 12)[0]
+        groups = [struct.unpack_from(">III", data, off + 16 + 12 * i) for i in range(n)]
+        return ("12", [g[1] for g in groups], groups)
+
+    def glyph_id(self, ch):
+        kind, ends, segs = self._cmap
+        code = ord(ch)
+        i = bisect.bisect_left(ends, code)
+        if i >= len(segs):
+            return 0
+        if kind == "4":
+            start, _, delta, ro, ro_addr = segs[i]
+            if code < start:
+                return 0
+            if ro == 0:
+                return (code + delta) & 0xFFFF
+            gid = struct.unpack_from(">H", self.data, ro_addr + ro + 2 * (code - start))[0]
+            return (gid + delta) & 0xFFFF if gid else 0
+        start, _, first = segs[i]
+        return first + code - start if code >= start else 0
+
+    def advance(self, gid):
+        if gid >= self._num_hmetrics:
+            gid = self._num_hmetrics - 1
+        return struct.unpack_from(">H", self.data, self._hmtx + 4 * gid)[0]
+
+    def _read_kern_table(self):
+        pairs = {}
+        if "kern" not in self.tables:
+            return pairs
+        data = self.data
+        base = self.tables["kern"][0]
+        version, n = struct.unpack_from(">HH", data, base)
+        if version != 0:
+            return pairs
+        off = base + 4
+        for _ in range(n):
+            _, length, coverage = struct.unpack_from(">HHH", data, off)
+            if coverage >> 8 == 0 and coverage & 1:  # formaat 0, horizontaal
+                npairs = struct.unpack_from(">H", data, off + 6)[0]
+                for k in range(npairs):
+                    l, r, v = struct.unpack_from(">HHh", data, off + 14 + 6 * k)
+                    pairs[(l, r)] = v
+            off += length
+        return pairs
+
+    # ─── GPOS pair kerning ───
+
+    def _coverage(self, off):
+        data = self.data
+        fmt, n = struct.unpack_from(">HH", data, off)
+        cov = {}
+        if fmt == 1:
+            for i, g in enumerate(struct.unpack_from(">" + "H" * n, data, off + 4)):
+                cov[g] = i
+        else:
+            for i in range(n):
+                start, end, idx = struct.unpack_from(">HHH", data, off + 4 + 6 * i)
+                for g in range(start, end + 1):
+                    cov[g] = idx + g - start
+        return cov
+
+    def _class_def(self, off):
+        data = self.data
+        fmt = struct.unpack_from(">H", data, off)[0]
+        classes = {}
+        if fmt == 1:
+            start, n = struct.unpack_from(">HH", data, off + 2)
+            for i, c in enumerate(struct.unpack_from(">" + "H" * n, data, off + 6)):
+                if c:
+                    classes[start + i] = c
+        else:
+            n = struct.unpack_from(">H", data, off + 2)[0]
+            for i in range(n):
+                start, end, c = struct.unpack_from(">HHH", data, off + 4 + 6 * i)
+                for g in range(start, end + 1):
+                    classes[g] = c
+        return classes
+
+    @staticmethod
+    def _value_layout(fmt):
+        """(grootte in bytes, offset van XAdvance of None) van een ValueRecord."""
+        size = 2 * bin(fmt).count("1")
+        x_adv = 2 * bin(fmt & 0x3).count("1") if fmt & 0x4 else None
+        return size, x_adv
+
+    def _read_gpos_pairs(self):
+        if "GPOS" not in self.tables:
+            return []
+        data = self.data
+        base = self.tables["GPOS"][0]
+        feat_off, lookup_off = struct.unpack_from(">HH", data, base + 6)
+        feat_list = base + feat_off
+        lookup_list = base + lookup_off
+        lookups = set()
+        for i in range(struct.unpack_from(">H", data, feat_list)[0]):
+            tag, off = struct.unpack_from(">4sH", data, feat_list + 2 + 6 * i)
+            if tag == b"kern":
+                feat = feat_list + off
+                n = struct.unpack_from(">H", data, feat + 2)[0]
+                lookups.update(struct.unpack_from(">" + "H" * n, data, feat + 4))
+        subtables = []
+        n_lookups = struct.unpack_from(">H", data, lookup_list)[0]
+        for li in sorted(lookups):
+            if li >= n_lookups:
+                continue
+            lk = lookup_list + struct.unpack_from(">H", data, lookup_list + 2 + 2 * li)[0]
+            ltype, _, nsub = struct.unpack_from(">HHH", data, lk)
+            for si in range(nsub):
+                st = lk + struct.unpack_from(">H", data, lk + 6 + 2 * si)[0]
+                stype = ltype
+                if ltype == 9:
+                    _, stype, ext = struct.unpack_from(">HHI", data, st)
+                    st += ext
+                if stype == 2:
+                    subtables.append(st)
+        return subtables
+
+    def _gpos_kern(self, left, right):
+        data = self.data
+        for i, st in enumerate(self._gpos_pairs):
+            if isinstance(st, int):
+                st = self._gpos_pairs[i] = self._parse_pair_subtable(st)
+            fmt, cov, size1, xadv1, rest = st
+            idx = cov.get(left)
+            if idx is None or xadv1 is None:
+                continue
+            if fmt == 1:
+                sets, size2 = rest
+                pairs = sets[idx]
+                if isinstance(pairs, int):
+                    pairs = sets[idx] = self._parse_pair_set(pairs, size1, xadv1, size2)
+                if right in pairs:
+                    return pairs[right]
+            else:
+                cd1, cd2, class2_count, records, rec_size = rest
+                c1 = cd1.get(left, 0)
+                c2 = cd2.get(right, 0)
+                v = struct.unpack_from(">h", data, records + (c1 * class2_count + c2) * rec_size + xadv1)[0]
+                if v:
+                    return v
+        return 0
+
+    def _parse_pair_subtable(self, st):
+        data = self.data
+        fmt, cov_off, vf1, vf2 = struct.unpack_from(">HHHH", data, st)
+        cov = self._coverage(st + cov_off)
+        size1, xadv1 = self._value_layout(vf1)
+        size2, _ = self._value_layout(vf2)
+        if fmt == 1:
+            n = struct.unpack_from(">H", data, st + 8)[0]
+            sets = [st + o for o in struct.unpack_from(">" + "H" * n, data, st + 10)]
+            return (1, cov, size1, xadv1, (sets, size2))
+        cd1_off, cd2_off, c1n, c2n = struct.unpack_from(">HHHH", data, st + 8)
+        rest = (self._class_def(st + cd1_off), self._class_def(st + cd2_off), c2n, st + 16, size1 + size2)
+        return (2, cov, size1, xadv1, rest)
+
+    def _parse_pair_set(self, off, size1, xadv1, size2):
+        data = self.data
+        n = struct.unpack_from(">H", data, off)[0]
+        rec = 2 + size1 + size2
+        pairs = {}
+        for k in range(n):
+            p = off + 2 + k * rec
+            v = struct.unpack_from(">h", data, p + 2 + xadv1)[0]
+            if v:
+                pairs[struct.unpack_from(">H", data, p)[0]] = v
+        return pairs
+
+    def kerning(self, left, right):
+        key = (left, right)
+        v = self._pair_cache.get(key)
+        if v is None:
+            v = self._kern.get(key, 0) or (self._gpos_kern(left, right) if self._gpos_pairs else 0)
+            self._pair_cache[key] = v
+        return v
+
+    # ─── breedtes ───
+
+    def units_width(self, text):
+        """Breedte van ``text`` in font-units (advances + kerning), gememoized per string."""
+        w = self._units_cache.get(text)
+        if w is None:
+            w = 0
+            prev = None
+            for ch in text:
+                gid = self.glyph_id(ch)
+                w += self.advance(gid)
+                if prev is not None:
+                    w += self.kerning(prev, gid)
+                prev = gid
+            if len(self._units_cache) > _CACHE_LIMIT:
+                self._units_cache.clear()
+            self._units_cache[text] = w
+        return w
+
+    def text_width(self, text, size, letter_spacing=0.0):
+        """Breedte in px bij ``size`` px; CSS letter-spacing komt na elk teken."""
+        return self.units_width(text) * size / self.units_per_em + letter_spacing * len(text)
+
+    def ascent(self, size):
+        return self.ascender * size / self.units_per_em
+
+    def descent(self, size):
+        return -self.descender * size / self.units_per_em
+
+    # ─── outlines (glyf) ───
+
+    def glyph_contours(self, gid):
+        """Contouren van glyph ``gid`` in font-units: tuple van tuples ``(x, y, op_curve)``.
+
+        Samengestelde glyphs worden uitgevouwen; het resultaat wordt per glyph bewaard.
+        """
+        contours = self._contour_cache.get(gid)
+        if contours is None:
+            contours = self._contour_cache[gid] = tuple(self._read_glyph(gid, 0)) if self.has_outlines else ()
+        return contours
+
+    def _glyph_offset(self, gid):
+        if gid >= self.num_glyphs:
+            return None
+        loca = self.tables["loca"][0]
+        if self._long_loca:
+            start, end = struct.unpack_from(">II", self.data, loca + 4 * gid)
+        else:
+            start, end = struct.unpack_from(">HH", self.data, loca + 2 * gid)
+            start *= 2
+            end *= 2
+        return None if end <= start else self.tables["glyf"][0] + start
+
+    def _read_glyph(self, gid, depth):
+        off = self._glyph_offset(gid)
+        if off is None:
+            return []
+        n_contours = struct.unpack_from(">h", self.data, off)[0]
+        if n_contours >= 0:
+            return self._simple_glyph(off, n_contours)
+        if depth >= _MAX_COMPONENT_DEPTH:
+            return []
+        return self._composite_glyph(off, depth)
+
+    def _simple_glyph(self, off, n_contours):
+        data = self.data
+        p = off + 10
+        ends = struct.unpack_from(">" + "H" * n_contours, data, p)
+        p += 2 * n_contours
+        n_points = ends[-1] + 1 if ends else 0
+        p += 2 + struct.unpack_from(">H", data, p)[0]  # instructies overslaan
+        flags = []
+        while len(flags) < n_points:
+            f = data[p]
+            p += 1
+            flags.append(f)
+            if f & _REPEAT:
+                flags.extend([f] * data[p])
+                p += 1
+        del flags[n_points:]
+        xs = []
+        v = 0
+        for f in flags:
+            if f & _X_SHORT:
+                v += data[p] if f & _X_SAME else -data[p]
+                p += 1
+            elif not f & _X_SAME:
+                v += struct.unpack_from(">h", data, p)[0]
+                p += 2
+            xs.append(v)
+        ys = []
+        v = 0
+        for f in flags:
+            if f & _Y_SHORT:
+                v += data[p] if f & _Y_SAME else -data[p]
+                p += 1
+            elif not f & _Y_SAME:
+                v += struct.unpack_from(">h", data, p)[0]
+                p += 2
+            ys.append(v)
+        contours = []
+        start = 0
+        for end in ends:
+            contours.append(tuple((xs[i], ys[i], bool(flags[i] & _ON_CURVE)) for i in range(start, end + 1)))
+            start = end + 1
+        return contours
+
+    def _composite_glyph(self, off, depth):
+        data = self.data
+        p = off + 10
+        contours = []
+        while True:
+            flags, gid = struct.unpack_from(">HH", data, p)
+            p += 4
+            if flags & _ARG_WORDS:
+                dx, dy = struct.unpack_from(">hh", data, p)
+                p += 4
+            else:
+                dx, dy = struct.unpack_from(">bb", data, p)
+                p += 2
+            if not flags & _ARGS_XY:
+                dx = dy = 0  # punt-uitlijning komt in onze fonts niet voor
+            a, b, c, d = 1.0, 0.0, 0.0, 1.0
+            if flags & _HAVE_SCALE:
+                a = d = struct.unpack_from(">h", data, p)[0] / 16384.0
+                p += 2
+            elif flags & _HAVE_XY_SCALE:
+                a, d = (v / 16384.0 for v in struct.unpack_from(">hh", data, p))
+                p += 4
+            elif flags & _HAVE_2X2:
+                a, b, c, d = (v / 16384.0 for v in struct.unpack_from(">hhhh", data, p))
+                p += 8
+            for contour in self._read_glyph(gid, depth + 1):
+                if (a, b, c, d) == (1.0, 0.0, 0.0, 1.0):
+                    contours.append(tuple((x + dx, y + dy, on) for x, y, on in contour))
+                else:
+                    contours.append(tuple((a * x + c * y + dx, b * x + d * y + dy, on) for x, y, on in contour))
+            if not flags & _MORE_COMPONENTS:
+                return contours
+
+
+class ApproxFont:
+    """Noodgeval zonder fontbestand: vaste gemiddelde advance per teken."""
+
+    name = "benadering"
+    path = None
+    has_outlines = False
+
+    def __init__(self, advance_em=FALLBACK_ADVANCE_EM):
+        self.advance_em = advance_em
+
+    def __repr__(self):
+        return "ApproxFont(" + str(self.advance_em) + ")"
+
+    def text_width(self, text, size, letter_spacing=0.0):
+        return (self.advance_em * size + letter_spacing) * len(text)
+
+    def ascent(self, size):
+        return 0.8 * size
+
+    def descent(self, size):
+        return 0.2 * size
+
+
+_FONTS = {}
+# Vastgezette fontbestanden per rol ("main"/"tag"); "" betekent ApproxFont. Zie ``pin_fonts``.
+_PINNED = {}
+_PIN_ENV = {"main": "WLK_FONT_FILE", "tag": "WLK_TAG_FONT_FILE"}
+
+
+def load_font(candidates=None):
+    """Laadt (en onthoudt) het eerste beschikbare font uit ``candidates``; anders een ApproxFont."""
+    key = tuple(MAIN_FONT_FILES if candidates is None else candidates)
+    font = _FONTS.get(key)
+    if font is None:
+        path = find_font_file(list(key))
+        font = ApproxFont()
+        if path:
+            try:
+                font = Font(path)
+            except (OSError, ValueError, struct.error):
+                pass
+        _FONTS[key] = font
+    return font
+
+
+def pin_fonts(main=None, tag=None):
+    """Zet de fontbestanden voor hoofdtekst en tagline vast (``None`` = niet vastzetten,
+    ``""`` = ApproxFont). Gaat voor ``WLK_FONT_FILE``/``WLK_TAG_FONT_FILE`` en de fontmappen;
+    batch geeft zo de in het hoofdproces gekozen fonts door aan zijn workers."""
+    for role, path in (("main", main), ("tag", tag)):
+        if path is not None:
+            _PINNED[role] = os.path.abspath(path) if path else ""
+
+
+def _candidates(role, files):
+    path = _PINNED.get(role)
+    if path is None:
+        path = os.environ.get(_PIN_ENV[role]) or None
+        if path:
+            path = os.path.abspath(path)
+    if path is None:
+        return files
+    return [path] if path else []
+
+
+def font_paths():
+    """(hoofdfont, taglinefont) als paden, ``""`` voor ApproxFont: geschikt voor ``pin_fonts``."""
+    return main_font().path or "", tag_font().path or ""
+
+
+def font_signature():
+    """Inhoud-hash van de fonts die metrics en outlines leveren (voor cache-sleutels)."""
+    return "main=" + _digest(main_font()) + "|tag=" + _digest(tag_font())
+
+
+def _digest(font):
+    data = getattr(font, "data", None)
+    if data is None:
+        return repr(font)
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def main_font():
+    return load_font(_candidates("main", MAIN_FONT_FILES))
+
+
+def tag_font():
+    return load_font(_candidates("tag", TAG_FONT_FILES))
+
+
+# ─── LAYOUT ─────────────────────────────────────────────
+
+def main_text_width(cfg, font=None, fs=None):
+    """Breedte van de ``_main_text`` uitvoer: links, rechts en TLD met word_gap/tld_gap.
+
+    De witruimte tussen de tspans klapt in de browser in tot één spatie per overgang;
+    die spaties worden daarom meegeteld.
+    """
+    font = font or main_font()
+    fs = cfg.fs_main if fs is None else fs
+    ft = int(fs * cfg.tld_scale)
+    ls = cfg.letter_spacing
+    space = font.text_width(" ", fs, ls)
+    return (font.text_width(cfg.left, fs, ls) + space + cfg.word_gap
+            + font.text_width(cfg.right, fs, ls) + space + cfg.tld_gap
+            + font.text_width(cfg.tld, ft, ls))
+
+
+def fit_font_size(cfg, max_width=None, font=None, margin=24, min_fs=10):
+    """Grootste ``fs_main`` (<= huidige) waarbij de hoofdtekst binnen ``out_width`` past."""
+    font = font or main_font()
+    limit = (cfg.out_width if max_width is None else max_width) - 2 * margin
+    if main_text_width(cfg, font) <= limit:
+        return cfg.fs_main
+    lo, hi = min_fs, cfg.fs_main
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if main_text_width(cfg, font, mid) <= limit:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
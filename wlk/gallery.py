@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Gepagineerde galerij over een batch-uitvoermap (``NNNN_merk/NN_variant.svg``).
+
+Schrijft ``index.html``, ``pagina-2.html``, ... met ``<img loading="lazy">`` kaarten die naar
+de losse SVG-bestanden verwijzen, plus ``gallery.json`` (index per merk en variant) en
+``gallery.js`` (dezelfde index als script + filtercode, zodat filteren ook via ``file://`` werkt).
+Alleen de kaarten van de geopende pagina worden geladen; filteren gebeurt in de browser.
+"""
+
+from __future__ import annotations
+
+import html as html_mod
+import json
+import os
+import re
+from pathlib import Path
+
+from wlk import registry
+from wlk.config import _svg_filename
+
+PER_PAGE = 200
+FILTER_LIMIT = 400
+_SIZE_RE = re.compile(r'<svg\b[^>]*?\bwidth="([\d.]+)"[^>]*?\bheight="([\d.]+)"')
+
+_CSS = ("body{font-family:Arial,sans-serif;margin:16px;background:#f4f4f4}"
+        "header{display:flex;gap:8px;align-items:center;flex-wrap:wrap;margin-bottom:12px}"
+        "header h1{font-size:18px;margin:0 12px 0 0}"
+        ".grid{display:grid;grid-template-columns:repeat(auto-fill,minmax(280px,1fr));gap:10px}"
+        "figure{background:#fff;border:1px solid #ddd;border-radius:8px;margin:0;padding:8px}"
+        "figure img{width:100%;height:auto;display:block}"
+        "figcaption{font-size:12px;color:#444;margin-top:6px;overflow-wrap:anywhere}"
+        "nav{margin:12px 0}nav a,nav b{margin-right:6px}")
+
+_FILTER_JS = """(function () {
+  var g = window.WLK_GALLERY, q = document.getElementById("q"), v = document.getElementById("v");
+  var grid = document.getElementById("grid"), status = document.getElementById("status");
+  if (!g || !q) return;
+  var page = Array.prototype.slice.call(grid.children);
+  g.variants.forEach(function (label, i) {
+    var o = document.createElement("option"); o.value = i; o.textContent = label; v.appendChild(o);
+  });
+  function card(b, k) {
+    var f = document.createElement("figure"), img = document.createElement("img"), c = document.createElement("figcaption");
+    img.loading = "lazy"; img.src = b.dir + "/" + g.files[k]; img.alt = b.name + " - " + g.variants[k];
+    c.textContent = b.name + " \\u00b7 " + g.variants[k];
+    f.appendChild(img); f.appendChild(c); return f;
+  }
+  function run() {
+    var term = q.value.trim().toLowerCase(), vi = v.value, n = 0;
+    grid.textContent = "";
+    if (!term && vi === "") { page.forEach(function (el) { grid.appendChild(el); }); status.textContent = ""; return; }
+    g.brands.forEach(function (b) {
+      if (term && b.name.toLowerCase().indexOf(term) < 0) return;
+      b.v.forEach(function (k) {
+        if (vi !== "" && String(k) !== vi) return;
+        if (n++ < g.limit) grid.appendChild(card(b, k));
+      });
+    });
+    status.textContent = n + " resultaten" + (n > g.limit ? " (eerste " + g.limit + " getoond)" : "");
+  }
+  q.addEventListener("input", run); v.addEventListener("change", run);
+})();
+"""
+
+
+def _page_name(page):
+    return "index.html" if page == 1 else "pagina-" + str(page) + ".html"
+
+
+def _svg_size(path):
+    """(breedte, hoogte) uit de kop van het SVG-bestand, of None."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            head = f.read(1024)
+    except OSError:
+        return None
+    m = _SIZE_RE.search(head)
+    return (m.group(1), m.group(2)) if m else None
+
+
+def scan_batch_dir(out_dir, labels=None):
+    """Bestandsnamen per variant en de merken in een batch-uitvoermap:
+    (files, [(mapnaam, weergavenaam, [variant-index, ...])])."""
+    files = [_svg_filename(i, label) for i, label in enumerate(labels or variant_labels())]
+    index = {name: i for i, name in enumerate(files)}
+    brands = []
+    with os.scandir(out_dir) as entries:
+        dirs = sorted(e.name for e in entries if e.is_dir())
+    for name in dirs:
+        with os.scandir(Path(out_dir) / name) as entries:
+            found = sorted(index[e.name] for e in entries if e.name in index)
+        if found:
+            display = name.split("_", 1)[1] if "_" in name and name.split("_", 1)[0].isdigit() else name
+            brands.append((name, display, found))
+    return files, brands
+
+
+def variant_labels():
+    """Labels uit de metadata van het register; er wordt niets gerenderd."""
+    return [v.label for v in registry.variants()]
+
+
+def _pager(page, pages):
+    if pages <= 1:
+        return ""
+    links = []
+    for p in range(1, pages + 1):
+        if p == page:
+            links.append("<b>" + str(p) + "</b>")
+        else:
+            links.append('<a href="' + _page_name(p) + '">' + str(p) + "</a>")
+    return "<nav>" + "".join(links) + "</nav>\n"
+
+
+def _write_page(path, title, page, pages, cards):
+    parts = ['<!doctype html><html><head><meta charset="utf-8">\n',
+             "<title>" + html_mod.escape(title) + " - " + str(page) + "/" + str(pages) + "</title>\n",
+             "<style>" + _CSS + "</style></head><body>\n",
+             "<header><h1>" + html_mod.escape(title) + "</h1>",
+             '<input id="q" type="search" placeholder="Filter op merk...">',
+             '<select id="v"><option value="">Alle varianten</option></select>',
+             '<span id="status"></span></header>\n',
+             _pager(page, pages), '<div class="grid" id="grid">\n']
+    parts.extend(cards)
+    parts.append("</div>\n" + _pager(page, pages))
+    parts.append('<script src="gallery.js"></script>\n</body></html>\n')
+    Path(path).write_text("".join(parts), encoding="utf-8")
+
+
+def build_gallery(out_dir, per_page=PER_PAGE, title="Logo galerij"):
+    """Schrijft de galerij-pagina's en de index in ``out_dir``; geeft (logo's, pagina's)."""
+    out_dir = Path(out_dir)
+    labels = variant_labels()
+    files, brands = scan_batch_dir(out_dir, labels)
+    items = [(d, name, k) for d, name, found in brands for k in found]
+    pages = max(1, (len(items) + per_page - 1) // per_page)
+    for page in range(1, pages + 1):
+        cards = []
+        for d, name, k in items[(page - 1) * per_page:page * per_page]:
+            src = d + "/" + files[k]
+            size = _svg_size(out_dir / d / files[k])
+            dims = ' width="' + size[0] + '" height="' + size[1] + '"' if size else ""
+            caption = html_mod.escape(name + " · " + labels[k])
+            cards.append('<figure><img loading="lazy" decoding="async" src="' + html_mod.escape(src) + '"'
+                         + dims + ' alt="' + caption + '"><figcaption>' + caption + "</figcaption></figure>\n")
+        _write_page(out_dir / _page_name(page), title, page, pages, cards)
+    for old in out_dir.glob("pagina-*.html"):
+        num = old.stem.split("-", 1)[1]
+        if num.isdigit() and int(num) > pages:
+            old.unlink()
+    index = {"per_page": per_page, "pages": pages, "limit": FILTER_LIMIT, "variants": labels, "files": files,
+             "brands": [{"dir": d, "name": name, "v": found} for d, name, found in brands]}
+    data = json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+    (out_dir / "gallery.json").write_text(data, encoding="utf-8")
+    (out_dir / "gallery.js").write_text("window.WLK_GALLERY = " + data + ";\n" + _FILTER_JS, encoding="utf-8")
+    return len(items), pages
@@ -0,0 +1,1214 @@
+# -*- coding: utf-8 -*-
+"""Tkinter GUI en updater van de sm0kez Logo Designer."""
+
+from __future__ import annotations
+
+import math
+import os
+import queue
+import re
+import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from tkinter import (
+    BOTH, BOTTOM, DISABLED, END, FLAT, HORIZONTAL, LEFT, NONE, NORMAL,
+    RIGHT, RIDGE, SUNKEN, TOP, VERTICAL, W, E, X, Y, NW, SE,
+    BooleanVar, Canvas, Event, Frame, Label, Menu, Scrollbar,
+    StringVar, IntVar, TclError, Tk, Toplevel, Text,
+    filedialog, messagebox,
+)
+from tkinter import ttk
+
+from wlk import APP_VERSION, registry
+from wlk.cache import DiskCache, RenderCache
+from wlk.config import DIMENSION_PRESETS, _svg_filename
+from wlk.export import ZipStream, export_files
+from wlk.profiles import PROFILE_DB, ProfileDB, domain_of
+from wlk.profiling import RenderProfiler, run_profiled
+from wlk.settings import SettingsStore
+
+# --- UPDATER CONFIGURATIE ---
+UPDATE_URL = "https://raw.githubusercontent.com/sm0kez/wlk-logo-designer/main/wlk/__init__.py"
+UPDATE_ARCHIVE_URL = "https://github.com/sm0kez/wlk-logo-designer/archive/refs/heads/main.zip"
+# ----------------------------
+
+CONFIG_FILE = "wlk_config.json"
+
+
+# ─── DEBUG CONSOLE ──────────────────────────────────────
+
+class DebugConsole(Frame):
+    TAG_COLORS = {
+        "INFO":    {"fg": "#cccccc", "prefix": "[INFO] "},
+        "SUCCESS": {"fg": "#4ec94e", "prefix": "[OK] "},
+        "WARNING": {"fg": "#f0a030", "prefix": "[WARN] "},
+        "ERROR":   {"fg": "#ff4444", "prefix": "[ERROR] "},
+        "DEBUG":   {"fg": "#888888", "prefix": "[DEBUG] "},
+        "ACTION":  {"fg": "#66bbff", "prefix": "[ACTIE] "},
+    }
+
+    MAX_LINES = 5000    # oudere regels worden uit de widget verwijderd
+    FLUSH_MS = 100      # interval waarop de wachtrij naar de widget geschreven wordt
+    FLUSH_BATCH = 1000  # maximaal aantal berichten per flush, zodat de UI responsief blijft
+
+    PROFILE_HEADINGS = {"variant": "Variant", "renders": "Renders", "last_ms": "Laatste ms", "p50_ms": "p50 ms",
+                        "p95_ms": "p95 ms", "max_ms": "Max ms", "bytes": "Bytes", "shapes": "Vormen",
+                        "errors": "Fouten"}
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._is_visible = True
+        self._log_count = 0
+        self._lines = 0
+        self._queue = queue.SimpleQueue()
+        self.profiler = None
+        self._profile_win = None
+        self._profile_sort = ("p95_ms", True)
+        self._build()
+        self._schedule_flush()
+
+    def _build(self):
+        self.header = Frame(self, bg="#2a2a2a", height=32)
+        self.header.pack(fill=X)
+        self.header.pack_propagate(False)
+        self.toggle_btn = ttk.Button(self.header, text="Debug Console (verbergen)", command=self.toggle, width=28)
+        self.toggle_btn.pack(side=LEFT, padx=4, pady=3)
+        self.count_label = Label(self.header, text="(0)", bg="#2a2a2a", fg="#888888", font=("Arial", 9))
+        self.count_label.pack(side=LEFT, padx=8)
+        ttk.Button(self.header, text="Kopieer", command=self._copy_log, width=8).pack(side=RIGHT, padx=4, pady=3)
+        ttk.Button(self.header, text="Wis", command=self._clear_log, width=6).pack(side=RIGHT, padx=4, pady=3)
+        ttk.Button(self.header, text="Profiel", command=self.show_profile, width=8).pack(side=RIGHT, padx=4, pady=3)
+
+        self.log_frame = Frame(self)
+        self.log_frame.pack(fill=BOTH, expand=True)
+        scrollbar_y = Scrollbar(self.log_frame, orient=VERTICAL)
+        self.log_text = Text(self.log_frame, wrap=NONE, font=("Consolas", 9), bg="#1a1a1a", fg="#cccccc",
+                            insertbackground="#fff", state=DISABLED, height=6, yscrollcommand=scrollbar_y.set)
+        scrollbar_y.config(command=self.log_text.yview)
+        scrollbar_y.pack(side=RIGHT, fill=Y)
+        self.log_text.pack(fill=BOTH, expand=True)
+        for tag_name, props in self.TAG_COLORS.items():
+            self.log_text.tag_configure(tag_name, foreground=props["fg"])
+        self.log_text.tag_configure("TIMESTAMP", foreground="#666666")
+        self.log_text.tag_configure("SEPARATOR", foreground="#444444")
+
+    # ─── logging (thread-safe, gebundeld) ───
+    def log(self, message, level="INFO"):
+        """Zet een regel in de wachtrij; mag vanuit elke thread aangeroepen worden."""
+        level = level.upper()
+        if level not in self.TAG_COLORS:
+            level = "INFO"
+        ts = datetime.now().strftime("%H:%M:%S")
+        self._queue.put(("[" + ts + "] ", "TIMESTAMP", self.TAG_COLORS[level]["prefix"] + message + "\n", level))
+
+    def log_separator(self, title=""):
+        line = ("--- " + title + " " + "-" * max(0, 50 - len(title))) if title else ("-" * 60)
+        self._queue.put((line + "\n", "SEPARATOR"))
+
+    def log_exception(self, context=""):
+        tb = traceback.format_exc()
+        self.log("EXCEPTION in " + context + ":" if context else "EXCEPTION:", "ERROR")
+        self._queue.put((tb + "\n", "ERROR"))
+
+    def _schedule_flush(self):
+        try:
+            self.after(self.FLUSH_MS, self._flush)
+        except TclError:
+            pass  # venster is al gesloten
+
+    def _flush(self):
+        self._drain()
+        self._schedule_flush()
+
+    def _drain(self):
+        """Schrijft wat in de wachtrij staat in één insert naar de widget en kapt oude regels af."""
+        args = []
+        n_msgs = 0
+        n_lines = 0
+        try:
+            while n_msgs < self.FLUSH_BATCH:
+                item = self._queue.get_nowait()
+                args.extend(item)
+                n_msgs += 1
+                n_lines += sum(item[i].count("\n") for i in range(0, len(item), 2))
+        except queue.Empty:
+            pass
+        if args:
+            text = self.log_text
+            text.config(state=NORMAL)
+            text.insert(END, *args)
+            self._lines += n_lines
+            if self._lines > self.MAX_LINES:
+                excess = self._lines - self.MAX_LINES
+                text.delete("1.0", str(excess + 1) + ".0")
+                self._lines -= excess
+            text.see(END)
+            text.config(state=DISABLED)
+            self._log_count += n_msgs
+            self.count_label.config(text="(" + str(self._log_count) + ")")
+
+    def toggle(self):
+        if self._is_visible:
+            self.log_frame.pack_forget()
+            self.toggle_btn.config(text="Debug Console (tonen)")
+        else:
+            self.log_frame.pack(fill=BOTH, expand=True)
+            self.toggle_btn.config(text="Debug Console (verbergen)")
+        self._is_visible = not self._is_visible
+
+    def _copy_log(self):
+        self._flush_now()
+        self.winfo_toplevel().clipboard_clear()
+        self.winfo_toplevel().clipboard_append(self.log_text.get("1.0", END))
+        self.log("Log gekopieerd", "SUCCESS")
+
+    def _flush_now(self):
+        """Leegt de wachtrij direct (buiten de timer om), bijvoorbeeld vóór kopiëren."""
+        while not self._queue.empty():
+            self._drain()
+
+    def _clear_log(self):
+        self._flush_now()
+        self.log_text.config(state=NORMAL)
+        self.log_text.delete("1.0", END)
+        self.log_text.config(state=DISABLED)
+        self._lines = 0
+        self._log_count = 0
+        self.count_label.config(text="(0)")
+
+    # ─── profiel-tabel ───
+    def show_profile(self):
+        """Opent (of ververst) de sorteerbare tabel met de traagste varianten."""
+        if self.profiler is None:
+            self.log("Geen profiler beschikbaar", "WARNING")
+            return
+        if self._profile_win is not None and self._profile_win.winfo_exists():
+            self._profile_win.lift()
+            self._fill_profile()
+            return
+        from wlk.profiling import COLUMNS
+        win = self._profile_win = Toplevel(self)
+        win.title("Traagste varianten")
+        win.geometry("760x420")
+        bar = Frame(win)
+        bar.pack(fill=X)
+        ttk.Button(bar, text="Vernieuwen", command=self._fill_profile).pack(side=LEFT, padx=4, pady=4)
+        ttk.Button(bar, text="Wis metingen", command=lambda: (self.profiler.clear(), self._fill_profile())).pack(
+            side=LEFT, padx=4, pady=4)
+        tree = self._profile_tree = ttk.Treeview(win, columns=COLUMNS, show="headings")
+        for col in COLUMNS:
+            tree.heading(col, text=self.PROFILE_HEADINGS[col], command=lambda c=col: self._sort_profile(c))
+            tree.column(col, width=180 if col == "variant" else 70, anchor=W if col == "variant" else E)
+        tree.pack(fill=BOTH, expand=True)
+        tree.bind("<Double-1>", lambda e: self._log_profile_error())
+        self._fill_profile()
+
+    def _log_profile_error(self):
+        sel = self._profile_tree.selection()
+        if not sel: return
+        name = self._profile_tree.item(sel[0], "values")[0]
+        for r in self.profiler.rows():
+            if r["variant"] == name and r["last_error"]:
+                self.log(name + ": " + r["last_error"], "ERROR")
+
+    def _sort_profile(self, col):
+        key, desc = self._profile_sort
+        self._profile_sort = (col, not desc if col == key else col != "variant")
+        self._fill_profile()
+
+    def _fill_profile(self):
+        tree = self._profile_tree
+        key, desc = self._profile_sort
+        tree.delete(*tree.get_children())
+        for r in sorted(self.profiler.rows(), key=lambda r: r[key], reverse=desc):
+            tree.insert("", END, values=(r["variant"], r["renders"], format(r["last_ms"], ".2f"),
+                                         format(r["p50_ms"], ".2f"), format(r["p95_ms"], ".2f"),
+                                         format(r["max_ms"], ".2f"), r["bytes"], r["shapes"], r["errors"]))
+
+
+class CodeViewer(Frame):
+    """Alleen-lezen codeviewer die enkel de zichtbare regels in de Text-widget zet.
+
+    De volledige tekst blijft als lijst regels in Python; scrollbar, muiswiel en
+    PageUp/PageDown verschuiven het venster en zetten alleen die regels (plus een kleine
+    marge) opnieuw in de widget. Syntax-kleuren worden per venster toegepast, dus de kosten
+    van wisselen en scrollen hangen niet af van de lengte van de SVG.
+    """
+    MARGIN = 5
+    HIGHLIGHT = (
+        ("tag", re.compile(r"</?[\w:-]+|/?>"), "#569cd6"),
+        ("attr", re.compile(r"[\w:-]+(?==\")"), "#9cdcfe"),
+        ("value", re.compile(r'"[^"]*"'), "#ce9178"),
+    )
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.highlight = True
+        self._lines = [""]
+        self._top = 0
+        self._rows = 40
+        self._linespace = 0
+        self.scrollbar = Scrollbar(self, orient=VERTICAL, command=self._on_scrollbar)
+        self.text = Text(self, wrap=NONE, font=("Consolas", 9), state=DISABLED, bg="#1e1e1e", fg="#d4d4d4",
+                         insertbackground="#fff")
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+        self.text.pack(fill=BOTH, expand=True)
+        for tag, _, color in self.HIGHLIGHT:
+            self.text.tag_configure(tag, foreground=color)
+        self.text.bind("<Configure>", self._on_resize)
+        self.text.bind("<MouseWheel>", self._on_wheel)
+        self.text.bind("<Button-4>", self._on_wheel)
+        self.text.bind("<Button-5>", self._on_wheel)
+        self.text.bind("<Prior>", lambda e: self._scroll_to(self._top - self._rows))
+        self.text.bind("<Next>", lambda e: self._scroll_to(self._top + self._rows))
+        self.text.bind("<Control-Home>", lambda e: self._scroll_to(0))
+        self.text.bind("<Control-End>", lambda e: self._scroll_to(len(self._lines)))
+
+    def set_text(self, text):
+        self._lines = text.split("\n")
+        self._top = 0
+        self._render()
+
+    def get_text(self):
+        return "\n".join(self._lines)
+
+    def set_highlight(self, on):
+        self.highlight = bool(on)
+        self._render()
+
+    def _scroll_to(self, top):
+        top = max(0, min(int(top), len(self._lines) - self._rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * len(self._lines))
+        elif args[0] == "scroll":
+            step = self._rows if args[2] == "pages" else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4: delta = -3
+        elif event.num == 5: delta = 3
+        else: delta = -3 if event.delta > 0 else 3
+        return self._scroll_to(self._top + delta)
+
+    def _on_resize(self, event):
+        if not self._linespace:
+            from tkinter import font as tkfont
+            self._linespace = max(1, tkfont.Font(font=self.text["font"]).metrics("linespace"))
+        rows = max(1, event.height // self._linespace)
+        if rows != self._rows:
+            self._rows = rows
+            self._top = max(0, min(self._top, len(self._lines) - rows))
+            self._render()
+
+    def _render(self):
+        total = len(self._lines)
+        end = min(total, self._top + self._rows + self.MARGIN)
+        window = self._lines[self._top:end]
+        text = self.text
+        text.config(state=NORMAL)
+        text.delete("1.0", END)
+        text.insert("1.0", "\n".join(window))
+        if self.highlight:
+            for row, line in enumerate(window, 1):
+                prefix = str(row) + "."
+                for tag, rx, _ in self.HIGHLIGHT:
+                    for m in rx.finditer(line):
+                        text.tag_add(tag, prefix + str(m.start()), prefix + str(m.end()))
+        text.config(state=DISABLED)
+        self.scrollbar.set(self._top / total, min(1.0, (self._top + self._rows) / total))
+
+
+class CanvasPreview(Frame):
+    """Ingebouwde preview op een Tk Canvas (zie ``wlk.preview``).
+
+    Bij elke ``show`` worden de nieuwe items vergeleken met wat er al staat: ongewijzigde
+    items blijven staan, verdwenen items worden verwijderd en alleen nieuwe items worden
+    getekend. De stapelvolgorde wordt alleen hersteld vanaf het eerste gewijzigde item.
+    """
+
+    def __init__(self, parent, height=200, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.canvas = Canvas(self, height=height, bg="#ffffff", highlightthickness=0)
+        self.canvas.pack(fill=BOTH, expand=True)
+        self.families = {"w": ("Arial", "bold"), "tag": ("Arial", "bold")}
+        self.stats = (0, 0, 0)  # (hergebruikt, nieuw, verwijderd) bij de laatste tekenbeurt
+        self._svg = None
+        self._items = {}  # item -> [tuple canvas-id's, ...]
+        self._positions = {}  # tuple canvas-id's -> plek in de tekenvolgorde
+        self._fonts = {}
+        self._available = None
+        self.canvas.bind("<Configure>", lambda e: self._redraw())
+
+    def show(self, svg):
+        self._svg = svg
+        self._redraw()
+
+    def set_font_stack(self, stack):
+        """Kiest de eerste beschikbare familie uit een CSS font-stack voor de hoofdtekst."""
+        if self._available is None:
+            from tkinter import font as tkfont
+            self._available = {f.lower(): f for f in tkfont.families(self)}
+        family = "Arial"
+        for name in stack.split(","):
+            name = name.strip().strip("\"'")
+            if name.lower() in self._available:
+                family = self._available[name.lower()]
+                break
+        if self.families["w"][0] != family:
+            self.families["w"] = (family, "normal")
+            self.clear()
+
+    def clear(self):
+        self.canvas.delete("all")
+        self._items = {}
+        self._positions = {}
+        self._redraw()
+
+    def _font(self, css_class, px):
+        family, weight = self.families.get(css_class, self.families["tag"])
+        key = (family, weight, int(round(px)))
+        font = self._fonts.get(key)
+        if font is None:
+            from tkinter import font as tkfont
+            font = self._fonts[key] = tkfont.Font(family=family, size=-max(1, key[2]), weight=weight)
+        return font
+
+    def _draw(self, item):
+        c = self.canvas
+        if item[0] == "poly":
+            return (c.create_polygon(item[1], fill=item[2], outline=""),)
+        _, x, y, angle, anchor, css_class, spans = item
+        fonts = [self._font(css_class, size) for _, _, size, _ in spans]
+        widths = [f.measure(text) + dx for f, (text, _, _, dx) in zip(fonts, spans)]
+        total = sum(widths)
+        shift = total / 2.0 if anchor == "middle" else total if anchor == "end" else 0.0
+        cos, sin = math.cos(math.radians(angle)), -math.sin(math.radians(angle))
+        pos = -shift
+        ids = []
+        for font, (text, color, _, dx), width in zip(fonts, spans, widths):
+            pos += dx
+            # Tk plaatst de onderkant van de tekst op y; de SVG-basislijn ligt "descent" hoger.
+            down = font.metrics("descent")
+            ids.append(c.create_text(x + pos * cos - down * sin, y + pos * sin + down * cos, text=text,
+                                     fill=color, font=font, anchor="sw", angle=angle))
+            pos += width - dx
+        return tuple(ids)
+
+    def _redraw(self):
+        if self._svg is None:
+            return
+        from wlk.preview import canvas_items
+        c = self.canvas
+        cw, ch = c.winfo_width(), c.winfo_height()
+        if cw < 2 or ch < 2:
+            return
+        try:
+            _, _, items = canvas_items(self._svg, cw, ch)
+        except (ValueError, SyntaxError):  # ParseError is een SyntaxError
+            items = []
+        old = self._items
+        positions = self._positions
+        new = {}
+        order = []
+        reused = created = 0
+        dirty = False
+        last_pos = -1
+        for item in items:
+            bucket = old.get(item)
+            if bucket:
+                ids = bucket.pop()
+                reused += 1
+                pos = positions.get(ids, -1)
+                if pos < last_pos:
+                    dirty = True
+                last_pos = pos
+                if dirty:
+                    for i in ids:
+                        c.tag_raise(i)
+            else:
+                ids = self._draw(item)
+                created += 1
+                dirty = True
+            new.setdefault(item, []).append(ids)
+            order.append(ids)
+        deleted = 0
+        for bucket in old.values():
+            for ids in bucket:
+                c.delete(*ids)
+                deleted += 1
+        self._items = new
+        self._positions = {ids: n for n, ids in enumerate(order)}
+        self.stats = (reused, created, deleted)
+
+
+# ─── UPDATER LOGICA ─────────────────────────────────────
+
+def _open_in_browser(path):
+    import webbrowser
+    webbrowser.open(path.as_uri())
+
+
+UPDATE_REQUIRED_FILES = ("logo_designer.py", "wlk/__init__.py")
+
+
+def _version_tuple(text):
+    """``"1.10.2"`` -> ``(1, 10, 2)``, zodat versies numeriek vergeleken worden ("1.10" > "1.9")."""
+    return tuple(int(part) for part in text.split(".") if part.isdigit())
+
+
+def _update_members(zf, app_dir):
+    """{relatief pad: ZipInfo} van de launcher en ``wlk/*.py`` uit het archief.
+
+    Weigert het hele archief (ValueError) als een pad buiten ``app_dir`` uitkomt of als
+    een van ``UPDATE_REQUIRED_FILES`` ontbreekt."""
+    root = Path(app_dir).resolve()
+    members = {}
+    for info in zf.infolist():
+        if info.is_dir(): continue
+        rel = info.filename.split("/", 1)[-1]
+        if rel != "logo_designer.py" and not (rel.startswith("wlk/") and rel.endswith(".py")):
+            continue
+        parts = PurePosixPath(rel).parts
+        target = (root / rel).resolve()
+        if "\\" in rel or ".." in parts or PurePosixPath(rel).is_absolute() or root not in target.parents:
+            raise ValueError("onveilig pad in update-archief: " + info.filename)
+        members[rel] = info
+    missing = [name for name in UPDATE_REQUIRED_FILES if name not in members]
+    if missing:
+        raise ValueError("update-archief onvolledig, ontbreekt: " + ", ".join(missing))
+    return members
+
+
+def _install_update_archive(data, app_dir):
+    """Installeert logo_designer.py en het wlk-pakket uit de GitHub zip.
+
+    Alles wordt eerst gecontroleerd en in een tijdelijke map naast de app uitgepakt; pas
+    daarna worden ``wlk/`` en de launcher in hun geheel omgewisseld. Mislukt het omwisselen,
+    dan wordt de oude versie teruggezet, zodat er nooit een mengsel van versies staat."""
+    import io
+    import shutil
+    import zipfile
+    app_dir = Path(app_dir)
+    staging = Path(tempfile.mkdtemp(prefix=".wlk-update-", dir=app_dir))
+    try:
+        new = staging / "nieuw"
+        backup = staging / "oud"
+        backup.mkdir()
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            for rel, info in _update_members(zf, app_dir).items():
+                target = new / rel
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(zf.read(info))
+        moved = []
+        try:
+            for name in ("wlk", "logo_designer.py"):
+                if (app_dir / name).exists():
+                    os.replace(app_dir / name, backup / name)
+                    moved.append(name)
+                os.replace(new / name, app_dir / name)
+        except OSError:
+            for name in ("wlk", "logo_designer.py"):
+                if name not in moved: continue
+                current = app_dir / name
+                if current.is_dir(): shutil.rmtree(current)
+                elif current.exists(): current.unlink()
+                os.replace(backup / name, current)
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def check_for_updates(debug_console=None, quiet=False):
+    """Controleert op updates via de Raw GitHub link."""
+    import urllib.request
+    try:
+        if debug_console: debug_console.log("Controleren op updates...", "INFO")
+        
+        # Download de versie-informatie van internet
+        with urllib.request.urlopen(UPDATE_URL, timeout=5) as response:
+            content = response.read().decode('utf-8')
+        
+        # Zoek naar APP_VERSION in de gedownloade code
+        match = re.search(r'APP_VERSION = "([\d\.]+)"', content)
+        if not match:
+            if not quiet: messagebox.showerror("Update", "Kon versienummer online niet vinden.")
+            return
+
+        new_version = match.group(1)
+
+        if _version_tuple(new_version) > _version_tuple(APP_VERSION):
+            if debug_console: debug_console.log(f"Nieuwe versie gevonden: {new_version}", "ACTION")
+            if messagebox.askyesno("Update beschikbaar", 
+                                   f"Er is een nieuwe versie ({new_version}) beschikbaar.\nHuidige versie: {APP_VERSION}\n\nWil je de update nu installeren?"):
+                # Overschrijf launcher en wlk-pakket met de versie uit het archief
+                with urllib.request.urlopen(UPDATE_ARCHIVE_URL, timeout=30) as response:
+                    data = response.read()
+                _install_update_archive(data, Path(os.path.realpath(sys.argv[0])).parent)
+                
+                messagebox.showinfo("Klaar", "Update succesvol geïnstalleerd. Het programma wordt herstart.")
+                # Herstart script
+                os.execl(sys.executable, sys.executable, *sys.argv)
+        else:
+            if debug_console: debug_console.log("Programma is up-to-date.", "SUCCESS")
+            if not quiet: messagebox.showinfo("Update", f"Je gebruikt de nieuwste versie ({APP_VERSION}).")
+            
+    except Exception as e:
+        if debug_console: debug_console.log(f"Updater fout: {str(e)}", "ERROR")
+        if not quiet: messagebox.showerror("Update Fout", f"Kon niet controleren op updates:\n{str(e)}")
+
+
+# ─── MAIN APP ───────────────────────────────────────────
+
+class LogoDesignerApp:
+    DIMENSION_PRESETS = DIMENSION_PRESETS
+    RENDER_CACHE_BYTES = 64 * 1024 * 1024
+    LIVE_DEBOUNCE_MS = 150
+    LIVE_POLL_MS = 30
+
+    def __init__(self):
+        self.root = Tk()
+        self.root.title("sm0kez Logo Designer v" + APP_VERSION)
+        self.root.geometry("1300x1000")
+        self.root.minsize(1100, 800)
+
+        self.settings = SettingsStore(CONFIG_FILE, on_error=self._on_settings_error)
+        self._load_settings()
+        self.profiles = ProfileDB(PROFILE_DB)
+        self._profile = None
+
+        self.svgs = []
+        self.selected_idx = 0
+        self.render_cache = RenderCache(self.RENDER_CACHE_BYTES, disk=DiskCache())
+        self.profiler = RenderProfiler()
+        self._live_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wlk-live")
+        self._live_results = queue.SimpleQueue()
+        self._live_gen = 0
+        self._live_after = None
+        self._applying_config = False  # traces negeren tijdens _apply_config
+        self._live_future = None
+        self._live_polling = False
+        self._tmp_dir = Path(tempfile.mkdtemp(prefix="wlk_logos_"))
+
+        self.var_left = StringVar(value=self.cfg.left)
+        self.var_right = StringVar(value=self.cfg.right)
+        self.var_tld = StringVar(value=self.cfg.tld)
+        self.var_tagline = StringVar(value=self.cfg.tagline)
+        self.var_tld_scale = StringVar(value=str(self.cfg.tld_scale))
+        self.var_word_gap = StringVar(value=str(self.cfg.word_gap))
+        self.var_tld_gap = StringVar(value=str(self.cfg.tld_gap))
+        self.var_letter_spacing = StringVar(value=str(self.cfg.letter_spacing))
+        self.var_icon_offset_x = StringVar(value=str(self.cfg.icon_offset_x))
+        self.var_icon_offset_y = StringVar(value=str(self.cfg.icon_offset_y))
+        self.var_icon_scale = StringVar(value=str(self.cfg.icon_scale))
+        self.var_width = StringVar(value=str(self.cfg.out_width))
+        self.var_height = StringVar(value=str(self.cfg.out_height))
+        self.var_fs_main = StringVar(value=str(self.cfg.fs_main))
+        self.var_c_dark = StringVar(value=self.cfg.color_dark)
+        self.var_c_red = StringVar(value=self.cfg.color_red)
+        self.var_c_gold = StringVar(value=self.cfg.color_gold)
+        self.var_c_white = StringVar(value=self.cfg.color_white)
+        self.var_c_grey = StringVar(value=self.cfg.color_grey)
+        self.var_c_bgdark = StringVar(value=self.cfg.bg_dark)
+        self.var_status = StringVar(value="Klaar")
+        self.var_live = BooleanVar(value=False)
+        self.var_instancing = BooleanVar(value=self.cfg.instancing)
+        self.var_outlines = BooleanVar(value=self.cfg.text_outlines)
+        self.var_profiling = BooleanVar(value=False)
+        self.var_highlight = BooleanVar(value=True)
+
+        self._build_ui()
+        for var in (self.var_left, self.var_right, self.var_tld, self.var_tagline, self.var_tld_scale,
+                    self.var_word_gap, self.var_tld_gap, self.var_letter_spacing, self.var_icon_offset_x,
+                    self.var_icon_offset_y, self.var_icon_scale, self.var_width, self.var_height,
+                    self.var_fs_main, self.var_c_dark, self.var_c_red, self.var_c_gold, self.var_c_white,
+                    self.var_c_grey, self.var_c_bgdark, self.var_instancing, self.var_outlines):
+            var.trace_add("write", self._on_config_var_changed)
+        self.debug.log_separator("APPLICATIE GESTART")
+        self.debug.log("v" + APP_VERSION + " | Updater geactiveerd", "INFO")
+        for problem in self._settings_problems:
+            self.debug.log("Instellingen: " + problem, "WARNING")
+        for problem in registry.problems:
+            self.debug.log("Plugins: " + problem, "WARNING")
+        self._generate()
+
+    def _load_settings(self):
+        self.cfg, self._settings_problems = self.settings.load()
+
+    def _save_settings(self):
+        # Samengevoegd en vertraagd; de store schrijft alleen als er echt iets veranderd is.
+        self.settings.save(asdict(self.cfg))
+
+    def _on_settings_error(self, exc):
+        # Komt van de timer-thread; log() zet alleen iets in de wachtrij.
+        self.debug.log("Instellingen opslaan mislukt: " + str(exc), "ERROR")
+
+    def _build_ui(self):
+        root = self.root
+        menubar = Menu(root)
+        
+        # Bestand Menu
+        file_menu = Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Exporteer geselecteerde SVG...", command=lambda: self._safe("export_sel", self._export_selected))
+        file_menu.add_command(label="Exporteer alle SVG's...", command=lambda: self._safe("export_all", self._export_all))
+        file_menu.add_command(label="Exporteer alle als ZIP...", command=lambda: self._safe("export_zip", self._export_zip))
+        file_menu.add_command(label="Exporteer geselecteerde PNG...", command=lambda: self._safe("export_png", self._export_selected_png))
+        file_menu.add_separator()
+        file_menu.add_command(label="Render alle profielen...", command=lambda: self._safe("profielen_render", self._render_all_profiles))
+        file_menu.add_separator()
+        file_menu.add_command(label="Afsluiten", command=self._quit)
+        menubar.add_cascade(label="Bestand", menu=file_menu)
+        
+        # Beeld Menu
+        view_menu = Menu(menubar, tearoff=0)
+        view_menu.add_command(label="Preview alle (browser)", command=lambda: self._safe("preview_all", self._open_all_browser))
+        view_menu.add_command(label="Preview geselecteerd (browser)", command=lambda: self._safe("preview_sel", self._open_selected_browser))
+        view_menu.add_separator()
+        view_menu.add_command(label="Toggle debug console", command=lambda: self.debug.toggle())
+        view_menu.add_checkbutton(label="Render-profilering", variable=self.var_profiling,
+                                  command=self._toggle_profiling)
+        view_menu.add_command(label="Traagste varianten...", command=lambda: self.debug.show_profile())
+        view_menu.add_command(label="cProfile van volledige generatie...",
+                              command=lambda: self._safe("profile", self._profile_generate))
+        menubar.add_cascade(label="Beeld", menu=view_menu)
+
+        # Help Menu (Nieuw voor updater)
+        help_menu = Menu(menubar, tearoff=0)
+        help_menu.add_command(label="Zoek naar updates...", command=lambda: check_for_updates(self.debug, False))
+        help_menu.add_separator()
+        help_menu.add_command(label="Over...", command=lambda: messagebox.showinfo("Over", f"sm0kez Logo Designer v{APP_VERSION}\nOntwikkeld door sm0kez\nLicentie: MIT"))
+        menubar.add_cascade(label="Help", menu=help_menu)
+
+        root.config(menu=menubar)
+
+        main_container = Frame(root)
+        main_container.pack(fill=BOTH, expand=True)
+
+        settings_frame = ttk.LabelFrame(main_container, text=" Instellingen ", padding=8)
+        settings_frame.pack(fill=X, padx=10, pady=(8, 4))
+
+        row0 = Frame(settings_frame)
+        row0.pack(fill=X, pady=(0, 3))
+        ttk.Label(row0, text="Profiel:").pack(side=LEFT, padx=(0, 3))
+        self.profile_combo = ttk.Combobox(row0, width=32, state="readonly", values=self.profiles.names())
+        self.profile_combo.pack(side=LEFT, padx=(0, 4))
+        self.profile_combo.bind("<<ComboboxSelected>>", lambda e: self._safe("profiel", self._on_profile_select))
+        for text, cmd in [("Opslaan als...", self._profile_save_as),
+                          ("Override voor preset", self._profile_save_override),
+                          ("Verwijderen", self._profile_delete)]:
+            ttk.Button(row0, text=text, command=lambda c=cmd, t=text: self._safe("profiel:" + t, c)).pack(side=LEFT, padx=(0, 4))
+
+        row1 = Frame(settings_frame)
+        row1.pack(fill=X, pady=(0, 3))
+        ttk.Label(row1, text="Links:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row1, textvariable=self.var_left, width=14).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row1, text="Rechts:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row1, textvariable=self.var_right, width=12).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row1, text="TLD:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row1, textvariable=self.var_tld, width=5).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row1, text="TLD schaal:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row1, textvariable=self.var_tld_scale, width=5).pack(side=LEFT)
+
+        row2 = Frame(settings_frame)
+        row2.pack(fill=X, pady=(0, 3))
+        ttk.Label(row2, text="Woord gap:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row2, textvariable=self.var_word_gap, width=5).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row2, text="TLD gap:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row2, textvariable=self.var_tld_gap, width=5).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row2, text="Letter-spacing:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row2, textvariable=self.var_letter_spacing, width=5).pack(side=LEFT, padx=(0, 16))
+        ttk.Separator(row2, orient=VERTICAL).pack(side=LEFT, fill=Y, padx=8)
+        ttk.Label(row2, text="Icoon X:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row2, textvariable=self.var_icon_offset_x, width=5).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row2, text="Icoon Y:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row2, textvariable=self.var_icon_offset_y, width=5).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row2, text="Icoon schaal:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row2, textvariable=self.var_icon_scale, width=5).pack(side=LEFT)
+
+        row3 = Frame(settings_frame)
+        row3.pack(fill=X, pady=(0, 3))
+        ttk.Label(row3, text="Breedte:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row3, textvariable=self.var_width, width=6).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row3, text="Hoogte:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row3, textvariable=self.var_height, width=6).pack(side=LEFT, padx=(0, 8))
+        ttk.Label(row3, text="Font size:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row3, textvariable=self.var_fs_main, width=5).pack(side=LEFT, padx=(0, 12))
+        ttk.Label(row3, text="Preset:").pack(side=LEFT, padx=(0, 3))
+        self.preset_combo = ttk.Combobox(row3, width=32, state="readonly", values=[p[0] for p in self.DIMENSION_PRESETS])
+        self.preset_combo.pack(side=LEFT, padx=(0, 4))
+        self.preset_combo.bind("<<ComboboxSelected>>", self._on_preset_select)
+
+        row4 = Frame(settings_frame)
+        row4.pack(fill=X, pady=(0, 3))
+        ttk.Label(row4, text="Tagline:").pack(side=LEFT, padx=(0, 3))
+        ttk.Entry(row4, textvariable=self.var_tagline, width=55).pack(side=LEFT, fill=X, expand=True, padx=(0, 8))
+
+        row5 = Frame(settings_frame)
+        row5.pack(fill=X, pady=(0, 3))
+        self._color_buttons = {}
+        for label_text, var in [("Donker", self.var_c_dark), ("Rood", self.var_c_red), ("Goud", self.var_c_gold),
+                                 ("Wit", self.var_c_white), ("Grijs", self.var_c_grey), ("Achtergr.", self.var_c_bgdark)]:
+            f = Frame(row5)
+            f.pack(side=LEFT, padx=(0, 6))
+            ttk.Label(f, text=label_text + ":").pack(side=LEFT, padx=(0, 2))
+            btn = ttk.Button(f, text=var.get(), width=9,
+                            command=lambda v=var, lt=label_text: self._safe("kleur:" + lt, lambda: self._pick_color(v, lt)))
+            btn.pack(side=LEFT)
+            self._color_buttons[id(var)] = btn
+
+        row6 = Frame(settings_frame)
+        row6.pack(fill=X, pady=(4, 0))
+        for text, cmd in [("Genereer logo's", lambda: self._safe("genereer", self._generate)),
+                          ("Alle in browser", lambda: self._safe("browser_all", self._open_all_browser)),
+                          ("Preview geselecteerd", lambda: self._safe("browser_sel", self._open_selected_browser)),
+                          ("Kopieer SVG", lambda: self._safe("copy_svg", self._copy_svg)),
+                          ("Exporteer 1...", lambda: self._safe("export_sel", self._export_selected)),
+                          ("Exporteer alle...", lambda: self._safe("export_all", self._export_all))]:
+            ttk.Button(row6, text=text, command=cmd).pack(side=LEFT, padx=(0, 6))
+        ttk.Checkbutton(row6, text="Live preview", variable=self.var_live,
+                        command=self._on_live_toggle).pack(side=LEFT, padx=(6, 0))
+        ttk.Checkbutton(row6, text="Instancing (<use>)", variable=self.var_instancing).pack(side=LEFT, padx=(6, 0))
+        ttk.Checkbutton(row6, text="Tekst als contouren", variable=self.var_outlines).pack(side=LEFT, padx=(6, 0))
+
+        mid_frame = Frame(main_container)
+        mid_frame.pack(fill=BOTH, expand=True, padx=10, pady=4)
+
+        list_frame = ttk.LabelFrame(mid_frame, text=" Varianten (" + str(len(registry.variants())) + ") ",
+                                    padding=4)
+        list_frame.pack(side=LEFT, fill=Y, padx=(0, 6))
+        self.variant_listbox = ttk.Treeview(list_frame, columns=("name",), show="tree", height=18, selectmode="browse")
+        self.variant_listbox.column("#0", width=0, stretch=False)
+        self.variant_listbox.column("name", width=300)
+        list_scroll = Scrollbar(list_frame, orient=VERTICAL, command=self.variant_listbox.yview)
+        self.variant_listbox.config(yscrollcommand=list_scroll.set)
+        list_scroll.pack(side=RIGHT, fill=Y)
+        self.variant_listbox.pack(fill=Y, expand=True)
+        self.variant_listbox.bind("<<TreeviewSelect>>", self._on_variant_select)
+        # Labels uit de metadata, zodat de lijst er al staat voordat er iets gerenderd is.
+        for v in registry.variants():
+            self.variant_listbox.insert("", END, values=(v.label,))
+
+        right_col = Frame(mid_frame)
+        right_col.pack(side=LEFT, fill=BOTH, expand=True)
+        preview_frame = ttk.LabelFrame(right_col, text=" Preview ", padding=4)
+        preview_frame.pack(fill=X, pady=(0, 4))
+        self.preview = CanvasPreview(preview_frame, height=200)
+        self.preview.pack(fill=X)
+        right_frame = ttk.LabelFrame(right_col, text=" SVG Code ", padding=4)
+        right_frame.pack(fill=BOTH, expand=True)
+        self.info_label = ttk.Label(right_frame, text="", wraplength=700, justify=LEFT)
+        self.info_label.pack(fill=X, pady=(0, 4))
+        ttk.Checkbutton(right_frame, text="Syntax-kleuren", variable=self.var_highlight,
+                        command=lambda: self.code_view.set_highlight(self.var_highlight.get())).pack(anchor=W)
+        self.code_view = CodeViewer(right_frame)
+        self.code_view.pack(fill=BOTH, expand=True)
+
+        ttk.Label(main_container, textvariable=self.var_status, relief=SUNKEN, anchor=W, padding=4).pack(
+            fill=X, side=BOTTOM, padx=10, pady=(0, 2))
+
+        self.debug = DebugConsole(root)
+        self.debug.pack(fill=X, side=BOTTOM, padx=10, pady=(0, 6))
+        self.debug.profiler = self.profiler
+
+    def _on_preset_select(self, event=None):
+        idx = self.preset_combo.current()
+        if idx < 0: return
+        name, w, h, fs = self.DIMENSION_PRESETS[idx]
+        if self._profile is not None:
+            # Met een actief profiel: profiel + preset-maten + de overrides van die preset.
+            self._apply_config(self.profiles.get(self._profile, name))
+            return
+        self.var_width.set(str(w)); self.var_height.set(str(h)); self.var_fs_main.set(str(fs))
+
+    # ─── profielen ───
+
+    def _config_vars(self):
+        return [("left", self.var_left), ("right", self.var_right), ("tld", self.var_tld),
+                ("tagline", self.var_tagline), ("tld_scale", self.var_tld_scale), ("word_gap", self.var_word_gap),
+                ("tld_gap", self.var_tld_gap), ("letter_spacing", self.var_letter_spacing),
+                ("icon_offset_x", self.var_icon_offset_x), ("icon_offset_y", self.var_icon_offset_y),
+                ("icon_scale", self.var_icon_scale), ("out_width", self.var_width), ("out_height", self.var_height),
+                ("fs_main", self.var_fs_main), ("color_dark", self.var_c_dark), ("color_red", self.var_c_red),
+                ("color_gold", self.var_c_gold), ("color_white", self.var_c_white), ("color_grey", self.var_c_grey),
+                ("bg_dark", self.var_c_bgdark), ("instancing", self.var_instancing),
+                ("text_outlines", self.var_outlines)]
+
+    def _apply_config(self, cfg):
+        # Zonder live-render per var.set(): _generate() rendert hierna één keer alles.
+        if self._live_after is not None:
+            self.root.after_cancel(self._live_after)
+            self._live_after = None
+        self._applying_config = True
+        try:
+            for name, var in self._config_vars():
+                value = getattr(cfg, name)
+                var.set(value if isinstance(var, BooleanVar) else str(value))
+                btn = self._color_buttons.get(id(var))
+                if btn: btn.config(text=value)
+        finally:
+            self._applying_config = False
+        self._generate()
+
+    def _on_profile_select(self):
+        name = self.profile_combo.get()
+        if not name: return
+        preset = self.preset_combo.get() or None
+        self._profile = name
+        self._apply_config(self.profiles.get(name, preset))
+        self.debug.log("Profiel geladen: " + name + (" (preset: " + preset + ")" if preset else ""), "ACTION")
+
+    def _profile_save_as(self):
+        from tkinter import simpledialog
+        self._sync_config()
+        name = simpledialog.askstring("Profiel opslaan", "Naam van het profiel:", parent=self.root,
+                                      initialvalue=self._profile or domain_of(self.cfg))
+        if not name or not name.strip(): return
+        name = name.strip()
+        self.profiles.save(name, self.cfg)
+        self._profile = name
+        self.profile_combo.config(values=self.profiles.names())
+        self.profile_combo.set(name)
+        self.debug.log("Profiel opgeslagen: " + name, "SUCCESS")
+
+    def _profile_save_override(self):
+        preset = self.preset_combo.get()
+        if self._profile is None or not preset:
+            messagebox.showinfo("Override", "Kies eerst een profiel en een preset.")
+            return
+        self._sync_config()
+        # Alleen wat afwijkt van profiel + preset-maten wordt een override.
+        base = self.profiles.get(self._profile, preset, overrides=False)
+        diff = {k: v for k, v in asdict(self.cfg).items() if getattr(base, k) != v}
+        self.profiles.set_override(self._profile, preset, diff)
+        self.debug.log("Override voor '" + preset + "' opgeslagen: " + (", ".join(sorted(diff)) or "geen verschillen"),
+                       "SUCCESS")
+
+    def _profile_delete(self):
+        name = self.profile_combo.get()
+        if not name or not messagebox.askyesno("Profiel verwijderen", "Profiel '" + name + "' verwijderen?"): return
+        self.profiles.delete(name)
+        self._profile = None
+        self.profile_combo.set("")
+        self.profile_combo.config(values=self.profiles.names())
+        self.debug.log("Profiel verwijderd: " + name, "ACTION")
+
+    def _render_all_profiles(self):
+        if not len(self.profiles):
+            messagebox.showinfo("Profielen", "Er zijn nog geen profielen opgeslagen.")
+            return
+        folder = filedialog.askdirectory(title="Uitvoermap voor alle profielen")
+        if not folder: return
+        preset = self.preset_combo.get() or None
+        path = self.profiles.path
+        self.debug.log("Render alle profielen x alle varianten naar " + folder
+                       + (" (preset: " + preset + ")" if preset else "") + "...", "ACTION")
+
+        def job():
+            # Eigen verbinding: een sqlite-verbinding hoort bij de thread die hem opende.
+            from wlk.batch import run_batch
+            try:
+                with ProfileDB(path) as db:
+                    stats = run_batch((cfg for _, cfg in db.iter_configs(preset)), folder,
+                                      log=lambda m: self.debug.log(m, "DEBUG"), incremental=True)
+            except Exception:
+                self.debug.log_exception("profielen_render")
+                return
+            self.debug.log(str(stats.configs) + " profielen, " + str(stats.variants) + " varianten ("
+                           + str(stats.skipped) + " ongewijzigd), " + str(stats.errors) + " fouten in "
+                           + format(stats.seconds, ".1f") + " s", "WARNING" if stats.errors else "SUCCESS")
+
+        threading.Thread(target=job, name="wlk-profielen", daemon=True).start()
+
+    def _safe(self, name, func):
+        try: func()
+        except Exception: self.debug.log_exception(name)
+
+    def _pick_color(self, var, label):
+        from tkinter import colorchooser
+        result = colorchooser.askcolor(color=var.get(), title="Kleur: " + label)
+        if result and result[1]:
+            var.set(result[1])
+            btn = self._color_buttons.get(id(var))
+            if btn: btn.config(text=result[1])
+
+    def _int_safe(self, var, default):
+        try: return int(var.get())
+        except ValueError: return default
+
+    def _float_safe(self, var, default):
+        try: return float(var.get())
+        except ValueError: return default
+
+    def _sync_config(self):
+        c = self.cfg
+        c.left = self.var_left.get().strip() or "W\u00c4LZLAGER"
+        c.right = self.var_right.get().strip() or "K\u00d6NIG"
+        c.tld = self.var_tld.get().strip() or ".DE"
+        c.tagline = self.var_tagline.get().strip()
+        c.tld_scale = self._float_safe(self.var_tld_scale, 0.44)
+        c.word_gap = self._int_safe(self.var_word_gap, 0)
+        c.tld_gap = self._int_safe(self.var_tld_gap, 0)
+        c.letter_spacing = self._float_safe(self.var_letter_spacing, 0)
+        c.icon_offset_x = self._int_safe(self.var_icon_offset_x, 0)
+        c.icon_offset_y = self._int_safe(self.var_icon_offset_y, 0)
+        c.icon_scale = max(0.1, self._float_safe(self.var_icon_scale, 1.0))
+        c.out_width = max(100, self._int_safe(self.var_width, 1200))
+        c.out_height = max(50, self._int_safe(self.var_height, 140))
+        c.fs_main = max(10, self._int_safe(self.var_fs_main, 96))
+        c.color_dark = self.var_c_dark.get().strip()
+        c.color_red = self.var_c_red.get().strip()
+        c.color_gold = self.var_c_gold.get().strip()
+        c.color_white = self.var_c_white.get().strip()
+        c.color_grey = self.var_c_grey.get().strip()
+        c.bg_dark = self.var_c_bgdark.get().strip()
+        c.instancing = bool(self.var_instancing.get())
+        c.text_outlines = bool(self.var_outlines.get())
+
+    def _render_variants(self, cfg, is_stale=None):
+        """Rendert alle varianten via de cache; veilig vanuit een worker-thread.
+        Geeft None terug als ``is_stale()`` halverwege waar wordt."""
+        svgs = []
+        skipped = 0
+        for fn in registry.variants():
+            if is_stale is not None and is_stale(): return None
+            try:
+                result, reused = self.render_cache.render_incremental(fn, cfg)
+                svgs.append(result)
+                skipped += reused
+            except Exception as e:
+                self.profiler.record_error(fn.__name__, repr(e))
+                svgs.append(("FOUT", "<svg></svg>"))
+        return svgs, skipped
+
+    def _toggle_profiling(self):
+        on = self.var_profiling.get()
+        self.render_cache.profiler = self.profiler if on else None
+        self.debug.log("Render-profilering " + ("aan" if on else "uit"), "ACTION")
+
+    def _profile_generate(self):
+        """Eén volledige generatie onder cProfile, met een lege cache zodat alles echt rendert."""
+        path = filedialog.asksaveasfilename(defaultextension=".pstats", filetypes=[("pstats", "*.pstats")],
+                                            initialfile="wlk_generate.pstats")
+        if not path: return
+        cache = self.render_cache
+        self.render_cache = RenderCache(self.RENDER_CACHE_BYTES, profiler=cache.profiler)
+        try:
+            _, summary = run_profiled(self._generate, path)
+        finally:
+            self.render_cache = cache
+        self.debug.log("cProfile opgeslagen: " + path + " (bekijk met python -m pstats)", "SUCCESS")
+        self.debug.log(summary.strip(), "DEBUG")
+
+    def _check_text_fit(self, cfg):
+        from wlk.fonts import fit_font_size, main_font, main_text_width
+        font = main_font()
+        width = main_text_width(cfg, font)
+        if width + 48 > cfg.out_width:
+            self.debug.log("Hoofdtekst is ~" + str(int(width)) + " px breed en past niet in " + str(cfg.out_width)
+                           + " px (font: " + font.name + "); passend fs_main: " + str(fit_font_size(cfg, font=font)),
+                           "WARNING")
+
+    def _generate(self):
+        self._sync_config()
+        self._save_settings()
+        self._check_text_fit(self.cfg)
+        self._live_gen += 1  # lopende live-render is nu verouderd
+        svgs, skipped = self._render_variants(self.cfg)
+        self._show_svgs(svgs, skipped)
+
+    def _show_svgs(self, svgs, skipped, keep_selection=False):
+        failed = sum(1 for label, _ in svgs if label == "FOUT")
+        if failed:
+            self.debug.log(str(failed) + " varianten mislukt; zie Profiel voor de laatste fout per variant", "WARNING")
+        if self.var_profiling.get():
+            slow = self.profiler.slowest(3)
+            if slow:
+                self.debug.log("Traagst (p95): " + ", ".join(r["variant"] + " " + format(r["p95_ms"], ".2f") + " ms"
+                                                             for r in slow), "DEBUG")
+        self.debug.log("Regeneratie: " + str(len(svgs) - skipped) + " gerenderd, " + str(skipped)
+                       + " overgeslagen (gelezen velden ongewijzigd)", "DEBUG")
+        st = self.render_cache.stats()
+        self.debug.log("Render-cache: " + str(st["hits"]) + " hits, " + str(st["misses"]) + " misses, "
+                       + str(st["evictions"]) + " evictions, " + str(st["entries"]) + " items ("
+                       + str(st["bytes"] // 1024) + " KB)", "DEBUG")
+        if self.render_cache.disk is not None:
+            ds = self.render_cache.disk.stats()
+            self.debug.log("Schijfcache: " + str(ds["hits"]) + " hits, " + str(ds["misses"]) + " misses, "
+                           + str(ds["evictions"]) + " evictions (" + ds["path"] + ")", "DEBUG")
+        old = self.svgs
+        self.svgs = svgs
+        children = self.variant_listbox.get_children()
+        if keep_selection and len(children) == len(svgs):
+            # Bij de eerste render staan alleen de metadata-rijen er; ``old`` is dan nog leeg.
+            for i, (iid, (label, _)) in enumerate(zip(children, svgs)):
+                if i >= len(old) or old[i][0] != label: self.variant_listbox.item(iid, values=(label,))
+            if len(old) != len(svgs) or old[self.selected_idx] != svgs[self.selected_idx]: self._update_detail()
+        else:
+            self.variant_listbox.delete(*children)
+            for i, (label, _) in enumerate(self.svgs):
+                iid = self.variant_listbox.insert("", END, values=(label,))
+                if i == 0: self.variant_listbox.selection_set(iid)
+            self.selected_idx = 0
+            self._update_detail()
+        self.var_status.set(str(len(self.svgs)) + " varianten OK")
+
+    # ─── live preview ───
+
+    def _on_live_toggle(self):
+        if self.var_live.get():
+            self.debug.log("Live preview aan (debounce " + str(self.LIVE_DEBOUNCE_MS) + " ms)", "ACTION")
+            self._on_config_var_changed()
+        else:
+            self.debug.log("Live preview uit", "ACTION")
+
+    def _on_config_var_changed(self, *_):
+        if self._applying_config or not self.var_live.get(): return
+        if self._live_after is not None: self.root.after_cancel(self._live_after)
+        self._live_after = self.root.after(self.LIVE_DEBOUNCE_MS, lambda: self._safe("live", self._start_live_render))
+
+    def _start_live_render(self):
+        self._live_after = None
+        self._sync_config()
+        cfg = replace(self.cfg)  # eigen kopie voor de worker-thread
+        self._check_text_fit(cfg)
+        self._live_gen += 1
+        gen = self._live_gen
+        if self._live_future is not None: self._live_future.cancel()  # nog niet gestart: vervalt
+        self._live_future = self._live_pool.submit(self._live_job, gen, cfg)
+        if not self._live_polling:
+            self._live_polling = True
+            self.root.after(self.LIVE_POLL_MS, self._poll_live)
+
+    def _live_job(self, gen, cfg):
+        # Draait op de worker-thread: geen Tk-aanroepen hier, alleen de queue.
+        try:
+            out = self._render_variants(cfg, is_stale=lambda: gen != self._live_gen)
+        except Exception:
+            out = traceback.format_exc()
+        self._live_results.put((gen, out))
+
+    def _poll_live(self):
+        latest = None
+        while True:
+            try: gen, out = self._live_results.get_nowait()
+            except queue.Empty: break
+            if isinstance(out, str): self.debug.log("Live render mislukt:\n" + out, "ERROR")
+            elif out is not None and gen == self._live_gen: latest = out
+        if latest is not None:
+            self._save_settings()
+            self._safe("live_toon", lambda: self._show_svgs(latest[0], latest[1], keep_selection=True))
+        if self._live_future is not None and not self._live_future.done() or not self._live_results.empty():
+            self.root.after(self.LIVE_POLL_MS, self._poll_live)
+        else:
+            self._live_polling = False
+
+    def _on_variant_select(self, event=None):
+        sel = self.variant_listbox.selection()
+        if not sel: return
+        self.selected_idx = list(self.variant_listbox.get_children()).index(sel[0])
+        self._update_detail()
+
+    def _update_detail(self):
+        if not self.svgs: return
+        label, svg_code = self.svgs[self.selected_idx]
+        self.info_label.config(text=label)
+        self.code_view.set_text(svg_code)
+        self.preview.set_font_stack(self.cfg.font_stack)
+        self.preview.show(svg_code)
+
+    def _write_tmp(self, name, content):
+        p = self._tmp_dir / name
+        p.write_text(content, encoding="utf-8")
+        return p
+
+    def _open_all_browser(self):
+        if not self.svgs: return
+        from wlk.core import _build_all_preview_html
+        p = self._write_tmp("preview_all.html", _build_all_preview_html(self.svgs, self.selected_idx))
+        _open_in_browser(p)
+
+    def _open_selected_browser(self):
+        if not self.svgs: return
+        label, svg = self.svgs[self.selected_idx]
+        from wlk.core import _build_single_preview_html
+        p = self._write_tmp("preview_" + str(self.selected_idx + 1).zfill(2) + ".html", _build_single_preview_html(label, svg))
+        _open_in_browser(p)
+
+    def _copy_svg(self):
+        if not self.svgs: return
+        self.root.clipboard_clear(); self.root.clipboard_append(self.svgs[self.selected_idx][1])
+        self.var_status.set("SVG gekopieerd")
+
+    def _export_selected(self):
+        if not self.svgs: return
+        label, svg = self.svgs[self.selected_idx]
+        path = filedialog.asksaveasfilename(defaultextension=".svg", filetypes=[("SVG", "*.svg")],
+                                            initialfile=re.sub(r"[^a-zA-Z0-9_-]", "_", label) + ".svg")
+        if path: Path(path).write_text(svg, encoding="utf-8")
+
+    def _export_selected_png(self):
+        if not self.svgs: return
+        from wlk.raster import can_render_text, svg_to_png
+        label, svg = self.svgs[self.selected_idx]
+        if "<text" in svg and not can_render_text():
+            if not messagebox.askyesno("PNG zonder tekst",
+                                       "Er is geen TrueType-font met contouren gevonden, dus de tekst "
+                                       "ontbreekt in de PNG.\nToch exporteren?"):
+                return
+        path = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG", "*.png")],
+                                            initialfile=re.sub(r"[^a-zA-Z0-9_-]", "_", label) + ".png")
+        if not path: return
+        Path(path).write_bytes(svg_to_png(svg))
+        self.debug.log("PNG geëxporteerd: " + path, "SUCCESS")
+
+    def _export_items(self):
+        from wlk.core import _build_all_preview_html
+        for i, (label, svg) in enumerate(self.svgs):
+            yield _svg_filename(i, label), svg
+        yield "preview.html", _build_all_preview_html(self.svgs)
+
+    def _export_all(self):
+        if not self.svgs: return
+        folder = filedialog.askdirectory(title="Kies map")
+        if not folder: return
+        stats = export_files(folder, self._export_items())
+        self.debug.log("Export " + folder + ": " + str(stats.written) + " geschreven, " + str(stats.skipped)
+                       + " ongewijzigd (" + format(stats.seconds * 1000, ".0f") + " ms)", "SUCCESS")
+        messagebox.showinfo("Export klaar", str(stats.written) + " bestanden opgeslagen, "
+                            + str(stats.skipped) + " ongewijzigd.")
+
+    def _export_zip(self):
+        if not self.svgs: return
+        path = filedialog.asksaveasfilename(defaultextension=".zip", filetypes=[("ZIP", "*.zip")],
+                                            initialfile="wlk_logos.zip")
+        if not path: return
+        archive = ZipStream(path)
+        try:
+            for name, data in self._export_items():
+                archive.add(name, data)
+        except BaseException:
+            archive.abort()
+            raise
+        archive.close()
+        self.debug.log("ZIP geëxporteerd: " + path, "SUCCESS")
+
+    def _quit(self):
+        self._live_gen += 1
+        self._live_pool.shutdown(wait=False, cancel_futures=True)
+        self.settings.flush()
+        self.profiles.close()
+        self.root.quit()
+
+    def run(self):
+        self.root.mainloop()
+        self.settings.flush()
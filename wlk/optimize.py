@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Optimalisatiestap voor de SVG-boom van een variant (optioneel, na de variantfunctie).
+
+* coördinaten en maten worden afgerond op ``precision`` decimalen (transform-waarden
+  op ``precision + 2``, zodat kleine schalen als 0.56 heel blijven);
+* attributen met hun standaardwaarde (``x="0"``, ``opacity="1"``, ``rotate(0)``) vervallen
+  en kleuren als ``#ffffff`` worden ``#fff``;
+* ``opacity`` op een enkel gevulde vorm zonder stroke wordt ``fill-opacity`` (zelfde
+  resultaat, maar wel overerfbaar);
+* gedeelde overerfbare attributen (``fill``, ``fill-opacity``, ``stroke``, ...) van
+  opeenvolgende broers worden naar een omhullende ``<g>`` verplaatst; attributen die
+  gelijk zijn aan die van de ouder-``<g>`` vervallen;
+* de uitvoer wordt zonder inspringing geschreven.
+
+Getallen blijven altijd gescheiden: waar een afgerond getal tegen het vorige aan zou
+komen (``-.02`` wordt ``0``) komt een spatie. Path-data wordt in absolute coördinaten
+afgerond en daarna weer in de oorspronkelijke (relatieve) commando's geschreven, zodat
+afrondfouten zich niet langs een contour opstapelen.
+
+``opacity`` zelf wordt nooit gehoist: op een ``<g>`` werkt die op de groep als geheel,
+en overlappende vormen (confetti, hartjes) zouden dan anders mengen.
+"""
+
+from __future__ import annotations
+
+import re
+
+from .svgtree import El, to_string
+
+_NUM_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+_PATH_TOKEN_RE = re.compile(r"([MmLlHhVvCcSsQqTtAaZz])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+# Aantal argumenten per path-commando; bij A zijn alleen de laatste twee een punt.
+_PATH_ARGS = {"m": 2, "l": 2, "h": 1, "v": 1, "c": 6, "s": 4, "q": 4, "t": 2, "a": 7, "z": 0}
+
+GEOMETRY_ATTRS = frozenset((
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry",
+    "width", "height", "dx", "dy", "stroke-width", "points", "d",
+))
+HOISTABLE_ATTRS = ("fill", "fill-opacity", "stroke", "stroke-width", "stroke-opacity", "fill-rule")
+COLOR_ATTRS = frozenset(("fill", "stroke"))
+DEFAULT_VALUES = {
+    "x": "0", "y": "0", "cx": "0", "cy": "0", "dx": "0", "dy": "0", "opacity": "1",
+    "transform": "rotate(0)",
+}
+SHAPE_TAGS = frozenset(("rect", "circle", "ellipse", "polygon", "polyline", "path", "line"))
+MIN_RUN = 2
+
+
+def fmt_number(v, precision):
+    """Kortste notatie van ``v`` afgerond op ``precision`` decimalen (``0.50`` → ``.5``)."""
+    v = round(float(v), precision)
+    if v == int(v):
+        return str(int(v))
+    s = ("%." + str(precision) + "f") % v
+    s = s.rstrip("0")
+    if s.startswith("0."):
+        return s[1:]
+    if s.startswith("-0."):
+        return "-" + s[2:]
+    return s
+
+
+def _join_numbers(nums):
+    """Getallen achter elkaar, met een spatie behalve voor een minteken."""
+    out = ""
+    for n in nums:
+        out += n if not out or n[0] == "-" else " " + n
+    return out
+
+
+def _round_numbers(value, precision):
+    if value.__class__ is int:
+        return value
+    if value.__class__ is float:
+        return fmt_number(value, precision)
+    out = []
+    end = 0
+    for m in _NUM_RE.finditer(value):
+        n = fmt_number(m.group(0), precision)
+        if m.start() == end and end and n[0] != "-":
+            n = " " + n  # het vorige getal liep hier door: ``1.04.5`` of ``.98-.02`` -> ``1 0``
+        out.append(value[end:m.start()] + n)
+        end = m.end()
+    out.append(value[end:])
+    return "".join(out)
+
+
+def round_path(d, precision):
+    """Rondt path-data af op ``precision`` decimalen zonder afrondfouten op te stapelen.
+
+    Elk punt wordt absoluut afgerond; relatieve commando's krijgen het verschil tussen
+    afgeronde punten, zodat de fout per punt hoogstens een halve eenheid is. Path-data die
+    niet te lezen is (of samengetrokken boogvlaggen ``011`` heeft) blijft ongewijzigd.
+    """
+    if d.__class__ is not str:
+        return _round_numbers(d, precision)
+    tokens = _PATH_TOKEN_RE.findall(d)
+    out = []
+    x = y = sx = sy = 0.0  # exact huidig punt en begin van het subpad
+    rx = ry = rsx = rsy = 0.0  # dezelfde punten zoals ze na afronden in de uitvoer staan
+    cmd = None
+    i = 0
+    while i < len(tokens):
+        letter, _ = tokens[i]
+        if letter:
+            cmd = letter
+            i += 1
+            if cmd in "Zz":
+                out.append(cmd)
+                x, y, rx, ry = sx, sy, rsx, rsy
+                continue
+        elif cmd is None or cmd in "Zz":
+            return d
+        lower = cmd.lower()
+        rel = cmd == lower
+        n = _PATH_ARGS[lower]
+        raw = [num for _, num in tokens[i:i + n] if num]
+        if len(raw) < n or (lower == "a" and (raw[3] not in ("0", "1") or raw[4] not in ("0", "1"))):
+            return d
+        args = [float(num) for num in raw]
+        i += n
+        ox, oy = (x, y) if rel else (0.0, 0.0)  # waar relatieve getallen vanaf tellen
+        bx, by = (rx, ry) if rel else (0.0, 0.0)  # idem, zoals de lezer het ziet
+        nums = []
+        if lower == "h":
+            x = args[0] + ox
+            nums.append(fmt_number(round(x, precision) - bx, precision))
+        elif lower == "v":
+            y = args[0] + oy
+            nums.append(fmt_number(round(y, precision) - by, precision))
+        else:
+            if lower == "a":
+                nums += [fmt_number(v, precision) for v in args[:3]] + raw[3:5]
+                args = args[5:]
+            for k in range(0, len(args), 2):
+                x, y = args[k] + ox, args[k + 1] + oy
+                nums.append(fmt_number(round(x, precision) - bx, precision))
+                nums.append(fmt_number(round(y, precision) - by, precision))
+        rx, ry = round(x, precision), round(y, precision)
+        if lower == "m":
+            sx, sy, rsx, rsy = x, y, rx, ry
+            cmd = "l" if rel else "L"  # verdere paren na een M zijn lijnstukken
+        if not letter and nums[0][0] != "-":
+            out.append(" ")  # herhaald commando zonder letter: los van het vorige getal
+        out.append(letter + _join_numbers(nums))
+    return "".join(out)
+
+
+def short_color(value):
+    """``#aabbcc`` → ``#abc`` waar dat kan; andere waarden ongewijzigd."""
+    if len(value) == 7 and value[0] == "#" and value[1] == value[2] and value[3] == value[4] and value[5] == value[6]:
+        return ("#" + value[1] + value[3] + value[5]).lower()
+    return value
+
+
+def _round_attrs(el, precision):
+    attrs = el.attrs
+    for k, v in list(attrs.items()):
+        if k == "d":
+            v = attrs[k] = round_path(v, precision)
+        elif k in GEOMETRY_ATTRS:
+            v = attrs[k] = _round_numbers(v, precision)
+        elif k == "transform":
+            v = attrs[k] = _round_numbers(v, precision + 2)
+        elif k in COLOR_ATTRS and v.__class__ is str:
+            v = attrs[k] = short_color(v)
+        if DEFAULT_VALUES.get(k) == str(v):
+            del attrs[k]
+
+
+def _opacity_to_fill_opacity(el):
+    attrs = el.attrs
+    if el.tag not in SHAPE_TAGS or "opacity" not in attrs or "fill-opacity" in attrs:
+        return
+    if attrs.get("stroke", "none") != "none" or attrs.get("fill") == "none" or el.tag == "line":
+        return
+    attrs["fill-opacity"] = attrs.pop("opacity")
+
+
+def _hoist_key(el):
+    if el.__class__ is not El or el.tag not in SHAPE_TAGS and el.tag != "g":
+        return None
+    return {k: el.attrs[k] for k in HOISTABLE_ATTRS if k in el.attrs}
+
+
+def _attr_bytes(attrs):
+    return sum(len(k) + len(str(v)) + 4 for k, v in attrs.items())
+
+
+def _hoist(children):
+    """Groepeert opeenvolgende broers met gedeelde overerfbare attributen in een ``<g>``."""
+    out = []
+    run = []
+    common = None
+
+    def flush():
+        if len(run) >= MIN_RUN and common and _attr_bytes(common) * (len(run) - 1) > 7:
+            for c in run:
+                for k in common:
+                    del c.attrs[k]
+            out.append(El("g", dict(common), list(run)))
+        else:
+            out.extend(run)
+
+    for c in children:
+        key = _hoist_key(c)
+        if key:
+            shared = key if common is None else {k: v for k, v in common.items() if key.get(k) == v}
+            if shared:
+                run.append(c)
+                common = shared
+                continue
+        flush()
+        run = []
+        common = None
+        if key:
+            run = [c]
+            common = key
+        else:
+            out.append(c)
+    flush()
+    return out
+
+
+def optimize_tree(root, precision=1, hoist=True, _inherited=None):
+    """Optimaliseert de boom in place en geeft ``root`` terug."""
+    inherited = _inherited or {}
+    _round_attrs(root, precision)
+    _opacity_to_fill_opacity(root)
+    for k in HOISTABLE_ATTRS:
+        if k in root.attrs and inherited.get(k) == root.attrs[k] and root.tag != "svg":
+            del root.attrs[k]
+    if root.tag == "text" or not root.children:
+        return root
+    own = dict(inherited)
+    own.update((k, root.attrs[k]) for k in HOISTABLE_ATTRS if k in root.attrs)
+    children = root.children
+    for c in children:
+        if c.__class__ is El:
+            optimize_tree(c, precision, hoist, own)
+    if hoist and root.tag in ("svg", "g", "symbol", "pattern"):
+        root.children = _hoist(children)
+    return root
+
+
+def render_optimized(fn, cfg, precision=1, hoist=True):
+    """``fn(cfg)`` maar dan geoptimaliseerd en compact: (label, svg-tekst)."""
+    label, root = fn.build(cfg)
+    return (label, to_string(optimize_tree(root, precision, hoist), indent=None))
+
+
+def byte_savings(cfg, variants=None, precision=1, hoist=True):
+    """Per variant (label, bytes origineel, bytes geoptimaliseerd)."""
+    from .core import ALL_VARIANTS
+    rows = []
+    for fn in variants or ALL_VARIANTS:
+        label, svg = fn(cfg)
+        _, small = render_optimized(fn, cfg, precision, hoist)
+        rows.append((label, len(svg.encode("utf-8")), len(small.encode("utf-8"))))
+    return rows
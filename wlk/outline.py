@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Tekst als contouren: vervangt ``<text>`` door ``<path>``-elementen met de glyph-outlines
+uit een lokaal TrueType-font (``wlk.fonts``). De SVG heeft daarna geen webfont meer nodig,
+dus ``_wrap`` laat de ``@import`` van Google Fonts weg.
+
+Layout volgt de browser zoals ``wlk.raster`` die ook aanneemt: tspans met eigen kleur,
+grootte en ``dx``, witruimte samengevoegd tot één spatie, kerning binnen een tspan en
+CSS letter-spacing (alleen klasse ``w``) na elk teken; ``text-anchor`` middle/end
+verschuift de hele regel.
+
+Per (font, glyph, grootte) wordt het pad één keer opgebouwd, met relatieve commando's
+vanaf het eerste punt: herhaalde letters kosten daarna alleen nog een ``M`` en een
+string-concatenatie.
+"""
+
+from __future__ import annotations
+
+from .fonts import main_font, tag_font
+from .optimize import fmt_number
+from .svgtree import El
+
+PRECISION = 2
+CLASS_FONTS = {"w": main_font, "tag": tag_font}
+_TEXT_ATTRS = frozenset(("x", "y", "class", "font-size", "text-anchor", "fill"))
+_PATH_CACHE_LIMIT = 50_000
+_path_cache = {}
+
+
+def class_fonts():
+    """{css-klasse: Font} als elke klasse een font met outlines heeft, anders None."""
+    fonts = {cls: get() for cls, get in CLASS_FONTS.items()}
+    return fonts if all(f.has_outlines for f in fonts.values()) else None
+
+
+def _num(v):
+    return fmt_number(v, PRECISION)
+
+
+def _segments(contour, s):
+    """Contour -> (startpunt, [(ctrl of None, punt)]) in geschaalde, afgeronde px (y omlaag)."""
+    pts = [(round(x * s, PRECISION), round(-y * s, PRECISION), on) for x, y, on in contour]
+    n = len(pts)
+    first = next((i for i in range(n) if pts[i][2]), None)
+    if first is None:  # alleen controlepunten: begin op het midden van de eerste twee
+        a, b = pts[0], pts[1 % n]
+        start = (round((a[0] + b[0]) / 2, PRECISION), round((a[1] + b[1]) / 2, PRECISION))
+        order = pts
+    else:
+        start = pts[first][:2]
+        order = pts[first + 1:] + pts[:first + 1]
+    segs = []
+    ctrl = None
+    for x, y, on in order:
+        if on:
+            segs.append((ctrl, (x, y)))
+            ctrl = None
+        elif ctrl is None:
+            ctrl = (x, y)
+        else:  # twee controlepunten op rij: impliciet punt ertussen
+            mid = (round((ctrl[0] + x) / 2, PRECISION), round((ctrl[1] + y) / 2, PRECISION))
+            segs.append((ctrl, mid))
+            ctrl = (x, y)
+    if ctrl is not None:
+        segs.append((ctrl, start))
+    return start, segs
+
+
+def glyph_path(font, gid, size):
+    """(mx, my, rest) voor glyph ``gid`` op ``size`` px, of None voor een lege glyph.
+
+    ``"M" + (x + mx) + " " + (y + my) + rest`` tekent de glyph met de oorsprong op (x, y).
+    """
+    key = (font.path, gid, size)
+    hit = _path_cache.get(key, False)
+    if hit is not False:
+        return hit
+    contours = font.glyph_contours(gid)
+    result = None
+    if contours:
+        s = size / font.units_per_em
+        parts = []
+        origin = cur = None
+        for contour in contours:
+            if not contour:
+                continue
+            start, segs = _segments(contour, s)
+            if origin is None:
+                origin = start
+            else:
+                parts.append("m" + _num(start[0] - cur[0]) + " " + _num(start[1] - cur[1]))
+            cur = start
+            for ctrl, (x, y) in segs:
+                if ctrl is None:
+                    parts.append("l" + _num(x - cur[0]) + " " + _num(y - cur[1]))
+                else:
+                    parts.append("q" + _num(ctrl[0] - cur[0]) + " " + _num(ctrl[1] - cur[1]) + " "
+                                 + _num(x - cur[0]) + " " + _num(y - cur[1]))
+                cur = (x, y)
+            parts.append("z")
+            cur = start  # na z staat het huidige punt weer op het begin van het subpad
+        if origin is not None:
+            result = (origin[0], origin[1], "".join(parts).replace(" -", "-"))
+    if len(_path_cache) > _PATH_CACHE_LIMIT:
+        _path_cache.clear()
+    _path_cache[key] = result
+    return result
+
+
+def _runs(el):
+    """[(tekst, fill, grootte, dx)] van een ``<text>``, witruimte zoals de browser die samenvoegt."""
+    size = float(el.attrs.get("font-size", 16))
+    fill = el.attrs.get("fill")
+    runs = []
+    for child in el.children:
+        if isinstance(child, El):
+            if child.tag != "tspan":
+                continue
+            text = " ".join("".join(c for c in child.children if isinstance(c, str)).split())
+            if text:
+                runs.append((text, child.attrs.get("fill", fill), float(child.attrs.get("font-size", size)),
+                             float(child.attrs.get("dx", 0))))
+        else:
+            text = " ".join(child.split())
+            if text or runs:  # witruimte vóór de eerste run telt niet mee
+                runs.append((text or " ", fill, size, 0.0))
+    while runs and runs[-1][0] == " ":
+        runs.pop()
+    return runs
+
+
+def text_to_paths(el, font, letter_spacing=0.0):
+    """Eén ``<path>`` per gekleurde run (in een ``<g>`` als het er meer zijn), of None zonder glyphs."""
+    runs = _runs(el)
+    layout = []
+    x = float(el.attrs.get("x", 0))
+    for text, fill, size, dx in runs:
+        x += dx
+        glyphs = []
+        prev = None
+        k = size / font.units_per_em
+        for ch in text:
+            gid = font.glyph_id(ch)
+            if prev is not None:
+                x += font.kerning(prev, gid) * k
+            glyphs.append((gid, x))
+            x += font.advance(gid) * k + letter_spacing
+            prev = gid
+        layout.append((fill, size, glyphs))
+    anchor = el.attrs.get("text-anchor", "start")
+    shift = 0.0
+    if anchor in ("middle", "end"):
+        width = x - float(el.attrs.get("x", 0))
+        shift = -width / 2 if anchor == "middle" else -width
+    y = float(el.attrs.get("y", 0))
+    paths = []
+    for fill, size, glyphs in layout:
+        parts = []
+        for gid, gx in glyphs:
+            g = glyph_path(font, gid, size)
+            if g is not None:
+                parts.append("M" + _num(gx + shift + g[0]) + " " + _num(y + g[1]) + g[2])
+        if parts:
+            attrs = {"d": "".join(parts)}
+            if fill is not None:
+                attrs["fill"] = fill
+            paths.append(El("path", attrs))
+    if not paths:
+        return None
+    extra = {k: v for k, v in el.attrs.items() if k not in _TEXT_ATTRS}
+    if len(paths) == 1:
+        paths[0].attrs.update(extra)
+        return paths[0]
+    return El("g", extra, paths)
+
+
+def outline_text(elements, letter_spacing=0.0, fonts=None):
+    """Vervangt in ``elements`` (en hun kinderen) elk ``<text>`` door contouren.
+
+    ``letter_spacing`` geldt voor klasse ``w``, zoals de CSS in ``_wrap``. Geeft False
+    terug (en laat alles ongemoeid) als er geen font met outlines gevonden wordt.
+    """
+    fonts = fonts or class_fonts()
+    if fonts is None:
+        return False
+    stack = [elements]
+    while stack:
+        children = stack.pop()
+        out = []
+        for child in children:
+            if isinstance(child, El) and child.tag == "text":
+                cls = child.attrs.get("class", "w")
+                child = text_to_paths(child, fonts.get(cls, fonts["w"]), letter_spacing if cls == "w" else 0.0)
+                if child is None:
+                    continue
+            elif isinstance(child, El) and child.children:
+                if child.children.__class__ is not list:
+                    child.children = list(child.children)
+                stack.append(child.children)
+            out.append(child)
+        children[:] = out
+    return True
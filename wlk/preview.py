@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Canvas-items voor de ingebouwde preview, afgeleid van de display-list van ``wlk.raster``.
+
+Elk item is een hashbare tuple (``("poly", coords, kleur)`` of ``("text", ...)``) in
+canvas-pixels, zodat de GUI twee renders kan vergelijken en alleen de items hoeft te
+tekenen die echt veranderd zijn. Dit module importeert geen tkinter.
+
+Tk kent geen alpha: transparante kleuren worden gemengd met de canvas-achtergrond, dus
+overlappende halfdoorzichtige vormen (ook groepen met ``opacity``) wijken iets af van de
+browser. Vormen met gaten (``evenodd``, ringen van een stroke) worden als één polygoon
+met "bruggen" getekend; Tk vult polygonen met de even-odd regel, waardoor de bruggen
+tegen elkaar wegvallen.
+"""
+
+from __future__ import annotations
+
+import math
+
+from .raster import Shape, _scale_of, _signed_area, display_list, flat_items
+
+BACKGROUND = (255, 255, 255)
+
+
+def blend(color, alpha, bg=BACKGROUND):
+    """``color`` met ``alpha`` over ``bg`` als ``#rrggbb``."""
+    a = max(0.0, min(1.0, alpha))
+    return "#%02x%02x%02x" % tuple(int(round(c * a + b * (1.0 - a))) for c, b in zip(color, bg))
+
+
+def _coords(poly, s, ox, oy):
+    out = []
+    for x, y in poly:
+        out.append(round(x * s + ox, 1))
+        out.append(round(y * s + oy, 1))
+    return tuple(out)
+
+
+def _bridged(polys, s, ox, oy):
+    """Alle ringen als één polygoon: heen en terug via het eerste punt (even-odd)."""
+    x0, y0 = polys[0][0]
+    out = []
+    for poly in polys:
+        out.extend(_coords(poly + [poly[0], (x0, y0)], s, ox, oy))
+    return tuple(out)
+
+
+def _has_holes(shape):
+    if shape.evenodd:
+        return True
+    first = _signed_area(shape.polys[0]) >= 0
+    return any((_signed_area(p) >= 0) != first for p in shape.polys[1:])
+
+
+def canvas_items(svg_text, max_w, max_h, bg=BACKGROUND):
+    """(breedte, hoogte, items) met de SVG passend en gecentreerd in ``max_w`` x ``max_h``."""
+    w, h, items = display_list(svg_text)
+    if not w or not h:
+        return 0, 0, []
+    s = min(max_w / w, max_h / h)
+    ox = (max_w - w * s) / 2.0
+    oy = (max_h - h * s) / 2.0
+    out = []
+    for it in flat_items(items):
+        if it.__class__ is Shape:
+            if it.alpha <= 0 or not it.polys:
+                continue
+            fill = blend(it.color, it.alpha, bg)
+            if len(it.polys) > 1 and _has_holes(it):
+                out.append(("poly", _bridged(it.polys, s, ox, oy), fill))
+            else:
+                for poly in it.polys:
+                    out.append(("poly", _coords(poly, s, ox, oy), fill))
+            continue
+        a, b, c, d, e, f = it.matrix
+        k = _scale_of(it.matrix) * s
+        x = (a * it.x + c * it.y + e) * s + ox
+        y = (b * it.x + d * it.y + f) * s + oy
+        angle = round(-math.degrees(math.atan2(b, a)), 1) + 0.0  # geen -0.0 in de sleutel
+        spans = tuple((text, blend(color, alpha, bg), round(size * k, 1), round(dx * k, 1))
+                      for text, color, alpha, size, dx in it.spans if alpha > 0)
+        if spans:
+            out.append(("text", round(x, 1), round(y, 1), angle, it.anchor, it.css_class, spans))
+    return w * s, h * s, out
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Merkprofielen in SQLite (``wlk_profiles.db``, alleen standaardbibliotheek).
+
+Een profiel is een benoemde BrandConfig met een merk- en domeinnaam (standaard afgeleid
+van links/rechts/TLD: ``lagerkoning`` / ``lagerkoning.nl``); op beide staat een index.
+Per profiel kan elke dimensie-preset eigen overrides hebben (bijv. een kleinere
+``word_gap`` voor de kleine header): ``get(naam, preset)`` geeft profiel + preset-maten +
+overrides.
+
+``iter_configs`` leest met een cursor in blokken van ``fetchmany``, zodat een bulk-render
+over duizenden profielen nooit alle rijen tegelijk in het geheugen heeft. Een
+``ProfileDB`` hoort bij één thread; open in een worker-thread een eigen exemplaar.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import asdict, replace
+
+from wlk.config import DIMENSION_PRESETS
+from wlk.settings import apply_fields, validate
+
+PROFILE_DB = "wlk_profiles.db"
+FETCH_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL UNIQUE,
+    brand   TEXT NOT NULL,
+    domain  TEXT NOT NULL,
+    config  TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profiles_brand ON profiles (brand);
+CREATE INDEX IF NOT EXISTS profiles_domain ON profiles (domain);
+CREATE TABLE IF NOT EXISTS preset_overrides (
+    profile_id INTEGER NOT NULL REFERENCES profiles (id) ON DELETE CASCADE,
+    preset     TEXT NOT NULL,
+    config     TEXT NOT NULL,
+    PRIMARY KEY (profile_id, preset)
+);
+"""
+
+
+def brand_of(cfg):
+    return (cfg.left + cfg.right).replace(" ", "").lower()
+
+
+def domain_of(cfg):
+    return (cfg.left + cfg.right + cfg.tld).replace(" ", "").lower()
+
+
+def preset_dims(preset):
+    """(breedte, hoogte, fs_main) van een preset uit ``DIMENSION_PRESETS``."""
+    for name, w, h, fs in DIMENSION_PRESETS:
+        if name == preset:
+            return w, h, fs
+    raise KeyError("onbekende preset: " + preset)
+
+
+def _config(data, preset=None, override=None):
+    cfg, _ = validate(json.loads(data))
+    if preset:
+        w, h, fs = preset_dims(preset)
+        cfg = replace(cfg, out_width=w, out_height=h, fs_main=fs)
+    if override:
+        apply_fields(cfg, json.loads(override))
+    return cfg
+
+
+class ProfileDB:
+    """Benoemde merkprofielen met overrides per preset."""
+
+    def __init__(self, path=PROFILE_DB):
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")  # bulk-render leest terwijl de GUI schrijft
+        self.conn.executescript(SCHEMA)
+        # Oudere versies bewaarden een opgegeven merk/domein met hoofdletters; ``_where`` zoekt in kleine letters.
+        self.conn.create_function("py_lower", 1, str.lower, deterministic=True)
+        with self.conn:
+            self.conn.execute("UPDATE profiles SET brand = py_lower(brand), domain = py_lower(domain)"
+                              " WHERE brand != py_lower(brand) OR domain != py_lower(domain)")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    # ─── profielen ───
+
+    def save(self, name, cfg, brand=None, domain=None):
+        """Voegt een profiel toe of werkt het bij (op naam); merk/domein worden zo nodig afgeleid
+        en altijd in kleine letters opgeslagen, zoals ``find`` ze zoekt."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO profiles (name, brand, domain, config, updated) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE SET brand = excluded.brand, domain = excluded.domain,"
+                " config = excluded.config, updated = excluded.updated",
+                (name, (brand or brand_of(cfg)).lower(), (domain or domain_of(cfg)).lower(), json.dumps(asdict(cfg)),
+                 time.time()))
+
+    def import_configs(self, configs):
+        """Slaat een reeks BrandConfigs op met het domein als naam; geeft het aantal terug."""
+        n = 0
+        with self.conn:
+            for cfg in configs:
+                domain = domain_of(cfg)
+                self.conn.execute(
+                    "INSERT INTO profiles (name, brand, domain, config, updated) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (name) DO UPDATE SET config = excluded.config, updated = excluded.updated",
+                    (domain, brand_of(cfg), domain, json.dumps(asdict(cfg)), time.time()))
+                n += 1
+        return n
+
+    def delete(self, name):
+        with self.conn:
+            return self.conn.execute("DELETE FROM profiles WHERE name = ?", (name,)).rowcount > 0
+
+    def names(self):
+        return [row[0] for row in self.conn.execute("SELECT name FROM profiles ORDER BY name")]
+
+    def find(self, brand=None, domain=None):
+        """[(naam, merk, domein)], gefilterd op merk en/of domein (via de indexen)."""
+        where, args = self._where(brand, domain)
+        return self.conn.execute("SELECT name, brand, domain FROM profiles p" + where + " ORDER BY name",
+                                 args).fetchall()
+
+    @staticmethod
+    def _where(brand, domain):
+        clauses = []
+        args = []
+        if brand is not None:
+            clauses.append("p.brand = ?")
+            args.append(brand.lower())
+        if domain is not None:
+            clauses.append("p.domain = ?")
+            args.append(domain.lower())
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), args
+
+    def get(self, name, preset=None, overrides=True):
+        """BrandConfig van een profiel; met ``preset`` de maten (en overrides) van die preset erbij."""
+        row = self.conn.execute(
+            "SELECT p.config, o.config FROM profiles p LEFT JOIN preset_overrides o"
+            " ON o.profile_id = p.id AND o.preset = ? WHERE p.name = ?", (preset or "", name)).fetchone()
+        if row is None:
+            raise KeyError("onbekend profiel: " + name)
+        return _config(row[0], preset, row[1] if overrides else None)
+
+    # ─── preset-overrides ───
+
+    def set_override(self, name, preset, values):
+        """Zet de overrides (dict met velden) van ``preset``; een lege dict verwijdert ze."""
+        preset_dims(preset)
+        row = self.conn.execute("SELECT id FROM profiles WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError("onbekend profiel: " + name)
+        with self.conn:
+            if values:
+                self.conn.execute("INSERT OR REPLACE INTO preset_overrides (profile_id, preset, config)"
+                                  " VALUES (?, ?, ?)", (row[0], preset, json.dumps(values)))
+            else:
+                self.conn.execute("DELETE FROM preset_overrides WHERE profile_id = ? AND preset = ?",
+                                  (row[0], preset))
+
+    def overrides(self, name):
+        """{preset: {veld: waarde}} van een profiel."""
+        rows = self.conn.execute("SELECT o.preset, o.config FROM preset_overrides o JOIN profiles p"
+                                 " ON p.id = o.profile_id WHERE p.name = ?", (name,))
+        return {preset: json.loads(data) for preset, data in rows}
+
+    # ─── bulk ───
+
+    def iter_configs(self, preset=None, brand=None, domain=None):
+        """Streamt (naam, BrandConfig) over alle (gefilterde) profielen, op naam gesorteerd."""
+        where, args = self._where(brand, domain)
+        cur = self.conn.execute(
+            "SELECT p.name, p.config, o.config FROM profiles p LEFT JOIN preset_overrides o"
+            " ON o.profile_id = p.id AND o.preset = ?" + where + " ORDER BY p.name", [preset or ""] + args)
+        try:
+            while True:
+                rows = cur.fetchmany(FETCH_SIZE)
+                if not rows:
+                    return
+                for name, data, override in rows:
+                    yield name, _config(data, preset, override)
+        finally:
+            cur.close()
+
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Optionele profilering van variant-renders: tijd, grootte en aantal vormen per aanroep.
+
+``RenderProfiler`` bewaart per variant de laatste ``window`` metingen, zodat percentielen
+over recente renders gaan en niet over de hele sessie. Alleen echte renders worden gemeten
+(cache-hits niet); mislukte renders worden per variant geteld met de laatste fout.
+``run_profiled`` draait een functie onder ``cProfile`` en schrijft een pstats-bestand.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import re
+import threading
+import time
+from collections import deque
+
+_SHAPE_RE = re.compile(r"<(?:rect|circle|ellipse|polygon|polyline|path|line|text|use)\b")
+
+COLUMNS = ("variant", "renders", "last_ms", "p50_ms", "p95_ms", "max_ms", "bytes", "shapes", "errors")
+
+
+def count_shapes(svg):
+    """Aantal tekenende elementen (vormen, tekst en ``<use>``) in een SVG-tekst."""
+    return len(_SHAPE_RE.findall(svg))
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+class RenderProfiler:
+    """Thread-safe verzameling van metingen per variant (sleutel: functienaam)."""
+
+    def __init__(self, window=200):
+        self.window = window
+        self._times = {}
+        self._last = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    def measure(self, fn, cfg):
+        """Roept ``fn(cfg)`` aan en registreert de meting; fouten worden geteld en doorgegooid."""
+        t0 = time.perf_counter()
+        try:
+            result = fn(cfg)
+        except Exception as e:
+            self.record_error(fn.__name__, repr(e))
+            raise
+        self.record(fn.__name__, time.perf_counter() - t0, result[1])
+        return result
+
+    def record(self, name, seconds, svg):
+        nbytes = len(svg.encode("utf-8"))
+        shapes = count_shapes(svg)
+        with self._lock:
+            times = self._times.get(name)
+            if times is None:
+                times = self._times[name] = deque(maxlen=self.window)
+            times.append(seconds * 1000.0)
+            renders = self._last.get(name, (0,))[0] + 1
+            self._last[name] = (renders, seconds * 1000.0, nbytes, shapes)
+
+    def record_error(self, name, message):
+        with self._lock:
+            count = self._errors.get(name, (0, ""))[0]
+            self._errors[name] = (count + 1, message)
+
+    def rows(self):
+        """Eén dict per variant met de kolommen uit ``COLUMNS`` (plus ``last_error``)."""
+        with self._lock:
+            names = set(self._times) | set(self._errors)
+            out = []
+            for name in names:
+                times = list(self._times.get(name, ()))
+                renders, last_ms, nbytes, shapes = self._last.get(name, (0, 0.0, 0, 0))
+                errors, last_error = self._errors.get(name, (0, ""))
+                out.append({"variant": name, "renders": renders, "last_ms": last_ms,
+                            "p50_ms": percentile(times, 50), "p95_ms": percentile(times, 95),
+                            "max_ms": max(times) if times else 0.0, "bytes": nbytes, "shapes": shapes,
+                            "errors": errors, "last_error": last_error})
+        return out
+
+    def slowest(self, n=5, key="p95_ms"):
+        return sorted(self.rows(), key=lambda r: r[key], reverse=True)[:n]
+
+    def clear(self):
+        with self._lock:
+            self._times.clear()
+            self._last.clear()
+            self._errors.clear()
+
+
+def run_profiled(func, path, top=15):
+    """Draait ``func()`` onder cProfile, schrijft de pstats naar ``path`` en geeft
+    (resultaat, samenvatting van de ``top`` duurste functies op cumulatieve tijd)."""
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        result = func()
+    finally:
+        prof.disable()
+        prof.dump_stats(str(path))
+    buf = io.StringIO()
+    pstats.Stats(prof, stream=buf).strip_dirs().sort_stats("cumulative").print_stats(top)
+    return result, buf.getvalue()
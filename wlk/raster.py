@@ -0,0 +1,991 @@
+# -*- coding: utf-8 -*-
+"""
+Pure-Python SVG rasterizer voor PNG-export (alleen standaardbibliotheek).
+
+Ondersteunt precies wat de variant-helpers uitsturen: ``rect`` (ook met ``rx``),
+``circle``, ``ellipse``, ``polygon``/``polyline``, ``line``, ``path`` (M/L/H/V/C/S/Q/T/A/Z,
+absoluut en relatief), geneste ``<g transform>`` met translate/scale/rotate/matrix,
+``fill``/``stroke``/``stroke-width``, ``opacity`` en ``fill-opacity``/``stroke-opacity``,
+``<use>`` naar ``<symbol>``/``<g>`` en ``fill="url(#...)"`` naar een ``<pattern>``.
+
+``<text>`` wordt via ``wlk.outline`` in glyph-contouren omgezet (met de CSS letter-spacing
+van klasse ``w``); zonder font met outlines blijft het een ``TextRun`` die de rasterizer
+overslaat (``can_render_text`` meldt dat vooraf) en die de canvas-preview zelf tekent.
+
+Werkwijze: het SVG wordt eerst platgeslagen tot een display-list van polygonen in
+apparaat-coördinaten; daarna vult een scanline-rasterizer elke vorm met anti-aliasing
+(4 sub-scanlines, exacte horizontale dekking). Spans met constante dekking worden per
+kleurkanaal met ``bytearray.translate`` geblend, zodat het werk per rij schaalt met het
+aantal randen in plaats van met de breedte. Een element met ``opacity`` < 1 dat uit
+meer dan één vorm bestaat wordt een ``Layer``: apart gerasterd en daarna als geheel
+gecomposiet, net als in de browser. Pattern-vullingen zijn een ``Layer`` met de vorm
+als masker, dus ook concave vormen en vormen met gaten worden juist afgeknipt.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import struct
+import sys
+import xml.etree.ElementTree as ET
+import zlib
+from itertools import groupby
+
+_NUM_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_RE = re.compile(r"([MmLlHhVvCcSsQqTtAaZz])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+_URL_RE = re.compile(r"url\(\s*#([^)\s]+)\s*\)")
+_TRANSFORM_RE = re.compile(r"(matrix|translate|scale|rotate)\s*\(([^)]*)\)")
+_LETTER_SPACING_RE = re.compile(r"\.w\s*\{[^}]*letter-spacing\s*:\s*([-+]?(?:\d+\.?\d*|\.\d+))px")
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+NAMED_COLORS = {
+    "black": (0, 0, 0), "white": (255, 255, 255), "red": (255, 0, 0), "green": (0, 128, 0),
+    "blue": (0, 0, 255), "yellow": (255, 255, 0), "orange": (255, 165, 0), "gray": (128, 128, 128),
+    "grey": (128, 128, 128), "gold": (255, 215, 0), "currentcolor": (0, 0, 0),
+}
+
+_DEFAULT_STYLE = {
+    "fill": "#000000", "stroke": "none", "stroke-width": "1", "fill-opacity": "1",
+    "stroke-opacity": "1", "fill-rule": "nonzero", "opacity": 1.0,
+}
+_INHERITED = ("fill", "stroke", "stroke-width", "fill-opacity", "stroke-opacity", "fill-rule")
+_SKIP_TAGS = {"defs", "style", "title", "desc", "metadata", "symbol", "pattern", "clipPath", "mask"}
+
+
+class Shape:
+    """Gevulde vorm in apparaat-coördinaten: een of meer gesloten polygonen met één kleur."""
+
+    __slots__ = ("polys", "color", "alpha", "evenodd")
+
+    def __init__(self, polys, color, alpha, evenodd=False):
+        self.polys = polys
+        self.color = color
+        self.alpha = alpha
+        self.evenodd = evenodd
+
+    def bbox(self):
+        xs = [x for poly in self.polys for x, _ in poly]
+        ys = [y for poly in self.polys for _, y in poly]
+        return min(xs), min(ys), max(xs), max(ys)
+
+
+class TextRun:
+    """Tekst-element zonder outline-fonts: de rasterizer slaat dit over, een canvas kan het tekenen."""
+
+    __slots__ = ("x", "y", "matrix", "font_size", "css_class", "anchor", "spans")
+
+    def __init__(self, x, y, matrix, font_size, css_class, anchor, spans):
+        self.x = x
+        self.y = y
+        self.matrix = matrix
+        self.font_size = font_size
+        self.css_class = css_class
+        self.anchor = anchor
+        self.spans = spans  # [(tekst, (r, g, b), alpha, font_size, dx)]
+
+
+class Layer:
+    """Groep items die apart gerasterd en met ``alpha`` (en optioneel een masker) gecomposiet wordt."""
+
+    __slots__ = ("items", "alpha", "mask")
+
+    def __init__(self, items, alpha=1.0, mask=None):
+        self.items = items
+        self.alpha = alpha
+        self.mask = mask  # Shape waarvan de dekking de laag afknipt, of None
+
+
+class _Context:
+    """Gedeelde staat tijdens het platslaan: id's, fonts voor tekst en letter-spacing van ``.w``."""
+
+    __slots__ = ("ids", "fonts", "letter_spacing")
+
+    def __init__(self, ids, fonts=None, letter_spacing=0.0):
+        self.ids = ids
+        self.fonts = fonts
+        self.letter_spacing = letter_spacing
+
+
+# ─── PARSING ────────────────────────────────────────────
+
+def parse_color(value):
+    """``#rgb``/``#rrggbb``/naam -> (r, g, b), of None voor ``none``/onbekend."""
+    if not value:
+        return None
+    value = value.strip().lower()
+    if value.startswith("#"):
+        h = value[1:]
+        if len(h) == 3:
+            h = h[0] * 2 + h[1] * 2 + h[2] * 2
+        if len(h) == 6:
+            try:
+                return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
+            except ValueError:
+                return None
+        return None
+    return NAMED_COLORS.get(value)
+
+
+def _mul(m, n):
+    """Matrixproduct m·n (n wordt eerst toegepast)."""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + c * b2, b * a2 + d * b2,
+            a * c2 + c * d2, b * c2 + d * d2,
+            a * e2 + c * f2 + e, b * e2 + d * f2 + f)
+
+
+def parse_transform(value):
+    m = IDENTITY
+    for name, args in _TRANSFORM_RE.findall(value or ""):
+        v = [float(x) for x in _NUM_RE.findall(args)]
+        if name == "translate":
+            t = (1.0, 0.0, 0.0, 1.0, v[0], v[1] if len(v) > 1 else 0.0)
+        elif name == "scale":
+            t = (v[0], 0.0, 0.0, v[1] if len(v) > 1 else v[0], 0.0, 0.0)
+        elif name == "rotate":
+            r = math.radians(v[0])
+            cs, sn = math.cos(r), math.sin(r)
+            t = (cs, sn, -sn, cs, 0.0, 0.0)
+            if len(v) == 3:
+                t = _mul(_mul((1.0, 0.0, 0.0, 1.0, v[1], v[2]), t), (1.0, 0.0, 0.0, 1.0, -v[1], -v[2]))
+        else:
+            t = tuple(v[:6])
+        m = _mul(m, t)
+    return m
+
+
+def _apply(m, pts):
+    a, b, c, d, e, f = m
+    return [(a * x + c * y + e, b * x + d * y + f) for x, y in pts]
+
+
+def _scale_of(m):
+    return math.sqrt(abs(m[0] * m[3] - m[1] * m[2])) or 1.0
+
+
+def _num(el, name, default=0.0):
+    v = el.get(name)
+    if v is None:
+        return default
+    found = _NUM_RE.match(v.strip())
+    return float(found.group(0)) if found else default
+
+
+def _ellipse_pts(cx, cy, rx, ry, dev_scale):
+    n = max(12, min(360, int(math.pi * (rx + ry) * dev_scale / 2.0)))
+    step = 2 * math.pi / n
+    return [(cx + rx * math.cos(i * step), cy + ry * math.sin(i * step)) for i in range(n)]
+
+
+def _rect_pts(x, y, w, h, rx, ry, dev_scale):
+    if rx <= 0 and ry <= 0:
+        return [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+    rx = min(rx or ry, w / 2.0)
+    ry = min(ry or rx, h / 2.0)
+    n = max(2, min(32, int(math.pi * (rx + ry) * dev_scale / 8.0)))
+    pts = []
+    for cx, cy, start in ((x + w - rx, y + ry, -90), (x + w - rx, y + h - ry, 0),
+                          (x + rx, y + h - ry, 90), (x + rx, y + ry, 180)):
+        for i in range(n + 1):
+            a = math.radians(start + 90.0 * i / n)
+            pts.append((cx + rx * math.cos(a), cy + ry * math.sin(a)))
+    return pts
+
+
+def parse_path(d, dev_scale=1.0):
+    """Zet een path-``d`` om in subpaden: lijst van (punten, gesloten)."""
+    tokens = _PATH_RE.findall(d or "")
+    subpaths = []
+    pts = []
+    cmd = None
+    i = 0
+    x = y = sx = sy = 0.0
+    last_ctrl = None
+
+    def nums(k):
+        nonlocal i
+        out = []
+        while len(out) < k:
+            if i >= len(tokens) or tokens[i][0]:
+                raise ValueError("onvolledig path-commando in " + repr(d))
+            out.append(float(tokens[i][1]))
+            i += 1
+        return out
+
+    def flag():
+        # Boogvlaggen mogen zonder scheiding achter elkaar staan: "a5 5 0 011 1".
+        nonlocal i
+        if i >= len(tokens) or tokens[i][0] or tokens[i][1][:1] not in ("0", "1"):
+            raise ValueError("ongeldige boogvlag in " + repr(d))
+        text = tokens[i][1]
+        if len(text) > 1:
+            tokens[i] = ("", text[1:])
+        else:
+            i += 1
+        return text[0] == "1"
+
+    def curve(p0, ctrl, p3):
+        length = 0.0
+        prev = p0
+        for p in ctrl + [p3]:
+            length += math.hypot(p[0] - prev[0], p[1] - prev[1])
+            prev = p
+        n = max(4, min(64, int(length * dev_scale / 3.0)))
+        out = []
+        for k in range(1, n + 1):
+            t = k / n
+            u = 1 - t
+            if len(ctrl) == 2:
+                (x1, y1), (x2, y2) = ctrl
+                out.append((u * u * u * p0[0] + 3 * u * u * t * x1 + 3 * u * t * t * x2 + t * t * t * p3[0],
+                            u * u * u * p0[1] + 3 * u * u * t * y1 + 3 * u * t * t * y2 + t * t * t * p3[1]))
+            else:
+                (x1, y1), = ctrl
+                out.append((u * u * p0[0] + 2 * u * t * x1 + t * t * p3[0],
+                            u * u * p0[1] + 2 * u * t * y1 + t * t * p3[1]))
+        return out
+
+    while i < len(tokens):
+        if tokens[i][0]:
+            cmd = tokens[i][0]
+            i += 1
+        elif cmd is None:
+            raise ValueError("path begint niet met een commando: " + repr(d))
+        rel = cmd.islower()
+        c = cmd.upper()
+        ox, oy = (x, y) if rel else (0.0, 0.0)
+        if c == "Z":
+            if pts:
+                subpaths.append((pts, True))
+            pts = []
+            x, y = sx, sy
+            last_ctrl = None
+            continue
+        if c == "M":
+            px, py = nums(2)
+            if pts:
+                subpaths.append((pts, False))
+            x, y = ox + px, oy + py
+            sx, sy = x, y
+            pts = [(x, y)]
+            cmd = "l" if rel else "L"  # volgende coördinaatparen zijn impliciete lineto's
+            last_ctrl = None
+            continue
+        if not pts:
+            pts = [(x, y)]
+        if c == "L":
+            px, py = nums(2)
+            x, y = ox + px, oy + py
+            pts.append((x, y))
+            last_ctrl = None
+        elif c == "H":
+            x = ox + nums(1)[0]
+            pts.append((x, y))
+            last_ctrl = None
+        elif c == "V":
+            y = oy + nums(1)[0]
+            pts.append((x, y))
+            last_ctrl = None
+        elif c in "CS":
+            if c == "C":
+                x1, y1, x2, y2, px, py = nums(6)
+                c1 = (ox + x1, oy + y1)
+            else:
+                x2, y2, px, py = nums(4)
+                c1 = (2 * x - last_ctrl[0], 2 * y - last_ctrl[1]) if last_ctrl else (x, y)
+            c2 = (ox + x2, oy + y2)
+            end = (ox + px, oy + py)
+            pts.extend(curve((x, y), [c1, c2], end))
+            last_ctrl = c2
+            x, y = end
+        elif c in "QT":
+            if c == "Q":
+                x1, y1, px, py = nums(4)
+                c1 = (ox + x1, oy + y1)
+            else:
+                px, py = nums(2)
+                c1 = (2 * x - last_ctrl[0], 2 * y - last_ctrl[1]) if last_ctrl else (x, y)
+            end = (ox + px, oy + py)
+            pts.extend(curve((x, y), [c1], end))
+            last_ctrl = c1
+            x, y = end
+        elif c == "A":
+            rx, ry, phi = nums(3)
+            large, sweep = flag(), flag()
+            px, py = nums(2)
+            end = (ox + px, oy + py)
+            pts.extend(_arc_points((x, y), rx, ry, phi, large, sweep, end, dev_scale))
+            x, y = end
+            last_ctrl = None
+    if pts:
+        subpaths.append((pts, False))
+    return subpaths
+
+
+def _arc_points(p0, rx, ry, phi, large, sweep, p1, dev_scale=1.0):
+    """Punten (zonder ``p0``) op een elliptische boog, volgens SVG 1.1 bijlage F.6.5."""
+    (x1, y1), (x2, y2) = p0, p1
+    if (x1, y1) == (x2, y2):
+        return []
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return [(x2, y2)]
+    cp, sp = math.cos(math.radians(phi)), math.sin(math.radians(phi))
+    hx, hy = (x1 - x2) / 2.0, (y1 - y2) / 2.0
+    x1p, y1p = cp * hx + sp * hy, -sp * hx + cp * hy
+    lam = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if lam > 1:  # straal te klein: opschalen tot de boog precies past
+        rx *= math.sqrt(lam)
+        ry *= math.sqrt(lam)
+    num = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    den = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coef = math.sqrt(max(0.0, num / den)) * (-1.0 if large == sweep else 1.0)
+    cxp, cyp = coef * rx * y1p / ry, -coef * ry * x1p / rx
+    cx = cp * cxp - sp * cyp + (x1 + x2) / 2.0
+    cy = sp * cxp + cp * cyp + (y1 + y2) / 2.0
+    ux, uy = (x1p - cxp) / rx, (y1p - cyp) / ry
+    vx, vy = (-x1p - cxp) / rx, (-y1p - cyp) / ry
+    t1 = math.atan2(uy, ux)
+    dt = math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+    if not sweep and dt > 0:
+        dt -= 2 * math.pi
+    elif sweep and dt < 0:
+        dt += 2 * math.pi
+    n = max(4, min(128, int(abs(dt) * (rx + ry) / 2.0 * dev_scale / 3.0)))
+    out = []
+    for k in range(1, n):
+        t = t1 + dt * k / n
+        ex, ey = rx * math.cos(t), ry * math.sin(t)
+        out.append((cx + cp * ex - sp * ey, cy + sp * ex + cp * ey))
+    out.append((x2, y2))
+    return out
+
+
+def _signed_area(pts):
+    s = 0.0
+    x0, y0 = pts[-1]
+    for x1, y1 in pts:
+        s += x0 * y1 - x1 * y0
+        x0, y0 = x1, y1
+    return s / 2.0
+
+
+def _oriented(pts, positive=True):
+    return pts if (_signed_area(pts) >= 0) == positive else pts[::-1]
+
+
+def stroke_polyline(pts, closed, width):
+    """Zet een polylijn om in polygonen (segment-quads + ronde joins), allemaal
+    met dezelfde oriëntatie zodat ze met nonzero als unie gevuld worden."""
+    h = width / 2.0
+    polys = []
+    seq = pts + [pts[0]] if closed and len(pts) > 2 else pts
+    for (x0, y0), (x1, y1) in zip(seq, seq[1:]):
+        dx, dy = x1 - x0, y1 - y0
+        length = math.hypot(dx, dy)
+        if length == 0:
+            continue
+        nx, ny = -dy / length * h, dx / length * h
+        polys.append(_oriented([(x0 + nx, y0 + ny), (x1 + nx, y1 + ny), (x1 - nx, y1 - ny), (x0 - nx, y0 - ny)]))
+    if h > 1.0 and len(seq) > 2:
+        joins = seq[1:] if closed else seq[1:-1]
+        for jx, jy in joins:
+            polys.append(_oriented(_ellipse_pts(jx, jy, h, h, 1.0)))
+    return polys
+
+
+# ─── DISPLAY LIST ───────────────────────────────────────
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_style(el, parent):
+    style = dict(parent)
+    style["opacity"] = parent["opacity"]
+    for key in _INHERITED:
+        v = el.get(key)
+        if v is not None:
+            style[key] = v
+    inline = el.get("style")
+    if inline:
+        for decl in inline.split(";"):
+            if ":" in decl:
+                k, v = decl.split(":", 1)
+                if k.strip() in _INHERITED:
+                    style[k.strip()] = v.strip()
+    return style
+
+
+def _geometry(el, tag, dev_scale):
+    """Subpaden (punten, gesloten) in user-space voor een vorm-element."""
+    if tag == "rect":
+        w, h = _num(el, "width"), _num(el, "height")
+        if w <= 0 or h <= 0:
+            return []
+        return [(_rect_pts(_num(el, "x"), _num(el, "y"), w, h, _num(el, "rx"), _num(el, "ry"), dev_scale), True)]
+    if tag == "circle":
+        r = _num(el, "r")
+        return [(_ellipse_pts(_num(el, "cx"), _num(el, "cy"), r, r, dev_scale), True)] if r > 0 else []
+    if tag == "ellipse":
+        rx, ry = _num(el, "rx"), _num(el, "ry")
+        return [(_ellipse_pts(_num(el, "cx"), _num(el, "cy"), rx, ry, dev_scale), True)] if rx > 0 and ry > 0 else []
+    if tag in ("polygon", "polyline"):
+        v = [float(n) for n in _NUM_RE.findall(el.get("points", ""))]
+        pts = list(zip(v[0::2], v[1::2]))
+        return [(pts, tag == "polygon")] if len(pts) >= 2 else []
+    if tag == "line":
+        return [([(_num(el, "x1"), _num(el, "y1")), (_num(el, "x2"), _num(el, "y2"))], False)]
+    if tag == "path":
+        return parse_path(el.get("d"), dev_scale)
+    return []
+
+
+def _alpha(style, key):
+    try:
+        return style["opacity"] * float(style[key])
+    except ValueError:
+        return style["opacity"]
+
+
+def _emit_shape(el, tag, matrix, style, out):
+    dev_scale = _scale_of(matrix)
+    subpaths = _geometry(el, tag, dev_scale)
+    if not subpaths:
+        return
+    fill = None if tag == "line" else parse_color(style["fill"])
+    if fill is not None:
+        polys = [_apply(matrix, pts) for pts, _ in subpaths if len(pts) >= 3]
+        if polys:
+            out.append(Shape(polys, fill, _alpha(style, "fill-opacity"), style["fill-rule"] == "evenodd"))
+    stroke = parse_color(style["stroke"])
+    width = float(_NUM_RE.match(style["stroke-width"]).group(0)) if _NUM_RE.match(style["stroke-width"]) else 1.0
+    if stroke is not None and width > 0:
+        polys = []
+        if tag in ("circle", "ellipse"):
+            rx = _num(el, "r") if tag == "circle" else _num(el, "rx")
+            ry = _num(el, "r") if tag == "circle" else _num(el, "ry")
+            cx, cy = _num(el, "cx"), _num(el, "cy")
+            h = width / 2.0
+            polys.append(_oriented(_ellipse_pts(cx, cy, rx + h, ry + h, dev_scale), True))
+            if rx > h and ry > h:
+                polys.append(_oriented(_ellipse_pts(cx, cy, rx - h, ry - h, dev_scale), False))
+        else:
+            for pts, closed in subpaths:
+                polys.extend(stroke_polyline(pts, closed, width))
+        polys = [_apply(matrix, p) for p in polys]
+        if polys:
+            out.append(Shape(polys, stroke, _alpha(style, "stroke-opacity"), False))
+
+
+def _clip_convex(poly, clip):
+    """Sutherland-Hodgman: knipt ``poly`` af op de convexe polygoon ``clip``."""
+    area = sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(clip, clip[1:] + clip[:1]))
+    sign = 1.0 if area > 0 else -1.0
+    out = poly
+    for (ax, ay), (bx, by) in zip(clip, clip[1:] + clip[:1]):
+        if not out:
+            break
+        ex, ey = bx - ax, by - ay
+        src, out = out, []
+        px, py = src[-1]
+        sp = sign * (ex * (py - ay) - ey * (px - ax))
+        for cx, cy in src:
+            sc = sign * (ex * (cy - ay) - ey * (cx - ax))
+            if (sc >= 0) != (sp >= 0):
+                t = sp / (sp - sc)
+                out.append((px + (cx - px) * t, py + (cy - py) * t))
+            if sc >= 0:
+                out.append((cx, cy))
+            px, py, sp = cx, cy, sc
+    return out if len(out) >= 3 else []
+
+
+def _clip_items(items, clip):
+    """Knipt de vormen in ``items`` (ook in lagen) af op de convexe polygoon ``clip``."""
+    out = []
+    for item in items:
+        if item.__class__ is Shape:
+            polys = [piece for piece in (_clip_convex(poly, clip) for poly in item.polys) if piece]
+            if polys:
+                out.append(Shape(polys, item.color, item.alpha, item.evenodd))
+        elif item.__class__ is Layer:
+            inner = _clip_items(item.items, clip)
+            if inner:
+                out.append(Layer(inner, item.alpha, item.mask))
+    return out
+
+
+def _emit_pattern(el, tag, matrix, style, pattern, out, ctx):
+    """Vult een vorm met een ``<pattern>``: de tegel-inhoud wordt voor elke tegel binnen de
+    bbox van de vorm uitgezet en op de tegel afgeknipt; de vorm zelf is het masker van de laag."""
+    subpaths = [(pts, closed) for pts, closed in _geometry(el, tag, _scale_of(matrix)) if len(pts) >= 3]
+    if not subpaths:
+        return
+    xs = [x for pts, _ in subpaths for x, _ in pts]
+    ys = [y for pts, _ in subpaths for _, y in pts]
+    bx0, by0, bx1, by1 = min(xs), min(ys), max(xs), max(ys)
+    px, py = _num(pattern, "x"), _num(pattern, "y")
+    pw, ph = _num(pattern, "width"), _num(pattern, "height")
+    if pattern.get("patternUnits") != "userSpaceOnUse":
+        px, py = bx0 + px * (bx1 - bx0), by0 + py * (by1 - by0)
+        pw, ph = pw * (bx1 - bx0), ph * (by1 - by0)
+    if pw <= 0 or ph <= 0:
+        return
+    content_style = _child_style(pattern, dict(_DEFAULT_STYLE))
+    merged = []
+    rest = []
+    # Tegels overlappen niet, dus stukken van hetzelfde inhoud-item uit alle tegels
+    # mogen in één Shape: de volgorde tussen items blijft per tegel gelijk.
+    for j in range(int(math.floor((by0 - py) / ph)), int(math.ceil((by1 - py) / ph))):
+        for i in range(int(math.floor((bx0 - px) / pw)), int(math.ceil((bx1 - px) / pw))):
+            tx, ty = px + i * pw, py + j * ph
+            tile_m = _mul(matrix, (1.0, 0.0, 0.0, 1.0, tx, ty))
+            tile = _apply(tile_m, [(0.0, 0.0), (pw, 0.0), (pw, ph), (0.0, ph)])
+            items = []
+            _walk(pattern, tile_m, content_style, items, ctx)
+            if all(item.__class__ is Shape for item in items):
+                while len(merged) < len(items):
+                    src = items[len(merged)]
+                    merged.append(Shape([], src.color, src.alpha, src.evenodd))
+                for k, item in enumerate(items):
+                    for poly in item.polys:
+                        piece = _clip_convex(poly, tile)
+                        if piece:
+                            merged[k].polys.append(piece)
+            else:
+                rest.extend(_clip_items(items, tile))
+    content = [shape for shape in merged if shape.polys] + rest
+    if content:
+        mask = Shape([_apply(matrix, pts) for pts, _ in subpaths], (255, 255, 255), 1.0,
+                     style["fill-rule"] == "evenodd")
+        out.append(Layer(content, _alpha(style, "fill-opacity"), mask))
+
+
+def _as_el(el):
+    """``<text>`` uit ElementTree als ``svgtree.El`` voor ``wlk.outline``; transform en
+    opacity zijn dan al in matrix en stijl verwerkt."""
+    from .svgtree import El
+    attrs = {k: v for k, v in el.attrib.items() if k in ("x", "y", "font-size", "text-anchor", "class")}
+    children = [el.text] if el.text else []
+    for child in el:
+        if _local(child.tag) == "tspan":
+            children.append(El("tspan", {k: v for k, v in child.attrib.items() if k in ("fill", "font-size", "dx")},
+                               [child.text or ""]))
+        if child.tail:
+            children.append(child.tail)
+    return El("text", attrs, children)
+
+
+def _emit_text(el, matrix, style, out, ctx):
+    if ctx.fonts is not None:
+        from .outline import text_to_paths
+        from .svgtree import to_string
+        cls = el.get("class", "w")
+        outlined = text_to_paths(_as_el(el), ctx.fonts.get(cls, ctx.fonts["w"]),
+                                 ctx.letter_spacing if cls == "w" else 0.0)
+        if outlined is not None:
+            wrapper = ET.fromstring('<g xmlns="http://www.w3.org/2000/svg">' + to_string(outlined, None, False) + "</g>")
+            _walk(wrapper, matrix, style, out, ctx)
+        return
+    size = _num(el, "font-size", 16.0)
+    spans = []
+    base_fill = parse_color(style["fill"])
+    base_alpha = _alpha(style, "fill-opacity")
+    if el.text and el.text.strip():
+        spans.append((" ".join(el.text.split()), base_fill, base_alpha, size, 0.0))
+    for child in el:
+        if _local(child.tag) != "tspan":
+            continue
+        cs = _child_style(child, style)
+        if child.text:
+            spans.append((" ".join(child.text.split()), parse_color(cs["fill"]), _alpha(cs, "fill-opacity"),
+                          _num(child, "font-size", size), _num(child, "dx", 0.0)))
+        if child.tail and spans:
+            spans.append((" ".join(child.tail.split()) or " ", base_fill, base_alpha, size, 0.0))
+    while spans and spans[-1][0] == " ":
+        spans.pop()
+    if spans:
+        out.append(TextRun(_num(el, "x"), _num(el, "y"), matrix, size, el.get("class", ""),
+                           el.get("text-anchor", "start"), spans))
+
+
+def _with_opacity(items, alpha, out):
+    """Zet ``items`` van een element met ``opacity`` in ``out``: één vorm krijgt de alpha
+    direct (zelfde resultaat), meerdere vormen worden een laag die als geheel mengt."""
+    if not items:
+        return
+    if len(items) == 1 and items[0].__class__ is Shape:
+        items[0].alpha *= alpha
+        out.append(items[0])
+    elif len(items) == 1 and items[0].__class__ is TextRun:
+        run = items[0]
+        run.spans = [(t, color, a * alpha, size, dx) for t, color, a, size, dx in run.spans]
+        out.append(run)
+    else:
+        out.append(Layer(items, alpha))
+
+
+def _walk(el, matrix, style, out, ctx):
+    for child in el:
+        tag = _local(child.tag)
+        if tag in _SKIP_TAGS:
+            continue
+        opacity = _num(child, "opacity", 1.0)
+        if opacity <= 0:
+            continue
+        target = out if opacity >= 1.0 else []
+        m = matrix
+        if child.get("transform"):
+            m = _mul(matrix, parse_transform(child.get("transform")))
+        st = _child_style(child, style)
+        if tag in ("g", "svg", "a"):
+            _walk(child, m, st, target, ctx)
+        elif tag == "use":
+            ref = (child.get("href") or child.get("{http://www.w3.org/1999/xlink}href") or "").lstrip("#")
+            ref_el = ctx.ids.get(ref)
+            if ref_el is not None:
+                m = _mul(m, (1.0, 0.0, 0.0, 1.0, _num(child, "x"), _num(child, "y")))
+                if _local(ref_el.tag) in ("symbol", "g"):
+                    _walk(ref_el, m, st, target, ctx)
+                else:
+                    _walk([ref_el], m, st, target, ctx)
+        elif tag == "text":
+            _emit_text(child, m, st, target, ctx)
+        else:
+            ref = _URL_RE.match(st["fill"])
+            if ref and _local(getattr(ctx.ids.get(ref.group(1)), "tag", "")) == "pattern":
+                _emit_pattern(child, tag, m, st, ctx.ids[ref.group(1)], target, ctx)
+            _emit_shape(child, tag, m, st, target)
+        if target is not out:
+            _with_opacity(target, opacity, out)
+
+
+def _letter_spacing(root):
+    """``letter-spacing`` (px) van klasse ``w`` uit de ``<style>`` van ``_wrap``."""
+    for el in root.iter():
+        if _local(el.tag) == "style":
+            found = _LETTER_SPACING_RE.search("".join(el.itertext()))
+            if found:
+                return float(found.group(1))
+    return 0.0
+
+
+def display_list(svg_text, scale=1.0, fonts=None):
+    """Parseert een SVG-document tot ``(breedte, hoogte, items)`` in apparaat-pixels.
+
+    Met ``fonts`` ({css-klasse: Font} uit ``wlk.outline.class_fonts``) wordt tekst in
+    contouren omgezet; zonder blijft elke ``<text>`` een ``TextRun``."""
+    root = ET.fromstring(svg_text.encode("utf-8") if isinstance(svg_text, str) else svg_text)
+    w = _num(root, "width", 0.0)
+    h = _num(root, "height", 0.0)
+    matrix = (scale, 0.0, 0.0, scale, 0.0, 0.0)
+    vb = [float(v) for v in _NUM_RE.findall(root.get("viewBox", ""))]
+    if len(vb) == 4 and vb[2] > 0 and vb[3] > 0:
+        if not w or not h:
+            w, h = vb[2], vb[3]
+        matrix = _mul(matrix, (w / vb[2], 0.0, 0.0, h / vb[3], -vb[0] * w / vb[2], -vb[1] * h / vb[3]))
+    ctx = _Context({el.get("id"): el for el in root.iter() if el.get("id")}, fonts, _letter_spacing(root))
+    out = []
+    _walk(root, matrix, dict(_DEFAULT_STYLE), out, ctx)
+    return int(math.ceil(w * scale)), int(math.ceil(h * scale)), out
+
+
+def flat_items(items, alpha=1.0):
+    """Lagen platgeslagen tot losse vormen en tekst met vermenigvuldigde alpha; maskers
+    worden benaderd door op een convexe maskerpolygoon af te knippen. Voor de canvas-preview,
+    die toch geen echte alpha kent."""
+    for item in items:
+        if item.__class__ is Layer:
+            inner = item.items
+            if item.mask is not None and len(item.mask.polys) == 1:
+                inner = _clip_items(inner, item.mask.polys[0])
+            yield from flat_items(inner, alpha * item.alpha)
+        elif alpha >= 1.0:
+            yield item
+        elif item.__class__ is Shape:
+            yield Shape(item.polys, item.color, item.alpha * alpha, item.evenodd)
+        else:
+            yield TextRun(item.x, item.y, item.matrix, item.font_size, item.css_class, item.anchor,
+                          [(t, color, a * alpha, size, dx) for t, color, a, size, dx in item.spans])
+
+
+# ─── RASTERIZER ─────────────────────────────────────────
+
+_TABLES = {}
+_NOT_EDGE_ALPHA = bytes(0 if v in (0, 255) else 1 for v in range(256))
+
+
+def _blend_tables(color, aq):
+    """Vier 256-byte tabellen (R, G, B, A) voor premultiplied 'source over' met alpha aq/255."""
+    key = (color, aq)
+    tabs = _TABLES.get(key)
+    if tabs is None:
+        if len(_TABLES) > 8192:
+            _TABLES.clear()
+        a = aq / 255.0
+        ia = 1.0 - a
+        tabs = tuple(bytes([int(c * a + v * ia + 0.5) for v in range(256)]) for c in (*color, 255))
+        _TABLES[key] = tabs
+    return tabs
+
+
+class Raster:
+    """RGBA-canvas (premultiplied, rij per bytearray) met anti-aliased polygoonvulling."""
+
+    SUBSAMPLES = 4
+
+    def __init__(self, width, height, background=None, origin=(0, 0)):
+        self.width = width
+        self.height = height
+        self.origin = origin  # apparaat-coördinaat van pixel (0, 0); lagen zijn kleiner dan het doek
+        if background is None:
+            px = b"\x00\x00\x00\x00"
+        else:
+            px = bytes(parse_color(background) or (255, 255, 255)) + b"\xff"
+        self.opaque = background is not None
+        self.rows = [bytearray(px * width) for _ in range(height)]
+        self.skipped_text = 0
+
+    def fill(self, polys, color, alpha=1.0, evenodd=False):
+        if alpha <= 0:
+            return
+        W, H = self.width, self.height
+        if self.origin != (0, 0):
+            ox, oy = self.origin
+            polys = [[(x - ox, y - oy) for x, y in pts] for pts in polys]
+        edges = []
+        for pts in polys:
+            if len(pts) < 3:
+                continue
+            x0, y0 = pts[-1]
+            for x1, y1 in pts:
+                if y0 < y1:
+                    edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0), 1))
+                elif y0 > y1:
+                    edges.append((y1, y0, x1, (x0 - x1) / (y0 - y1), -1))
+                x0, y0 = x1, y1
+        if not edges:
+            return
+        edges.sort()
+        y_start = max(0, int(math.floor(edges[0][0])))
+        y_end = min(H, int(math.ceil(max(e[1] for e in edges))))
+        S = self.SUBSAMPLES
+        offsets = [(k + 0.5) / S for k in range(S)]
+        inv = 1.0 / S
+        opaque_run = alpha >= 1.0
+        full = _blend_tables(color, 255) if opaque_run else None
+        solid = [bytes([c]) for c in (*color, 255)]
+        active = []
+        ei = 0
+        n_edges = len(edges)
+        rows = self.rows
+        for y in range(y_start, y_end):
+            while ei < n_edges and edges[ei][0] < y + 1:
+                active.append(edges[ei])
+                ei += 1
+            active = [e for e in active if e[1] > y]
+            if not active:
+                continue
+            events = {}
+            for off in offsets:
+                sy = y + off
+                xs = [(ex + (sy - ey0) * dxdy, d) for ey0, ey1, ex, dxdy, d in active if ey0 <= sy < ey1]
+                if len(xs) < 2:
+                    continue
+                xs.sort()
+                wind = 0
+                for x, d in xs:
+                    inside = (wind & 1) if evenodd else wind
+                    wind += d
+                    now = (wind & 1) if evenodd else wind
+                    if bool(inside) != bool(now):
+                        events[x] = events.get(x, 0.0) + (inv if now else -inv)
+            if not events:
+                continue
+            row = rows[y]
+            partial = {}
+            level = 0.0
+            prev = 0.0
+            for x, delta in sorted(events.items()):
+                if level > 1e-9:
+                    a = prev if prev > 0.0 else 0.0
+                    b = x if x < W else W
+                    if a < b:
+                        ia = int(a)
+                        ib = int(b)
+                        if ia == ib:
+                            partial[ia] = partial.get(ia, 0.0) + level * (b - a)
+                        else:
+                            if a > ia:
+                                partial[ia] = partial.get(ia, 0.0) + level * (ia + 1 - a)
+                                ia += 1
+                            if b > ib:
+                                partial[ib] = partial.get(ib, 0.0) + level * (b - ib)
+                            if ia < ib:
+                                lv = level if level < 1.0 else 1.0
+                                i0, i1 = ia * 4, ib * 4
+                                if opaque_run and lv > 0.999:
+                                    n = ib - ia
+                                    for ch in range(4):
+                                        row[i0 + ch:i1:4] = solid[ch] * n
+                                else:
+                                    aq = int(lv * alpha * 255 + 0.5)
+                                    if aq:
+                                        tabs = full if aq == 255 and full else _blend_tables(color, aq)
+                                        for ch in range(4):
+                                            row[i0 + ch:i1:4] = row[i0 + ch:i1:4].translate(tabs[ch])
+                level += delta
+                prev = x
+            for px, cov in partial.items():
+                aq = int((cov if cov < 1.0 else 1.0) * alpha * 255 + 0.5)
+                if aq:
+                    t0, t1, t2, t3 = _blend_tables(color, aq)
+                    i = px * 4
+                    row[i] = t0[row[i]]
+                    row[i + 1] = t1[row[i + 1]]
+                    row[i + 2] = t2[row[i + 2]]
+                    row[i + 3] = t3[row[i + 3]]
+
+    def draw(self, items):
+        for item in items:
+            if item.__class__ is Shape:
+                self.fill(item.polys, item.color, item.alpha, item.evenodd)
+            elif item.__class__ is Layer:
+                self.composite(item)
+
+    def composite(self, layer):
+        """Rastert een ``Layer`` apart (alleen zijn bbox) en mengt het resultaat met
+        ``layer.alpha`` en het masker als één geheel over dit doek ('source over')."""
+        box = _bbox(layer.items)
+        if box is None or layer.alpha <= 0:
+            return
+        ox, oy = self.origin
+        x0 = max(int(math.floor(box[0])), ox)
+        y0 = max(int(math.floor(box[1])), oy)
+        x1 = min(int(math.ceil(box[2])), ox + self.width)
+        y1 = min(int(math.ceil(box[3])), oy + self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        w = x1 - x0
+        sub = Raster(w, y1 - y0, origin=(x0, y0))
+        sub.draw(layer.items)
+        masks = None
+        if layer.mask is not None:
+            mask = Raster(w, y1 - y0, origin=(x0, y0))
+            mask.fill(layer.mask.polys, (255, 255, 255), 1.0, layer.mask.evenodd)
+            masks = [row[3::4] for row in mask.rows]
+        g = layer.alpha
+        order = sys.byteorder
+        for r, src in enumerate(sub.rows):
+            if not any(src[3::4]):
+                continue
+            dst = self.rows[y0 - oy + r]
+            base = (x0 - ox) * 4
+            pixels = memoryview(src).cast("I")
+            runs = groupby(zip(pixels, masks[r]) if masks else pixels)
+            x = 0
+            for key, grp in runs:
+                n = len(list(grp))
+                pix, m = key if masks else (key, 255)
+                r_, g_, b_, a = pix.to_bytes(4, order)
+                if a and m:
+                    aq = int(a * g * m / 255.0 + 0.5)
+                    if aq:
+                        color = (min(255, r_ * 255 // a), min(255, g_ * 255 // a), min(255, b_ * 255 // a))
+                        tabs = _blend_tables(color, aq)
+                        i0 = base + x * 4
+                        i1 = i0 + n * 4
+                        for ch in range(4):
+                            dst[i0 + ch:i1:4] = dst[i0 + ch:i1:4].translate(tabs[ch])
+                x += n
+
+    def straight_rows(self):
+        """Rijen met niet-premultiplied RGBA (voor PNG); alleen randpixels worden herberekend."""
+        for row in self.rows:
+            flags = row[3::4].translate(_NOT_EDGE_ALPHA)
+            idx = flags.find(1)
+            if idx == -1:
+                yield row
+                continue
+            row = bytearray(row)
+            while idx != -1:
+                i = idx * 4
+                a = row[i + 3]
+                half = a // 2
+                row[i] = min(255, (row[i] * 255 + half) // a)
+                row[i + 1] = min(255, (row[i + 1] * 255 + half) // a)
+                row[i + 2] = min(255, (row[i + 2] * 255 + half) // a)
+                idx = flags.find(1, idx + 1)
+            yield row
+
+    def to_png(self, level=6):
+        if self.opaque:
+            color_type = 2
+            raw = bytearray()
+            rgb = bytearray(self.width * 3)
+            for row in self.rows:
+                rgb[0::3] = row[0::4]
+                rgb[1::3] = row[1::4]
+                rgb[2::3] = row[2::4]
+                raw += b"\x00"
+                raw += rgb
+        else:
+            color_type = 6
+            raw = bytearray()
+            for row in self.straight_rows():
+                raw += b"\x00"
+                raw += row
+        return encode_png(self.width, self.height, color_type, bytes(raw), level)
+
+
+def _bbox(items):
+    """(x0, y0, x1, y1) van alle vormen in ``items`` (lagen meegerekend), of None."""
+    box = None
+    for item in items:
+        if item.__class__ is Shape:
+            if not item.polys:
+                continue
+            b = item.bbox()
+        elif item.__class__ is Layer:
+            b = _bbox(item.items)
+            if b is None:
+                continue
+        else:
+            continue
+        box = b if box is None else (min(box[0], b[0]), min(box[1], b[1]), max(box[2], b[2]), max(box[3], b[3]))
+    return box
+
+
+def encode_png(width, height, color_type, raw, level=6):
+    """Schrijft een 8-bit PNG; ``raw`` bevat al de filterbyte (0) per rij."""
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw, level)) + chunk(b"IEND", b""))
+
+
+def can_render_text():
+    """True als er fonts met outlines zijn, zodat ``<text>`` in de PNG terechtkomt."""
+    from .outline import class_fonts
+    return class_fonts() is not None
+
+
+def rasterize(svg_text, scale=1.0, background=None):
+    """SVG-tekst -> ``Raster``. Tekst wordt via de outline-fonts gerasterd; zonder zulke
+    fonts ontbreekt hij en telt ``raster.skipped_text`` de overgeslagen tekst-elementen."""
+    from .outline import class_fonts
+    w, h, items = display_list(svg_text, scale, fonts=class_fonts())
+    raster = Raster(max(1, w), max(1, h), background)
+    raster.draw(items)
+    raster.skipped_text = sum(1 for item in flat_items(items) if item.__class__ is TextRun)
+    return raster
+
+
+def svg_to_png(svg_text, scale=1.0, background=None):
+    """SVG-tekst -> PNG-bytes. ``background=None`` geeft een transparante achtergrond."""
+    return rasterize(svg_text, scale, background).to_png()
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Register van alle varianten: ingebouwd (``wlk/core.py``), uit een plugin-map en via
+entry points (groep ``wlk.variants``).
+
+Ontdekken gebeurt zonder iets te importeren: de broncode wordt met ``ast`` gelezen.
+Per variant levert dat metadata:
+
+* ``id`` – functienaam (``v11_christmas``), ``label`` – uit ``@variant(label=...)`` of de
+  letterlijke string in ``return ("08 - Kerst", ...)``;
+* ``season`` – seizoensregel (jaar -> [(start, eind)]): voor ingebouwde varianten uit
+  ``wlk.seasons``, voor plugins uit ``@variant(season=(m1, d1, m2, d2))``;
+* ``fields`` – gelezen BrandConfig-velden, afgeleid uit ``c.veld`` in de functie en in
+  hulpfuncties die de config doorgegeven krijgen;
+* ``elements`` – aantal elementen uit ``@variant(elements=...)``, geteld bij de standaardbreedte
+  ``ELEMENTS_WIDTH``; varianten met strooi- of tegelpatronen krijgen er bij een andere
+  ``out_width`` meer of minder (v18: 67 bij 600 px, 235 bij 2400 px).
+
+Een ``Variant`` gedraagt zich als de variantfunctie (``v(c)``, ``v.build(c)``,
+``__name__``); de module wordt pas bij de eerste aanroep geïmporteerd. Een plugin is een
+``.py`` bestand in ``plugins/`` naast de app (of in ``WLK_PLUGIN_DIR``) met functies met
+de decorator ``wlk.core.variant``.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+from wlk import seasons
+
+ENTRY_POINT_GROUP = "wlk.variants"
+ELEMENTS_WIDTH = 1200  # ``out_width`` waarbij ``elements`` geteld is (standaard van BrandConfig)
+_DECORATORS = ("variant", "_variant")
+_CORE = Path(__file__).resolve().parent / "core.py"
+_CONFIG = Path(__file__).resolve().parent / "config.py"
+
+
+def plugin_dirs():
+    """``plugins/`` naast de app en de mappen uit ``WLK_PLUGIN_DIR`` (gescheiden door ``os.pathsep``)."""
+    dirs = [Path(p) for p in os.environ.get("WLK_PLUGIN_DIR", "").split(os.pathsep) if p]
+    return dirs + [Path(__file__).resolve().parent.parent / "plugins"]
+
+
+class Variant:
+    """Metadata van één variant plus lui laden van de functie."""
+
+    def __init__(self, id, label, module, path=None, season=None, fields=(), elements=None, source="builtin",
+                 stamp=""):
+        self.id = id
+        self.label = label
+        self.season = season
+        self.fields = tuple(fields)
+        self.elements = elements
+        self.path = path
+        self.source = source
+        self.stamp = stamp  # hash van de plugin-bron voor de schijfcache (core.py zit al in ``_stamp``)
+        # Zelfde namen als de functie, zodat cache-sleutels en profiler niet hoeven te laden.
+        self.__name__ = self.__qualname__ = id
+        self.__module__ = module
+        self._fn = None
+
+    def __repr__(self):
+        return "Variant(" + repr(self.id) + ", " + self.source + (", geladen" if self._fn else "") + ")"
+
+    @property
+    def loaded(self):
+        return self._fn is not None
+
+    def load(self):
+        fn = self._fn
+        if fn is None:
+            module = sys.modules.get(self.__module__)
+            if module is None:
+                if self.path is not None and self.source == "plugin":
+                    spec = importlib.util.spec_from_file_location(self.__module__, self.path)
+                    module = importlib.util.module_from_spec(spec)
+                    sys.modules[self.__module__] = module
+                    try:
+                        spec.loader.exec_module(module)
+                    except BaseException:
+                        del sys.modules[self.__module__]
+                        raise
+                else:
+                    module = importlib.import_module(self.__module__)
+            fn = self._fn = getattr(module, self.id)
+        return fn
+
+    def __call__(self, c):
+        return self.load()(c)
+
+    def build(self, c):
+        return self.load().build(c)
+
+    def window(self, year):
+        """Actieve periodes [(start, eind)] in ``year``, leeg voor varianten zonder seizoen."""
+        return self.season(year) if self.season else []
+
+
+# ─── bronanalyse ───
+
+def _config_fields(tree):
+    """Veldnamen van ``class BrandConfig`` (annotaties) uit de AST van config.py."""
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "BrandConfig":
+            return frozenset(n.target.id for n in node.body
+                             if isinstance(n, ast.AnnAssign) and isinstance(n.target, ast.Name))
+    return frozenset()
+
+
+class _Module:
+    """Top-level functies van één bronbestand en hun gelezen config-velden."""
+
+    def __init__(self, tree, known_fields, imported=None):
+        self.functions = {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
+        self.known = known_fields
+        self.imported = imported or {}  # naam -> _Module waar de hulpfunctie vandaan komt
+        self._reads = {}
+
+    def reads(self, name, index=0):
+        """Velden die functie ``name`` leest van zijn positionele parameter ``index``."""
+        key = (name, index)
+        if key in self._reads:
+            return self._reads[key]
+        self._reads[key] = frozenset()  # recursie-stop
+        fn = self.functions.get(name)
+        if fn is None or index >= len(fn.args.args):
+            return frozenset()
+        param = fn.args.args[index].arg
+        out = set()
+        for node in ast.walk(fn):
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == param:
+                if node.attr in self.known:
+                    out.add(node.attr)
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                for i, arg in enumerate(node.args):
+                    if isinstance(arg, ast.Name) and arg.id == param:
+                        owner = self if node.func.id in self.functions else self.imported.get(node.func.id)
+                        if owner is not None:
+                            out |= owner.reads(node.func.id, i)
+        result = self._reads[key] = frozenset(out)
+        return result
+
+
+def _decorator_meta(fn):
+    """(True, {kwargs}) als ``fn`` een variant-decorator heeft, anders (False, None)."""
+    for dec in fn.decorator_list:
+        target = dec.func if isinstance(dec, ast.Call) else dec
+        name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", None)
+        if name in _DECORATORS:
+            meta = {}
+            if isinstance(dec, ast.Call):
+                for kw in dec.keywords:
+                    try:
+                        meta[kw.arg] = ast.literal_eval(kw.value)
+                    except ValueError:
+                        pass  # geen letterlijke waarde: overslaan
+            return True, meta
+    return False, None
+
+
+def _return_label(fn):
+    for node in ast.walk(fn):
+        if isinstance(node, ast.Return) and isinstance(node.value, ast.Tuple) and node.value.elts:
+            first = node.value.elts[0]
+            if isinstance(first, ast.Constant) and isinstance(first.value, str):
+                return first.value
+    return None
+
+
+def _listed_order(tree, name="ALL_VARIANTS"):
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == name for t in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                return [e.id for e in node.value.elts if isinstance(e, ast.Name)]
+    return None
+
+
+def _season_rule(meta, vid, builtin_rules):
+    season = meta.get("season")
+    if isinstance(season, (tuple, list)) and len(season) == 4:
+        return seasons._fixed(*season)
+    return builtin_rules.get(vid) if season is None else None
+
+
+def _scan(path, module_name, source, known, core_module, only=None):
+    """[Variant] uit één bronbestand (``only``: alleen deze functienaam)."""
+    text = Path(path).read_text(encoding="utf-8")
+    tree = ast.parse(text, str(path))
+    stamp = "" if source == "builtin" else hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+    mod = _Module(tree, known, {n: core_module for n in core_module.functions} if core_module else None)
+    rules = dict(seasons.SEASON_RULES) if source == "builtin" else {}
+    found = {}
+    for name, fn in mod.functions.items():
+        is_variant, meta = _decorator_meta(fn)
+        if not is_variant or (only is not None and name != only):
+            continue
+        found[name] = Variant(name, meta.get("label") or _return_label(fn) or name, module_name,
+                              path=str(path), season=_season_rule(meta, name, rules),
+                              fields=sorted(meta.get("fields") or mod.reads(name)),
+                              elements=meta.get("elements"), source=source, stamp=stamp)
+    order = _listed_order(tree) or list(found)
+    return [found[n] for n in order if n in found], mod
+
+
+# ─── register ───
+
+_variants = None
+problems = []
+
+
+def _discover():
+    problems.clear()
+    known = _config_fields(ast.parse(_CONFIG.read_text(encoding="utf-8"), str(_CONFIG)))
+    out, core_module = _scan(_CORE, "wlk.core", "builtin", known, None)
+    seen = {v.id for v in out}
+
+    def add(found, origin):
+        for v in found:
+            if v.id in seen:
+                problems.append(origin + ": variant '" + v.id + "' bestaat al; overgeslagen")
+                continue
+            seen.add(v.id)
+            out.append(v)
+
+    for d in plugin_dirs():
+        if not d.is_dir():
+            continue
+        for path in sorted(d.glob("*.py")):
+            if path.name.startswith("_"):
+                continue
+            try:
+                found, _ = _scan(path, "wlk_plugins." + path.stem, "plugin", known, core_module)
+            except (OSError, SyntaxError, UnicodeDecodeError) as e:
+                problems.append(str(path) + ": " + str(e))
+                continue
+            add(found, str(path))
+
+    try:
+        from importlib.metadata import entry_points
+        eps = sorted(entry_points(group=ENTRY_POINT_GROUP), key=lambda ep: ep.name)
+    except Exception as e:  # kapotte package-metadata mag de app niet blokkeren
+        problems.append("entry points: " + repr(e))
+        eps = []
+    for ep in eps:
+        module_name, _, attr = ep.value.partition(":")
+        try:
+            spec = importlib.util.find_spec(module_name)
+            found, _ = _scan(spec.origin, module_name, "entrypoint", known, core_module, only=attr.strip() or None)
+        except Exception as e:
+            problems.append("entry point " + ep.name + ": " + repr(e))
+            continue
+        add(found, "entry point " + ep.name)
+    return out
+
+
+def variants():
+    """Alle varianten (ingebouwd, plugins, entry points) in vaste volgorde; gecachet per proces."""
+    global _variants
+    if _variants is None:
+        _variants = _discover()
+    return _variants
+
+
+def reload():
+    """Opnieuw ontdekken (bijv. na het toevoegen van een plugin)."""
+    global _variants
+    _variants = None
+    return variants()
+
+
+def get(variant_id):
+    for v in variants():
+        if v.id == variant_id:
+            return v
+    raise KeyError("onbekende variant: " + variant_id)
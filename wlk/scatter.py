@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Strooi-layout voor decoraties (pepernoten, hartjes, confetti).
+
+Punten worden met dart throwing onder een minimale onderlinge afstand geplaatst
+(Poisson-disk). Een kandidaat wordt alleen getoetst tegen de buren in een raster met
+cellen van ``afstand / √2``: per cel hoogstens één punt, dus een vaste 5×5 omgeving.
+Een layout kost daarmee O(n) in plaats van O(n²) bij testen tegen alle eerdere punten.
+Kandidaten binnen een ``avoid``-rechthoek (tekst, icoon) worden overgeslagen.
+
+Layouts zijn deterministisch per ``seed`` en worden per (seed, gebied, aantal, afstand,
+vermijdgebieden) bewaard; varianten trekken kleur en grootte daarna met hun eigen
+``random.Random``.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import random
+
+ATTEMPTS_PER_POINT = 30
+# Afstand zo gekozen dat ``count`` punten ruim onder de verzadiging van willekeurig
+# strooien (~0.7 * oppervlak / afstand²) blijven en dus vrijwel altijd allemaal passen.
+FILL_FACTOR = 0.35
+REFERENCE_WIDTH = 1200  # breedte waarvoor de basisaantallen van de varianten gelden
+# 5×5 omgeving van een cel, dichtstbijzijnde cellen eerst: een afgewezen kandidaat
+# botst meestal al in zijn eigen cel of een directe buur.
+_NEIGHBOURS = tuple(sorted(((di, dj) for di in (-2, -1, 0, 1, 2) for dj in (-2, -1, 0, 1, 2)),
+                           key=lambda o: o[0] * o[0] + o[1] * o[1]))
+
+
+def scaled_count(base, width):
+    """Aantal elementen bij ``width``: ``base`` tot de referentiebreedte, daarboven evenredig."""
+    return max(base, base * width // REFERENCE_WIDTH)
+
+
+def _overlap(a, b):
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    return w * h if w > 0 and h > 0 else 0
+
+
+@functools.lru_cache(maxsize=512)
+def scatter(seed, region, count, min_dist=0.0, avoid=()):
+    """Tot ``count`` punten (x, y) in ``region`` = (x0, y0, x1, y1), buiten de ``avoid``-rechthoeken.
+
+    De onderlinge afstand is minstens ``min_dist`` en groter als er ruimte genoeg is.
+    Geeft een tuple met gehele coördinaten (hashbaar, gedeeld via de cache).
+    """
+    x0, y0, x1, y1 = region
+    w = x1 - x0
+    h = y1 - y0
+    if count <= 0 or w <= 0 or h <= 0:
+        return ()
+    free = max(1.0, w * h - sum(_overlap(region, box) for box in avoid))
+    d = max(min_dist, math.sqrt(FILL_FACTOR * free / count), 1.0)
+    d2 = d * d
+    cell = d / math.sqrt(2)
+    grid = {}
+    get = grid.get
+    points = []
+    rand = random.Random(seed).random
+    for _ in range(count * ATTEMPTS_PER_POINT):
+        x = x0 + rand() * w
+        y = y0 + rand() * h
+        for bx0, by0, bx1, by1 in avoid:
+            if bx0 <= x <= bx1 and by0 <= y <= by1:
+                break
+        else:
+            i = int((x - x0) / cell)
+            j = int((y - y0) / cell)
+            for di, dj in _NEIGHBOURS:
+                p = get((i + di, j + dj))
+                if p is not None and (p[0] - x) ** 2 + (p[1] - y) ** 2 < d2:
+                    break
+            else:
+                grid[i, j] = (x, y)
+                points.append((int(round(x)), int(round(y))))
+                if len(points) >= count:
+                    break
+    return tuple(points)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Seizoenskalender: welke variant is op welke datum actief.
+
+``SEASON_RULES`` koppelt elke seizoensvariant aan een regel die per jaar de actieve
+periode(s) geeft; Pasen (en daarmee carnaval) wordt per jaar berekend. Overlappen twee
+periodes, dan wint de regel die eerder in de tabel staat. Dagen zonder seizoen krijgen de
+standaardvariant.
+
+``build_manifest`` maakt daarvan een datum -> bestand manifest voor een batch-uitvoermap,
+zodat een webserver bij een verzoek alleen hoeft op te zoeken (``lookup``).
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+DEFAULT_VARIANT = "v01_basic"
+
+
+def easter(year):
+    """Paaszondag (gregoriaans, anonieme computus van Meeus/Jones/Butcher)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year, month, weekday, n):
+    """De n-de ``weekday`` (ma=0) van de maand."""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _fixed(m1, d1, m2, d2):
+    """Vaste periode; loopt door over de jaargrens als het einde vóór het begin ligt."""
+    def rule(year):
+        start = date(year, m1, d1)
+        end = date(year + 1 if (m2, d2) < (m1, d1) else year, m2, d2)
+        return [(start, end)]
+    return rule
+
+
+def _koningsdag(year):
+    day = date(year, 4, 27)
+    if day.weekday() == 6:  # valt 27 april op zondag, dan zaterdag de 26e
+        day -= timedelta(days=1)
+    return [(day - timedelta(days=6), day)]
+
+
+def _easter(year):
+    e = easter(year)
+    return [(e - timedelta(days=14), e + timedelta(days=1))]  # t/m tweede paasdag
+
+
+def _carnival(year):
+    e = easter(year)
+    return [(e - timedelta(days=52), e - timedelta(days=47))]  # Weiberfastnacht t/m vastenavond
+
+
+def _oktoberfest(year):
+    start = date(year, 9, 16)
+    start += timedelta(days=(5 - start.weekday()) % 7)  # zaterdag na 15 september
+    end = _nth_weekday(year, 10, 6, 1)  # eerste zondag van oktober ...
+    if end < date(year, 10, 3):
+        end = date(year, 10, 3)  # ... maar minstens t/m 3 oktober
+    return [(start, end)]
+
+
+def _black_friday(year):
+    friday = _nth_weekday(year, 11, 3, 4) + timedelta(days=1)  # dag na Thanksgiving
+    return [(friday, friday + timedelta(days=3))]  # t/m Cyber Monday
+
+
+# Volgorde = prioriteit bij overlap (korte feestdagen vóór lange seizoenen).
+SEASON_RULES = [
+    ("v13_koningsdag", _koningsdag),
+    ("v19_bevrijding", _fixed(5, 1, 5, 5)),
+    ("v17_einheit", _fixed(10, 1, 10, 3)),
+    ("v15_valentine", _fixed(2, 7, 2, 14)),
+    ("v22_blackfriday", _black_friday),
+    ("v12_sinterklaas", _fixed(11, 15, 12, 5)),
+    ("v16_newyear", _fixed(12, 27, 1, 2)),
+    ("v11_christmas", _fixed(12, 1, 12, 26)),
+    ("v14_easter", _easter),
+    ("v20_carnival", _carnival),
+    ("v21_halloween", _fixed(10, 24, 10, 31)),
+    ("v18_oktoberfest", _oktoberfest),
+]
+
+
+def season_rules():
+    """``SEASON_RULES`` plus de seizoenen van plugin-varianten uit ``wlk.registry`` (daarna, dus lagere prioriteit)."""
+    from wlk import registry
+    own = {name for name, _ in SEASON_RULES}
+    return SEASON_RULES + [(v.id, v.season) for v in registry.variants() if v.season and v.id not in own]
+
+
+def periods(year):
+    """Alle actieve periodes die ``year`` raken: [(start, eind, variant)] in tabelvolgorde."""
+    out = []
+    for name, rule in season_rules():
+        for y in (year - 1, year):
+            for start, end in rule(y):
+                if end.year >= year and start.year <= year:
+                    out.append((start, end, name))
+    return out
+
+
+def variant_for(day, default=DEFAULT_VARIANT, _periods=None):
+    """De variant die op ``day`` actief is."""
+    for start, end, name in _periods if _periods is not None else periods(day.year):
+        if start <= day <= end:
+            return name
+    return default
+
+
+def year_schedule(year, default=DEFAULT_VARIANT):
+    """{datum: variant} voor elke dag van het jaar."""
+    ps = periods(year)
+    day = date(year, 1, 1)
+    out = {}
+    while day.year == year:
+        out[day] = variant_for(day, default, ps)
+        day += timedelta(days=1)
+    return out
+
+
+def runs(schedule):
+    """Aaneengesloten stukken met dezelfde variant: [(van, tot, variant)]."""
+    out = []
+    for day in sorted(schedule):
+        name = schedule[day]
+        if out and out[-1][2] == name and out[-1][1] + timedelta(days=1) == day:
+            out[-1] = (out[-1][0], day, name)
+        else:
+            out.append((day, day, name))
+    return out
+
+
+def build_manifest(year, brand_dirs, default=DEFAULT_VARIANT):
+    """Manifest voor een batch-uitvoermap: per dag de variant, per merk het bestand per variant.
+
+    ``brand_dirs`` zijn de mapnamen uit de batch (``0001_merk``).
+    """
+    from wlk import registry
+    from wlk.config import _svg_filename
+    schedule = year_schedule(year, default)
+    used = sorted(set(schedule.values()))
+    index = {v.id: i for i, v in enumerate(registry.variants())}
+    files = {name: _svg_filename(index[name], registry.variants()[index[name]].label) for name in used}
+    return {
+        "version": 1, "year": year, "default": default,
+        "periods": [{"from": a.isoformat(), "to": b.isoformat(), "variant": v} for a, b, v in runs(schedule)],
+        "days": {d.isoformat(): v for d, v in sorted(schedule.items())},
+        "files": files,
+        "brands": list(brand_dirs),
+    }
+
+
+def lookup(manifest, brand_dir, day):
+    """Relatief pad (``merkmap/bestand.svg``) voor een merk op een datum (``date`` of ISO-tekst)."""
+    key = day.isoformat() if hasattr(day, "isoformat") else str(day)
+    variant = manifest["days"].get(key, manifest["default"])
+    return brand_dir + "/" + manifest["files"].get(variant, manifest["files"][manifest["default"]])
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Lokale HTTP render-service (``http.server``, alleen standaardbibliotheek).
+
+    GET /                              -> JSON-lijst van varianten
+    GET /logo/<variant>.svg?left=...   -> SVG; query-parameters zijn BrandConfig-velden
+
+``<variant>`` is de functienaam (``v18_oktoberfest``) of alleen het nummer (``v18``).
+Extra parameter ``optimize=N`` levert de geoptimaliseerde, compacte SVG (N decimalen).
+
+De ETag is de cache-sleutel uit ``wlk.cache`` (app-versie, render-code, variant en alle
+velden): dezelfde invoer geeft altijd dezelfde bytes, dus ``If-None-Match`` kan met een 304
+beantwoord worden zonder te renderen. Antwoorden (ook de gzip-versie) worden in een
+begrensde LRU in het proces bewaard; optioneel staat de gedeelde ``DiskCache`` eronder.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from wlk import APP_VERSION
+from wlk.cache import cache_key
+from wlk import registry
+from wlk.config import config_from_dict
+from wlk.optimize import optimize_tree
+from wlk.svgtree import to_string
+
+SVG_TYPE = "image/svg+xml; charset=utf-8"
+GZIP_MIN_BYTES = 512  # kleinere antwoorden worden niet gecomprimeerd
+
+
+def _variant_index():
+    index = {}
+    for fn in registry.variants():
+        index[fn.__name__] = fn
+        index.setdefault(fn.__name__.split("_", 1)[0], fn)
+    return index
+
+
+def _accepts_gzip(header):
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            q = params.strip()
+            if q.startswith("q="):
+                try:
+                    return float(q[2:]) > 0
+                except ValueError:
+                    return False
+            return True
+    return False
+
+
+def _etag_matches(header, etags):
+    if not header:
+        return False
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag in etags:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Begrensde, thread-safe LRU van sleutel -> (svg-bytes, gzip-bytes of None)."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, body, gz):
+        size = len(body) + (len(gz) if gz else 0)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[0]) + (len(old[1]) if old[1] else 0)
+            self._entries[key] = (body, gz)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (b, g) = self._entries.popitem(last=False)
+                self._bytes -= len(b) + (len(g) if g else 0)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self._bytes}
+
+
+class RenderService:
+    """Rendert en cachet antwoorden; los van HTTP, zodat het ook zonder server bruikbaar is."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk=None, max_age=86400):
+        self.cache = ResponseCache(max_bytes)
+        self.disk = disk
+        self.max_age = max_age
+        self.variants = _variant_index()
+
+    def resolve(self, path, query):
+        """(fn, cfg, optimize, sleutel) voor een verzoek; ``LookupError``/``ValueError`` bij fouten."""
+        name = path[len("/logo/"):]
+        if name.endswith(".svg"):
+            name = name[:-4]
+        fn = self.variants.get(name)
+        if fn is None:
+            raise LookupError("onbekende variant: " + name)
+        params = dict(query)
+        optimize = params.pop("optimize", None)
+        if optimize is not None:
+            try:
+                optimize = max(0, min(6, int(optimize)))
+            except ValueError:
+                raise ValueError("ongeldige waarde voor 'optimize': " + repr(optimize)) from None
+        cfg = config_from_dict(params)
+        key = cache_key(fn, cfg, "" if optimize is None else "optimize=" + str(optimize))
+        return fn, cfg, optimize, key
+
+    def body(self, fn, cfg, optimize, key):
+        """(svg-bytes, gzip-bytes of None) uit de cache, de schijfcache of vers gerenderd."""
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        svg = None
+        if self.disk is not None:
+            hit = self.disk.get(key)
+            if hit is not None:
+                svg = hit[1]
+        if svg is None:
+            label, root = fn.build(cfg)
+            if optimize is not None:
+                optimize_tree(root, optimize)
+            svg = to_string(root, "  " if optimize is None else None)
+            if self.disk is not None:
+                self.disk.put(key, label, svg)
+        body = svg.encode("utf-8")
+        gz = gzip.compress(body, 6, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+        self.cache.put(key, body, gz)
+        return body, gz
+
+    def index(self):
+        return [{"name": v.id, "label": v.label, "path": "/logo/" + v.id + ".svg"} for v in registry.variants()]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive; elk antwoord heeft een Content-Length
+    # Kop en body gaan in twee writes; zonder TCP_NODELAY kost dat ~40 ms (Nagle + delayed ACK).
+    disable_nagle_algorithm = True
+    server_version = "wlk-logo/" + APP_VERSION
+    service = None  # gezet door make_server
+    verbose = False
+
+    def do_HEAD(self):
+        self._handle(head=True)
+
+    def do_GET(self):
+        self._handle(head=False)
+
+    def _send(self, status, body=b"", content_type="text/plain; charset=utf-8", headers=(), head=False):
+        self.send_response(status)
+        if status != HTTPStatus.NOT_MODIFIED:  # een 304 heeft nooit een body
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+        for k, v in headers:
+            self.send_header(k, v)
+        self.end_headers()
+        if not head and status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(body)
+
+    def _handle(self, head):
+        url = urlsplit(self.path)
+        if url.path in ("/", "/index.json"):
+            body = json.dumps(self.service.index(), ensure_ascii=False).encode("utf-8")
+            self._send(HTTPStatus.OK, body, "application/json; charset=utf-8", head=head)
+            return
+        if url.path == "/stats.json":
+            body = json.dumps(self.service.cache.stats()).encode("utf-8")
+            self._send(HTTPStatus.OK, body, "application/json; charset=utf-8", (("Cache-Control", "no-store"),), head)
+            return
+        if not url.path.startswith("/logo/"):
+            self._send(HTTPStatus.NOT_FOUND, b"niet gevonden\n", head=head)
+            return
+        try:
+            fn, cfg, optimize, key = self.service.resolve(url.path, parse_qsl(url.query, keep_blank_values=True))
+        except LookupError as e:
+            self._send(HTTPStatus.NOT_FOUND, (str(e) + "\n").encode("utf-8"), head=head)
+            return
+        except ValueError as e:
+            self._send(HTTPStatus.BAD_REQUEST, (str(e) + "\n").encode("utf-8"), head=head)
+            return
+        use_gzip = _accepts_gzip(self.headers.get("Accept-Encoding"))
+        etag = '"' + key[:40] + '"'
+        etag_gz = '"' + key[:40] + '-gz"'
+        headers = [("Cache-Control", "public, max-age=" + str(self.service.max_age)),
+                   ("Vary", "Accept-Encoding")]
+        if _etag_matches(self.headers.get("If-None-Match"), (etag, etag_gz)):
+            headers.append(("ETag", etag_gz if use_gzip else etag))
+            self._send(HTTPStatus.NOT_MODIFIED, headers=headers, head=head)
+            return
+        try:
+            body, gz = self.service.body(fn, cfg, optimize, key)
+        except Exception as e:
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, ("renderfout: " + repr(e) + "\n").encode("utf-8"), head=head)
+            return
+        if use_gzip and gz is not None:
+            body = gz
+            headers += [("Content-Encoding", "gzip"), ("ETag", etag_gz)]
+        else:
+            headers.append(("ETag", etag))
+        self._send(HTTPStatus.OK, body, SVG_TYPE, headers, head)
+
+    def log_message(self, fmt, *args):
+        if self.verbose:
+            super().log_message(fmt, *args)
+
+
+def make_server(host="127.0.0.1", port=8765, service=None, verbose=False):
+    """ThreadingHTTPServer met een eigen handlerklasse (``port=0`` kiest een vrije poort)."""
+    handler = type("WlkHandler", (_Handler,), {"service": service or RenderService(), "verbose": verbose})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(host="127.0.0.1", port=8765, service=None, verbose=False):
+    server = make_server(host, port, service, verbose)
+    print("Render-service op http://" + host + ":" + str(server.server_address[1]) + "/ (Ctrl+C stopt)")
+    started = time.perf_counter()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        st = server.RequestHandlerClass.service.cache.stats()
+        print("Gestopt na " + format(time.perf_counter() - started, ".0f") + " s; cache: " + str(st["hits"])
+              + " hits, " + str(st["misses"]) + " misses")
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Opslag van de GUI-instellingen (``wlk_config.json``).
+
+* ``save`` schrijft niet meteen: opeenvolgende saves (live-preview, elke generatie)
+  worden na ``delay`` seconden samengevoegd tot één write; ongewijzigde data wordt
+  helemaal niet geschreven.
+* Elke write gaat eerst als één regel met volgnummer en checksum naar een klein journal
+  (``wlk_config.json.journal``, met fsync) en daarna atomisch (tijdelijk bestand +
+  rename) naar het configbestand. Een crash halverwege laat altijd een intacte versie
+  achter; ``load`` neemt de nieuwste.
+* ``load`` valideert de velden één keer via ``config_from_dict``: ongeldige of onbekende
+  velden krijgen de standaardwaarde en worden als probleem teruggegeven.
+
+Het configbestand blijft een gewoon JSON-object met de BrandConfig-velden (plus
+``_seq``), zodat oudere versies van de app het nog kunnen lezen.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import zlib
+from dataclasses import fields
+from pathlib import Path
+
+from wlk.config import BrandConfig, config_from_dict
+from wlk.export import atomic_write
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_MAX_LINES = 16  # daarna wordt het journal ingekort tot de laatste regel
+_FIELDS = frozenset(f.name for f in fields(BrandConfig))
+
+
+def _dumps(data):
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+
+def apply_fields(cfg, data):
+    """Zet de velden uit ``data`` op ``cfg``; geeft [problemen] terug voor ongeldige of onbekende velden."""
+    problems = []
+    for k, v in data.items():
+        if k.startswith("_"):
+            continue
+        if k not in _FIELDS:
+            problems.append("onbekend veld genegeerd: " + k)
+        elif v == "" and isinstance(getattr(cfg, k), str):
+            setattr(cfg, k, "")  # config_from_dict slaat lege waarden over, maar een lege tagline is geldig
+        else:
+            try:
+                setattr(cfg, k, getattr(config_from_dict({k: v}), k))
+            except ValueError as e:
+                problems.append(str(e) + "; standaardwaarde gebruikt")
+    return problems
+
+
+def validate(data):
+    """(BrandConfig, [problemen]) uit een ingelezen dict; ongeldige velden vallen terug op de standaard."""
+    cfg = BrandConfig()
+    if not isinstance(data, dict):
+        return cfg, ["instellingen zijn geen JSON-object; standaardwaarden gebruikt"]
+    return cfg, apply_fields(cfg, data)
+
+
+class SettingsStore:
+    """Crash-veilige, samenvoegende opslag van één dict in een JSON-bestand."""
+
+    def __init__(self, path, delay=1.0, on_error=None):
+        self.path = Path(path)
+        self.journal = self.path.with_name(self.path.name + JOURNAL_SUFFIX)
+        self.delay = delay
+        self.on_error = on_error  # aangeroepen met de OSError (vanuit de timer-thread)
+        self.writes = 0
+        self._seq = 0
+        self._journal_lines = 0
+        self._pending = None
+        self._written = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    # ─── lezen ───
+
+    def _read_main(self, problems):
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            problems.append("kan " + self.path.name + " niet lezen: " + str(e))
+            return None
+        try:
+            data = json.loads(text)
+        except ValueError:
+            problems.append(self.path.name + " is beschadigd")
+            return None
+        seq = data.pop("_seq", 0) if isinstance(data, dict) else 0
+        return (seq if isinstance(seq, int) else 0, data)
+
+    def _read_journal(self):
+        best = None
+        try:
+            with open(self.journal, "rb") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        self._journal_lines = len(lines)
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                data = entry["data"]
+                if zlib.crc32(_dumps(data).encode("utf-8")) != entry["crc"]:
+                    continue
+                if best is None or entry["seq"] > best[0]:
+                    best = (entry["seq"], data)
+            except (ValueError, KeyError, TypeError):
+                continue  # half geschreven regel van een crash
+        return best
+
+    def load(self):
+        """(BrandConfig, [problemen]) uit de nieuwste intacte versie, of de standaard."""
+        problems = []
+        main = self._read_main(problems)
+        journal = self._read_journal()
+        best = main
+        if journal is not None and (main is None or journal[0] > main[0]):
+            best = journal
+            problems.append(self.path.name + " hersteld uit het journal")
+        if best is None:
+            return BrandConfig(), problems
+        cfg, bad = validate(best[1])
+        with self._lock:
+            self._seq = best[0]
+            self._written = _dumps(best[1]) if best is main else None
+        return cfg, problems + bad
+
+    # ─── schrijven ───
+
+    def save(self, data):
+        """Plant een write van ``data`` over ``delay`` seconden (latere saves vervangen deze)."""
+        with self._lock:
+            if self._pending is None and _dumps(data) == self._written:
+                return
+            self._pending = dict(data)
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.start()
+
+    def flush(self):
+        """Schrijft een openstaande save nu; True als er geschreven is."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            data, self._pending = self._pending, None
+            if data is None:
+                return False
+            text = _dumps(data)
+            if text == self._written:
+                return False
+            try:
+                self._write(self._seq + 1, data, text)
+            except OSError as e:
+                if self.on_error is not None:
+                    self.on_error(e)
+                return False
+            self._seq += 1
+            self._written = text
+            self.writes += 1
+            return True
+
+    close = flush
+
+    def _write(self, seq, data, text):
+        entry = json.dumps({"seq": seq, "crc": zlib.crc32(text.encode("utf-8")), "data": data},
+                           ensure_ascii=False) + "\n"
+        with open(self.journal, "ab") as f:
+            f.write(entry.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lines += 1
+        main = dict(data)
+        main["_seq"] = seq
+        atomic_write(self.path, json.dumps(main, ensure_ascii=False, indent=2).encode("utf-8"))
+        if self._journal_lines > JOURNAL_MAX_LINES:
+            atomic_write(self.journal, entry.encode("utf-8"))
+            self._journal_lines = 1